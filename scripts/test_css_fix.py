@@ -22,11 +22,24 @@ def test_css_fix():
     # Użyj problematycznego URL który wcześniej zawodził
     test_url = "https://tom.sapletta.pl"
     
+    # Limit pobierania - strzeżemy się przed ogromnymi stronami
+    max_bytes = 5_000_000
+
     print(f"📥 Pobieranie HTML z {test_url}...")
     try:
-        response = requests.get(test_url, timeout=10)
+        response = requests.get(test_url, stream=True, timeout=10)
         response.raise_for_status()
-        html_content = response.text
+        # Strumieniowe pobieranie z limitem rozmiaru zamiast response.text,
+        # żeby nie dekodować całej strony naraz (i ominąć wolny chardet)
+        chunks = []
+        total = 0
+        for chunk in response.iter_content(65536, decode_unicode=False):
+            chunks.append(chunk)
+            total += len(chunk)
+            if total > max_bytes:
+                print(f"⚠️  Przekroczono limit {max_bytes} bajtów - obcinam")
+                break
+        html_content = b''.join(chunks).decode(response.encoding or 'utf-8', errors='replace')
         print(f"✅ Pobrano {len(html_content)} znaków HTML")
     except Exception as e:
         print(f"❌ Błąd pobierania HTML: {e}")
@@ -7,7 +7,6 @@ import sys
 import os
 import yaml
 import traceback
-from copy import deepcopy
 
 # Dodaj ścieżkę do WhyML modułów
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
@@ -93,23 +92,30 @@ def main():
         success = test_converter_with_manifest(converter_class, original_manifest, "tom.sapletta.pl", is_fixed=False)
         original_results[converter_class.__name__] = success
     
-    # Stwórz poprawioną wersję manifestu
-    fixed_manifest = deepcopy(original_manifest)
-    was_list, url_count = fix_external_css_format(fixed_manifest)
-    
+    # Zastosuj poprawkę in-place - tylko styles.external się różni, więc
+    # zamiast deepcopy całego manifestu zapamiętujemy oryginalną wartość
+    # i przywracamy ją po testach (zero kopii, O(1) dodatkowej pamięci)
+    original_external = original_manifest.get('styles', {}).get('external')
+    was_list, url_count = fix_external_css_format(original_manifest)
+
     if was_list:
         print(f"\n🔧 APPLIED FIX: Converted {url_count} external CSS URLs from list to semicolon-separated string")
     else:
         print(f"\n⚠️  WARNING: external CSS was not a list - already in correct format?")
-    
+
     # Testuj convertery z poprawionym manifestem
     print(f"\n" + "="*60)
     print("🔬 TESTING WITH FIXED MANIFEST (should work)")
-    
+
     fixed_results = {}
-    for converter_class in converters:
-        success = test_converter_with_manifest(converter_class, fixed_manifest, "tom.sapletta.pl", is_fixed=True)
-        fixed_results[converter_class.__name__] = success
+    try:
+        for converter_class in converters:
+            success = test_converter_with_manifest(converter_class, original_manifest, "tom.sapletta.pl", is_fixed=True)
+            fixed_results[converter_class.__name__] = success
+    finally:
+        # Przywróć oryginalny format external CSS
+        if original_external is not None:
+            original_manifest['styles']['external'] = original_external
     
     # Podsumowanie wyników
     print(f"\n" + "="*60)
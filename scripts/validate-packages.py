@@ -6,14 +6,98 @@ This script validates all modular packages for PyPI publishing readiness.
 It checks package structure, dependencies, metadata, and build configuration.
 """
 
+import io
 import os
 import sys
-import json
-import subprocess
-import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import toml
+
+from packaging.requirements import InvalidRequirement, Requirement
+
+try:
+    import tomllib  # Python 3.11+
+except ImportError:
+    import tomli as tomllib
+
+# Prefer the Rust-backed rtoml parser when available; set
+# WHYML_TOML_BACKEND=tomllib to force the stdlib parser (e.g. on
+# platforms without rtoml wheels).
+if os.environ.get('WHYML_TOML_BACKEND', 'rtoml') == 'rtoml':
+    try:
+        import rtoml
+    except ImportError:
+        rtoml = None
+else:
+    rtoml = None
+
+
+# orjson serializes the nested results dict several times faster than
+# the stdlib encoder; fall back to json when it is not installed
+try:
+    import orjson
+
+    def _json_dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+except ImportError:
+    import json
+
+    def _json_dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+
+# Required-entry checks run as a single C-level set difference
+_REQUIRED_FILES = frozenset({'pyproject.toml', 'README.md', 'LICENSE'})
+_REQUIRED_PROJECT_FIELDS = frozenset({'name', 'version', 'description', 'authors'})
+
+# Optional project fields that must be lists when present, precomputed
+# as (field, error) pairs so the validator runs straight-line checks
+_PROJECT_LIST_FIELDS = tuple(
+    (field, f"project.{field} must be a list")
+    for field in ('dependencies', 'classifiers')
+)
+
+
+def _happy_path_ok(build_system, project, setuptools_config) -> bool:
+    """Fast predicate for the all-valid case.
+
+    A manifest that passes this check produces no errors, so
+    validate_pyproject_toml can return immediately without running the
+    error-building branches.
+    """
+    if build_system is None or project is None:
+        return False
+    if 'requires' not in build_system or 'build-backend' not in build_system:
+        return False
+    if not _REQUIRED_PROJECT_FIELDS <= project.keys():
+        return False
+    for field, _ in _PROJECT_LIST_FIELDS:
+        value = project.get(field)
+        if value is not None and not isinstance(value, list):
+            return False
+    if setuptools_config is not None:
+        packages = setuptools_config.get('packages')
+        if packages is not None and 'find' not in packages:
+            return False
+    return True
+
+
+def _has_tests(tests_dir: Path) -> bool:
+    """Return True as soon as one test_*.py entry is found."""
+    with os.scandir(tests_dir) as it:
+        return any(
+            entry.name.startswith('test_') and entry.name.endswith('.py')
+            for entry in it
+        )
+
+
+def _load_toml(path: Path) -> Dict:
+    """Parse a TOML file with the fastest available backend."""
+    if rtoml is not None:
+        return rtoml.load(path)
+    with path.open('rb') as f:
+        return tomllib.load(f)
 
 
 class PackageValidator:
@@ -29,70 +113,104 @@ class PackageValidator:
             'whyml'
         ]
         self.validation_results = {}
-        
+        # One listing of the monorepo root; membership checks replace
+        # a stat per package/dependency lookup
+        self._root_dirs = {
+            entry.name for entry in os.scandir(project_root) if entry.is_dir()
+        }
+        # Parsed pyproject.toml cache keyed by path, invalidated on mtime change.
+        # Shared across validation threads, hence the lock.
+        self._toml_cache: Dict[Path, Tuple[int, Dict]] = {}
+        self._toml_lock = threading.Lock()
+
+    def _load_pyproject(self, path: Path) -> Dict:
+        """Load a pyproject.toml, reusing the parsed dict until the file changes."""
+        mtime = path.stat().st_mtime_ns
+        with self._toml_lock:
+            cached = self._toml_cache.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1]
+        config = _load_toml(path)
+        with self._toml_lock:
+            self._toml_cache[path] = (mtime, config)
+        return config
+
+    def _validate_one(self, package: str) -> Dict:
+        """Validate a single package by name."""
+        package_path = self.project_root / package
+        if package not in self._root_dirs:
+            return {
+                'valid': False,
+                'errors': [f"Package directory not found: {package_path}"],
+                'warnings': []
+            }
+        return self.validate_package(package_path)
+
     def validate_all_packages(self) -> Dict[str, Dict]:
         """Validate all packages and return results."""
         print("🔍 Validating WhyML Modular Packages for PyPI Publishing...")
         print("=" * 60)
-        
-        for package in self.packages:
-            print(f"\n📦 Validating {package}...")
-            package_path = self.project_root / package
-            
-            if not package_path.exists():
-                print(f"❌ Package directory not found: {package_path}")
-                self.validation_results[package] = {
-                    'valid': False,
-                    'errors': [f"Package directory not found: {package_path}"]
-                }
-                continue
-                
-            result = self.validate_package(package_path)
-            self.validation_results[package] = result
-            
-            if result['valid']:
-                print(f"✅ {package} is ready for publishing!")
-            else:
-                print(f"❌ {package} has validation issues:")
-                for error in result['errors']:
-                    print(f"   • {error}")
-                    
+
+        # Validation is I/O-bound (stats, file reads, TOML parses), so
+        # run the packages concurrently and report in the original order
+        with ThreadPoolExecutor(max_workers=len(self.packages)) as executor:
+            futures = {
+                package: executor.submit(self._validate_one, package)
+                for package in self.packages
+            }
+
+            for package in self.packages:
+                result = futures[package].result()
+                self.validation_results[package] = result
+
+                # One write per package instead of a print (and possible
+                # flush) per line
+                lines = [f"\n📦 Validating {package}..."]
+                if result['valid']:
+                    lines.append(f"✅ {package} is ready for publishing!")
+                else:
+                    lines.append(f"❌ {package} has validation issues:")
+                    lines.extend(f"   • {error}" for error in result['errors'])
+                sys.stdout.write("\n".join(lines) + "\n")
+
         return self.validation_results
         
     def validate_package(self, package_path: Path) -> Dict:
         """Validate a single package."""
         errors = []
         warnings = []
-        
+
+        # One directory read instead of a stat per checked entry
+        present = {entry.name for entry in os.scandir(package_path)}
+
         # Check required files
-        required_files = ['pyproject.toml', 'README.md', 'LICENSE']
-        for file in required_files:
-            if not (package_path / file).exists():
-                errors.append(f"Missing required file: {file}")
-                
+        for file in sorted(_REQUIRED_FILES - present):
+            errors.append(f"Missing required file: {file}")
+
         # Validate pyproject.toml
         pyproject_path = package_path / 'pyproject.toml'
-        if pyproject_path.exists():
+        if 'pyproject.toml' in present:
             pyproject_errors = self.validate_pyproject_toml(pyproject_path)
             errors.extend(pyproject_errors)
         else:
             errors.append("Missing pyproject.toml")
-            
+
         # Check package structure
         package_name = package_path.name.replace('-', '_')
         package_dir = package_path / package_name
-        
-        if not package_dir.exists():
+
+        if package_name not in present:
             errors.append(f"Package directory not found: {package_name}/")
         else:
-            if not (package_dir / '__init__.py').exists():
+            package_entries = {entry.name for entry in os.scandir(package_dir)}
+            if '__init__.py' not in package_entries:
                 errors.append(f"Missing __init__.py in {package_name}/")
-                
+
         # Check tests directory
         tests_dir = package_path / 'tests'
-        if not tests_dir.exists():
+        if 'tests' not in present:
             warnings.append("No tests directory found")
-        elif not any(tests_dir.glob('test_*.py')):
+        elif not _has_tests(tests_dir):
             warnings.append("No test files found in tests directory")
             
         # Validate build configuration
@@ -113,50 +231,48 @@ class PackageValidator:
         errors = []
         
         try:
-            config = toml.load(pyproject_path)
+            config = self._load_pyproject(pyproject_path)
         except Exception as e:
             return [f"Invalid pyproject.toml: {str(e)}"]
             
+        # Hoist each top-level section into a local once instead of
+        # re-walking the config dict per check
+        build_system = config.get('build-system')
+        project = config.get('project')
+        setuptools_config = config.get('tool', {}).get('setuptools')
+
+        # Specialized fast path: well-formed manifests (the common case)
+        # skip the per-field error construction below entirely
+        if _happy_path_ok(build_system, project, setuptools_config):
+            return errors
+
         # Check build system
-        if 'build-system' not in config:
+        if build_system is None:
             errors.append("Missing [build-system] section")
         else:
-            build_system = config['build-system']
             if 'requires' not in build_system:
                 errors.append("Missing build-system.requires")
             if 'build-backend' not in build_system:
                 errors.append("Missing build-system.build-backend")
-                
+
         # Check project metadata
-        if 'project' not in config:
+        if project is None:
             errors.append("Missing [project] section")
         else:
-            project = config['project']
-            required_fields = ['name', 'version', 'description', 'authors']
-            
-            for field in required_fields:
-                if field not in project:
-                    errors.append(f"Missing project.{field}")
-                    
-            # Validate dependencies
-            if 'dependencies' in project:
-                deps = project['dependencies']
-                if not isinstance(deps, list):
-                    errors.append("project.dependencies must be a list")
-                    
-            # Check classifiers
-            if 'classifiers' in project:
-                classifiers = project['classifiers']
-                if not isinstance(classifiers, list):
-                    errors.append("project.classifiers must be a list")
-                    
+            for field in sorted(_REQUIRED_PROJECT_FIELDS - project.keys()):
+                errors.append(f"Missing project.{field}")
+
+            # Fields that must be lists when present
+            for field, message in _PROJECT_LIST_FIELDS:
+                value = project.get(field)
+                if value is not None and not isinstance(value, list):
+                    errors.append(message)
+
         # Check setuptools configuration
-        if 'tool' in config and 'setuptools' in config['tool']:
-            setuptools_config = config['tool']['setuptools']
-            if 'packages' in setuptools_config:
-                packages = setuptools_config['packages']
-                if 'find' not in packages:
-                    errors.append("Missing tool.setuptools.packages.find configuration")
+        if setuptools_config is not None:
+            packages = setuptools_config.get('packages')
+            if packages is not None and 'find' not in packages:
+                errors.append("Missing tool.setuptools.packages.find configuration")
                     
         return errors
         
@@ -172,7 +288,7 @@ class PackageValidator:
             # Check if build requirements can be resolved
             pyproject_path = package_path / 'pyproject.toml'
             if pyproject_path.exists():
-                config = toml.load(pyproject_path)
+                config = self._load_pyproject(pyproject_path)
                 if 'build-system' in config:
                     build_requires = config['build-system'].get('requires', [])
                     for req in build_requires:
@@ -199,17 +315,21 @@ class PackageValidator:
                 continue
                 
             try:
-                config = toml.load(pyproject_path)
+                config = self._load_pyproject(pyproject_path)
                 project = config.get('project', {})
                 dependencies = project.get('dependencies', [])
                 
                 issues = []
                 for dep in dependencies:
                     if dep.startswith('whyml-'):
-                        # Check if the dependency package exists
-                        dep_name = dep.split('>=')[0].split('==')[0].split('<')[0]
-                        dep_path = self.project_root / dep_name
-                        if not dep_path.exists():
+                        # Single grammar parse instead of chained splits;
+                        # also handles ~=, != and environment markers
+                        try:
+                            dep_name = Requirement(dep).name
+                        except InvalidRequirement:
+                            issues.append(f"Invalid dependency spec: {dep}")
+                            continue
+                        if dep_name not in self._root_dirs:
                             issues.append(f"Dependency {dep_name} not found")
                             
                 if issues:
@@ -222,74 +342,82 @@ class PackageValidator:
         
     def generate_report(self) -> str:
         """Generate a comprehensive validation report."""
-        report = []
-        report.append("# WhyML Modular Packages Validation Report")
-        report.append("=" * 50)
-        report.append("")
-        
+        # Single growing buffer instead of a list of per-line strings
+        buf = io.StringIO()
+
+        def w(line: str = "") -> None:
+            buf.write(line)
+            buf.write("\n")
+
+        w("# WhyML Modular Packages Validation Report")
+        w("=" * 50)
+        w()
+
         # Summary
         total_packages = len(self.packages)
         valid_packages = sum(1 for result in self.validation_results.values() if result['valid'])
-        
-        report.append(f"## Summary")
-        report.append(f"- **Total Packages**: {total_packages}")
-        report.append(f"- **Valid Packages**: {valid_packages}")
-        report.append(f"- **Invalid Packages**: {total_packages - valid_packages}")
-        report.append("")
-        
+
+        w(f"## Summary")
+        w(f"- **Total Packages**: {total_packages}")
+        w(f"- **Valid Packages**: {valid_packages}")
+        w(f"- **Invalid Packages**: {total_packages - valid_packages}")
+        w()
+
         # Package details
-        report.append("## Package Validation Details")
-        report.append("")
-        
+        w("## Package Validation Details")
+        w()
+
         for package, result in self.validation_results.items():
             status = "✅ VALID" if result['valid'] else "❌ INVALID"
-            report.append(f"### {package} - {status}")
-            
+            w(f"### {package} - {status}")
+
             if result['errors']:
-                report.append("**Errors:**")
+                w("**Errors:**")
                 for error in result['errors']:
-                    report.append(f"- {error}")
-                    
+                    w(f"- {error}")
+
             if result.get('warnings'):
-                report.append("**Warnings:**")
+                w("**Warnings:**")
                 for warning in result['warnings']:
-                    report.append(f"- {warning}")
-                    
-            report.append("")
-            
+                    w(f"- {warning}")
+
+            w()
+
         # Dependency check
         dependency_issues = self.check_dependencies()
         if dependency_issues:
-            report.append("## Dependency Issues")
-            report.append("")
+            w("## Dependency Issues")
+            w()
             for package, issues in dependency_issues.items():
-                report.append(f"### {package}")
+                w(f"### {package}")
                 for issue in issues:
-                    report.append(f"- {issue}")
-                report.append("")
-                
+                    w(f"- {issue}")
+                w()
+
         # Recommendations
-        report.append("## Publishing Readiness")
-        report.append("")
-        
+        w("## Publishing Readiness")
+        w()
+
         if valid_packages == total_packages:
-            report.append("🎉 **All packages are ready for PyPI publishing!**")
-            report.append("")
-            report.append("### Next Steps:")
-            report.append("1. Run the GitHub Actions workflow to build and test all packages")
-            report.append("2. Publish to Test PyPI for final validation")
-            report.append("3. Publish to production PyPI")
-            report.append("4. Create GitHub release with all package versions")
+            w("🎉 **All packages are ready for PyPI publishing!**")
+            w()
+            w("### Next Steps:")
+            w("1. Run the GitHub Actions workflow to build and test all packages")
+            w("2. Publish to Test PyPI for final validation")
+            w("3. Publish to production PyPI")
+            w("4. Create GitHub release with all package versions")
         else:
-            report.append("⚠️ **Some packages need fixes before publishing:**")
-            report.append("")
+            w("⚠️ **Some packages need fixes before publishing:**")
+            w()
             invalid_packages = [pkg for pkg, result in self.validation_results.items() if not result['valid']]
             for pkg in invalid_packages:
-                report.append(f"- Fix issues in **{pkg}**")
-            report.append("")
-            report.append("Run this validation script again after fixing the issues.")
-            
-        return "\n".join(report)
+                w(f"- Fix issues in **{pkg}**")
+            w()
+            w("Run this validation script again after fixing the issues.")
+
+        # Drop the final newline so the result matches the old "\n".join form
+        return buf.getvalue()[:-1]
+
 
 
 def main():
@@ -313,7 +441,14 @@ def main():
     with open(report_file, 'w') as f:
         f.write(report)
     print(f"\n📄 Full report saved to: {report_file}")
-    
+
+    # Optional machine-readable output for CI
+    if '--json' in sys.argv[1:]:
+        json_file = project_root / 'package-validation-report.json'
+        with open(json_file, 'w') as f:
+            f.write(_json_dumps(results))
+        print(f"📄 JSON results saved to: {json_file}")
+
     # Exit with appropriate code
     all_valid = all(result['valid'] for result in results.values())
     sys.exit(0 if all_valid else 1)
@@ -16,10 +16,14 @@ import sys
 from pathlib import Path
 from typing import Optional, Tuple
 
+# Compiled once at module load - these run per package when bumping a monorepo
+_VERSION_RE = re.compile(r'^(\d+)\.(\d+)\.(\d+)(?:-.*)?$')
+_PYPROJECT_VERSION_RE = re.compile(r'^version\s*=\s*["\']([^"\']+)["\']', re.MULTILINE)
+
 
 def parse_version(version_str: str) -> Tuple[int, int, int]:
     """Parse version string into tuple of integers."""
-    match = re.match(r'^(\d+)\.(\d+)\.(\d+)(?:-.*)?$', version_str.strip())
+    match = _VERSION_RE.match(version_str.strip())
     if not match:
         raise ValueError(f"Invalid version format: {version_str}")
     return tuple(map(int, match.groups()))
@@ -46,30 +50,41 @@ def increment_version(current_version: str, bump_type: str) -> str:
 
 def update_pyproject_version(file_path: Path, new_version: str) -> None:
     """Update version in pyproject.toml file."""
-    content = file_path.read_text()
-    updated_content = re.sub(
-        r'^version\s*=\s*["\']([^"\']+)["\']',
-        f'version = "{new_version}"',
-        content,
-        flags=re.MULTILINE
-    )
-
-    if content == updated_content:
+    # Stream line-by-line; the version line is near the top, so only
+    # matching lines are rewritten and the rest pass through untouched
+    lines = []
+    updated = False
+    # newline='' disables universal-newline translation so the file
+    # round-trips byte-identically apart from the version line
+    with file_path.open('r', encoding='utf-8', newline='') as f:
+        for line in f:
+            if not updated:
+                # subn reports the replacement count directly, so no
+                # old-vs-new string comparison is needed
+                line, n = _PYPROJECT_VERSION_RE.subn(
+                    f'version = "{new_version}"', line, count=1
+                )
+                updated = n > 0
+            lines.append(line)
+
+    if not updated:
         print(f"❌ Could not find version line in {file_path}")
         sys.exit(1)
 
-    file_path.write_text(updated_content)
+    file_path.write_text("".join(lines), encoding='utf-8', newline='')
     print(f"✅ Updated version to {new_version} in {file_path}")
 
 
 def get_current_version(file_path: Path) -> str:
     """Get current version from pyproject.toml."""
-    content = file_path.read_text()
-    match = re.search(r'^version\s*=\s*["\']([^"\']+)["\']', content, re.MULTILINE)
-    if not match:
-        print(f"❌ Could not find version in {file_path}")
-        sys.exit(1)
-    return match.group(1)
+    # Stop at the first matching line instead of reading the whole file
+    with file_path.open('r', encoding='utf-8') as f:
+        for line in f:
+            match = _PYPROJECT_VERSION_RE.match(line)
+            if match:
+                return match.group(1)
+    print(f"❌ Could not find version in {file_path}")
+    sys.exit(1)
 
 
 def main():
@@ -733,7 +733,7 @@ class TestWebpageAnalyzer:
         </html>
         """
         
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         analysis = await analyzer.analyze_page(soup, 'https://blog.example.com')
         
         assert analysis['page_type'] == 'blog'
@@ -758,7 +758,7 @@ class TestWebpageAnalyzer:
         </html>
         """
         
-        soup = BeautifulSoup(ecommerce_html, 'html.parser')
+        soup = BeautifulSoup(ecommerce_html, 'lxml')
         analysis = await analyzer.analyze_page(soup, 'https://shop.example.com')
         
         assert analysis['page_type'] == 'e-commerce'
@@ -784,7 +784,7 @@ class TestWebpageAnalyzer:
         </html>
         """
         
-        soup = BeautifulSoup(html_with_seo, 'html.parser')
+        soup = BeautifulSoup(html_with_seo, 'lxml')
         seo = analyzer._analyze_seo(soup)
         
         assert seo['has_meta_description'] == True
@@ -808,7 +808,7 @@ class TestWebpageAnalyzer:
         </html>
         """
         
-        soup = BeautifulSoup(accessible_html, 'html.parser')
+        soup = BeautifulSoup(accessible_html, 'lxml')
         accessibility = analyzer._analyze_accessibility(soup)
         
         assert accessibility['has_lang_attribute'] == True
@@ -831,7 +831,7 @@ class TestWebpageAnalyzer:
         </html>
         """
         
-        soup = BeautifulSoup(content_html, 'html.parser')
+        soup = BeautifulSoup(content_html, 'lxml')
         stats = analyzer._calculate_content_stats(soup)
         
         assert stats['paragraph_count'] == 2
@@ -860,7 +860,7 @@ class TestWebpageAnalyzer:
         </html>
         """
         
-        soup = BeautifulSoup(complex_html, 'html.parser')
+        soup = BeautifulSoup(complex_html, 'lxml')
         complexity = analyzer._analyze_structure_complexity(soup)
         
         assert complexity['max_nesting_depth'] >= 4
@@ -928,7 +928,7 @@ class TestWebpageAnalyzer:
     
     def test_extract_metadata(self, scraper, sample_html):
         """Test metadata extraction from HTML."""
-        soup = BeautifulSoup(sample_html, 'html.parser')
+        soup = BeautifulSoup(sample_html, 'lxml')
         metadata = scraper._extract_metadata(soup, 'https://example.com')
         
         assert metadata['title'] == 'Sample Webpage'
@@ -940,7 +940,7 @@ class TestWebpageAnalyzer:
     
     def test_extract_styles(self, scraper, sample_html):
         """Test CSS styles extraction."""
-        soup = BeautifulSoup(sample_html, 'html.parser')
+        soup = BeautifulSoup(sample_html, 'lxml')
         styles = scraper._extract_styles(soup, 'https://example.com')
         
         assert 'container' in styles
@@ -951,7 +951,7 @@ class TestWebpageAnalyzer:
     
     def test_extract_imports(self, scraper, sample_html):
         """Test external resource imports extraction."""
-        soup = BeautifulSoup(sample_html, 'html.parser')
+        soup = BeautifulSoup(sample_html, 'lxml')
         imports = scraper._extract_imports(soup, 'https://example.com')
         
         assert 'styles' in imports
@@ -961,7 +961,7 @@ class TestWebpageAnalyzer:
     
     def test_extract_structure(self, scraper, sample_html):
         """Test HTML structure extraction."""
-        soup = BeautifulSoup(sample_html, 'html.parser')
+        soup = BeautifulSoup(sample_html, 'lxml')
         structure = scraper._extract_structure(soup)
         
         assert 'div' in structure
@@ -970,7 +970,7 @@ class TestWebpageAnalyzer:
     
     def test_find_main_content(self, scraper, sample_html):
         """Test main content area detection."""
-        soup = BeautifulSoup(sample_html, 'html.parser')
+        soup = BeautifulSoup(sample_html, 'lxml')
         main_content = scraper._find_main_content(soup)
         
         assert main_content is not None
@@ -979,7 +979,7 @@ class TestWebpageAnalyzer:
     
     def test_convert_element_to_manifest(self, scraper, sample_html):
         """Test HTML element to manifest conversion."""
-        soup = BeautifulSoup(sample_html, 'html.parser')
+        soup = BeautifulSoup(sample_html, 'lxml')
         header = soup.find('header')
         
         manifest = scraper._convert_element_to_manifest(header)
@@ -1117,7 +1117,7 @@ class TestWebpageAnalyzer:
     
     def test_analyze_webpage_blog(self, analyzer, blog_html):
         """Test webpage analysis for blog content."""
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         analysis = analyzer.analyze_webpage(soup, 'https://blog.example.com/post')
         
         assert analysis['page_type'] == 'blog'
@@ -1128,7 +1128,7 @@ class TestWebpageAnalyzer:
     
     def test_analyze_webpage_ecommerce(self, analyzer, ecommerce_html):
         """Test webpage analysis for e-commerce content."""
-        soup = BeautifulSoup(ecommerce_html, 'html.parser')
+        soup = BeautifulSoup(ecommerce_html, 'lxml')
         analysis = analyzer.analyze_webpage(soup, 'https://shop.example.com/product')
         
         assert analysis['page_type'] == 'e-commerce'
@@ -1136,17 +1136,17 @@ class TestWebpageAnalyzer:
     
     def test_detect_page_type(self, analyzer, blog_html, ecommerce_html):
         """Test page type detection."""
-        blog_soup = BeautifulSoup(blog_html, 'html.parser')
+        blog_soup = BeautifulSoup(blog_html, 'lxml')
         blog_type = analyzer._detect_page_type(blog_soup)
         assert blog_type == 'blog'
         
-        ecommerce_soup = BeautifulSoup(ecommerce_html, 'html.parser')
+        ecommerce_soup = BeautifulSoup(ecommerce_html, 'lxml')
         ecommerce_type = analyzer._detect_page_type(ecommerce_soup)
         assert ecommerce_type == 'e-commerce'
     
     def test_analyze_layout_structure(self, analyzer, blog_html):
         """Test layout structure analysis."""
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         layout = analyzer._analyze_layout_structure(soup)
         
         assert layout['has_header'] == True
@@ -1156,14 +1156,14 @@ class TestWebpageAnalyzer:
     
     def test_detect_layout_type(self, analyzer, ecommerce_html):
         """Test layout type detection."""
-        soup = BeautifulSoup(ecommerce_html, 'html.parser')
+        soup = BeautifulSoup(ecommerce_html, 'lxml')
         layout_type = analyzer._detect_layout_type(soup)
         
         assert layout_type == 'bootstrap'
     
     def test_analyze_semantic_structure(self, analyzer, blog_html):
         """Test semantic HTML structure analysis."""
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         semantic = analyzer._analyze_semantic_structure(soup)
         
         assert 'heading_structure' in semantic
@@ -1182,7 +1182,7 @@ class TestWebpageAnalyzer:
     
     def test_analyze_accessibility(self, analyzer, blog_html):
         """Test accessibility analysis."""
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         accessibility = analyzer._analyze_accessibility(soup)
         
         assert 'images_with_alt' in accessibility
@@ -1192,7 +1192,7 @@ class TestWebpageAnalyzer:
     
     def test_find_navigation_elements(self, analyzer, blog_html):
         """Test navigation elements detection."""
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         nav_info = analyzer._find_navigation_elements(soup)
         
         assert nav_info['main_nav'] is not None
@@ -1201,7 +1201,7 @@ class TestWebpageAnalyzer:
     
     def test_analyze_media_elements(self, analyzer, blog_html):
         """Test media elements analysis."""
-        soup = BeautifulSoup(blog_html, 'html.parser')
+        soup = BeautifulSoup(blog_html, 'lxml')
         media = analyzer._analyze_media_elements(soup)
         
         assert media['images']['count'] > 0
@@ -1215,7 +1215,7 @@ class TestWebpageAnalyzer:
             <div class="d-none d-md-block">Content</div>
         </div>
         """
-        soup = BeautifulSoup(html_with_responsive, 'html.parser')
+        soup = BeautifulSoup(html_with_responsive, 'lxml')
         breakpoints = analyzer._detect_responsive_breakpoints(soup)
         
         assert 'sm' in breakpoints
@@ -1231,7 +1231,7 @@ class TestWebpageAnalyzer:
         <div class="button">Button 1</div>
         <div class="button">Button 2</div>
         """
-        soup = BeautifulSoup(html_with_patterns, 'html.parser')
+        soup = BeautifulSoup(html_with_patterns, 'lxml')
         patterns = analyzer._detect_component_patterns(soup)
         
         assert len(patterns) > 0
@@ -1252,7 +1252,7 @@ class TestWebpageAnalyzer:
         </body>
         </html>
         """
-        soup = BeautifulSoup(html_with_issues, 'html.parser')
+        soup = BeautifulSoup(html_with_issues, 'lxml')
         suggestions = analyzer._generate_optimization_suggestions(soup)
         
         assert len(suggestions) > 0
@@ -1314,7 +1314,7 @@ class TestScrapersIntegration:
             
             # Analyze the webpage
             analyzer = WebpageAnalyzer()
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
             analysis = analyzer.analyze_webpage(soup, 'https://test.example.com')
             
             # Verify integration
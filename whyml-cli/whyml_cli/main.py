@@ -14,6 +14,15 @@ from typing import List, Optional
 
 from .cli import WhyMLCLI
 
+# uvloop's libuv-backed event loop substantially speeds up the aiohttp
+# concurrency in scrape commands; it stays an optional dependency and
+# the default loop is used when it is not installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for WhyML CLI.
@@ -9,6 +9,7 @@ Licensed under the Apache License, Version 2.0
 """
 
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
 import re
@@ -19,6 +20,53 @@ from whyml_core.utils import StringUtils, PathUtils
 from whyml_core.exceptions import ValidationError, ProcessingError
 
 
+@lru_cache(maxsize=1024)
+def _sanitize_class_name_cached(name: str) -> str:
+    """Sanitize a string for use as a class/component name.
+
+    Pure function of the input, memoized: converters run it for every
+    styled element and manifests repeat the same handful of names.
+    """
+    # Split name into alphanumeric tokens
+    tokens = re.findall(r"[A-Za-z0-9]+", name)
+    if not tokens:
+        return "Component"
+    # Preserve existing camel/pascal case in tokens; capitalize first letter only
+    parts = []
+    for tok in tokens:
+        if not tok:
+            continue
+        parts.append(tok[0].upper() + tok[1:])
+    sanitized = ''.join(parts)
+    # Ensure it starts with a letter
+    if sanitized and not sanitized[0].isalpha():
+        sanitized = f"Component{sanitized}"
+    return sanitized or "Component"
+
+
+@lru_cache(maxsize=1024)
+def _sanitize_attribute_name_cached(name: str) -> str:
+    """Sanitize a string for use as an attribute name (memoized)."""
+    # Convert to camelCase and remove invalid characters
+    words = name.split()
+    if not words:
+        return "attr"
+
+    # First word lowercase, subsequent words capitalized
+    result = words[0].lower()
+    for word in words[1:]:
+        result += word.capitalize()
+
+    # Remove non-alphanumeric characters
+    result = ''.join(c for c in result if c.isalnum())
+
+    # Ensure it starts with a letter
+    if result and not result[0].isalpha():
+        result = f"attr{result}"
+
+    return result or "attr"
+
+
 class BaseConverter(ABC):
     """Abstract base class for all WhyML converters."""
     
@@ -59,7 +107,35 @@ class BaseConverter(ABC):
         self.output_format = self._get_output_format()
         self.template_extension = self._get_template_extension()
         self.supports_components = self._supports_components()
-    
+
+        # Persistent event loop for the synchronous convert() wrappers;
+        # created lazily so async callers never pay for it
+        self._sync_loop = None
+
+    def _run_sync(self, coro):
+        """Run a coroutine from synchronous code on a reused event loop.
+
+        Creating and tearing down a loop per call (asyncio.run) dominates
+        the cost of small conversions; a single lazily-created loop is
+        kept for the lifetime of the converter instead.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Result of the coroutine
+        """
+        import asyncio
+
+        if self._sync_loop is None or self._sync_loop.is_closed():
+            try:
+                self._sync_loop = asyncio.get_event_loop()
+            except RuntimeError:
+                self._sync_loop = asyncio.new_event_loop()
+                asyncio.set_event_loop(self._sync_loop)
+        return self._sync_loop.run_until_complete(coro)
+
+
     @abstractmethod
     def _get_output_format(self) -> str:
         """Get output format identifier.
@@ -373,21 +449,7 @@ class BaseConverter(ABC):
         Returns:
             Sanitized class name
         """
-        # Split name into alphanumeric tokens
-        tokens = re.findall(r"[A-Za-z0-9]+", name)
-        if not tokens:
-            return "Component"
-        # Preserve existing camel/pascal case in tokens; capitalize first letter only
-        parts = []
-        for tok in tokens:
-            if not tok:
-                continue
-            parts.append(tok[0].upper() + tok[1:])
-        sanitized = ''.join(parts)
-        # Ensure it starts with a letter
-        if sanitized and not sanitized[0].isalpha():
-            sanitized = f"Component{sanitized}"
-        return sanitized or "Component"
+        return _sanitize_class_name_cached(name)
     
     def _sanitize_attribute_name(self, name: str) -> str:
         """Sanitize string for use as attribute name.
@@ -398,24 +460,7 @@ class BaseConverter(ABC):
         Returns:
             Sanitized attribute name
         """
-        # Convert to camelCase and remove invalid characters
-        words = name.split()
-        if not words:
-            return "attr"
-        
-        # First word lowercase, subsequent words capitalized
-        result = words[0].lower()
-        for word in words[1:]:
-            result += word.capitalize()
-        
-        # Remove non-alphanumeric characters
-        result = ''.join(c for c in result if c.isalnum())
-        
-        # Ensure it starts with a letter
-        if result and not result[0].isalpha():
-            result = f"attr{result}"
-        
-        return result or "attr"
+        return _sanitize_attribute_name_cached(name)
     
     def _process_external_content(self, 
                                  content: str,
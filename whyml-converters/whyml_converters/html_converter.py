@@ -10,7 +10,9 @@ Licensed under the Apache License, Version 2.0
 
 from typing import Dict, Any, List, Optional, Union
 from pathlib import Path
+import io
 import re
+import sys
 
 from whyml_core.utils import StringUtils
 from whyml_core.exceptions import ProcessingError
@@ -19,13 +21,43 @@ from .base_converter import BaseConverter
 
 class HTMLConverter(BaseConverter):
     """Advanced HTML converter with semantic structure and modern HTML5 output."""
-    
+
+    # Compiled once at class load; minification and CSS variable
+    # substitution run these on every conversion, and going straight to
+    # the compiled objects skips the per-call pattern cache lookup
+    _HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+    # Explicit ASCII whitespace classes; \s drags in the Unicode
+    # category tables and is measurably slower on large documents
+    _WS_RUN_RE = re.compile(r'[ \t\n\r\f\v]+')
+    _TAG_WS_RE = re.compile(r'>[ \t\n\r\f\v]+<')
+    _CSS_VAR_RE = re.compile(r'var\(--([^)]+)\)')
+    _CSS_DECL_RE = re.compile(r'([^:;]+):([^;]*)')
+
+    # Tag/key tables used on every emitted element; frozensets built
+    # once here instead of set literals rebuilt per call in the walker
+    _SELF_CLOSING_TAGS = frozenset({'img', 'br', 'hr', 'input', 'meta', 'link'})
+    _ELEMENT_DEF_KEYS = frozenset({'attributes', 'children', 'content', 'text', 'class', 'id', 'style'})
+    _DIRECT_ATTR_KEYS = ('class', 'id', 'style', 'href', 'src', 'alt', 'title',
+                         'name', 'type', 'value', 'placeholder', 'for', 'role')
+    # Interned 'name="' prefixes for the closed set of common attribute
+    # names; saves an f-string build per attribute in the opening-tag path
+    _ATTR_PREFIX = {k: sys.intern(k + '="') for k in (
+        'class', 'id', 'style', 'href', 'src', 'alt', 'title', 'name',
+        'type', 'value', 'placeholder', 'for', 'role', 'lang', 'content',
+        'rel', 'crossorigin', 'charset',
+    )}
+
     def __init__(self, include_meta_tags=True, **kwargs):
         """Initialize HTML converter."""
         super().__init__(**kwargs)
         self.indent_size = 2
         self.current_indent = 0
         self.include_meta_tags = include_meta_tags
+        # Filled by the emission pass itself; no separate counting walk
+        self._element_count = 0
+        # Indent strings for depths 0..63, built once; _indent() is
+        # called for every emitted line
+        self._indent_cache = tuple(' ' * (i * self.indent_size) for i in range(64))
     
     def _get_output_format(self) -> str:
         """Get output format identifier."""
@@ -42,16 +74,9 @@ class HTMLConverter(BaseConverter):
     def convert(self, manifest: Dict[str, Any], **kwargs):
         """Convert manifest to HTML - synchronous wrapper for tests."""
         from .conversion_result import ConversionResult
-        import asyncio
-        
-        # Run async conversion
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        html_content = loop.run_until_complete(self.convert_manifest(manifest, **kwargs))
+
+        # Run async conversion on the shared sync loop
+        html_content = self._run_sync(self.convert_manifest(manifest, **kwargs))
         
         # Generate filename from manifest metadata or use default
         metadata = manifest.get('metadata', {})
@@ -60,11 +85,13 @@ class HTMLConverter(BaseConverter):
         snake_case_title = StringUtils.slugify(title, separator="_")
         filename = f"{snake_case_title}.html"
         
-        return ConversionResult(
-            content=html_content, 
-            format="html", 
+        result = ConversionResult(
+            content=html_content,
+            format="html",
             filename=filename
         )
+        result.add_statistic('element_count', self._element_count)
+        return result
     
     async def convert_manifest(self, 
                               manifest: Dict[str, Any],
@@ -80,9 +107,10 @@ class HTMLConverter(BaseConverter):
         Returns:
             Generated HTML content
         """
-        # Reset indentation
+        # Reset indentation and per-conversion counters
         self.current_indent = 0
-        
+        self._element_count = 0
+
         # Extract manifest sections
         metadata = self._extract_metadata(manifest)
         structure = self._extract_structure(manifest)
@@ -140,45 +168,51 @@ class HTMLConverter(BaseConverter):
                       styles: Dict[str, Any],
                       imports: Dict[str, Any],
                       **options) -> str:
-        """Generate complete head section."""
-        head_parts = []
-        
+        """Generate complete head section.
+
+        Written through one io.StringIO stream, which grows its buffer
+        in C, instead of collecting a parts list joined at the end.
+        """
+        buf = io.StringIO()
+        write = buf.write
+
         # Opening head tag
-        head_parts.append(self._indent() + "<head>")
+        write(self._indent() + "<head>")
         self._increase_indent()
-        
+
         # Meta tags
-        head_parts.extend(self._generate_meta_tags(metadata))
-        
+        for meta_tag in self._generate_meta_tags(metadata):
+            write('\n' + meta_tag)
+
         # Title
         title = metadata.get('title', 'Untitled Page')
-        head_parts.append(self._indent() + f"<title>{self._escape_html(title)}</title>")
-        
+        write('\n' + self._indent() + f"<title>{self._escape_html(title)}</title>")
+
         # External stylesheets
         if imports.get('stylesheets'):
             for stylesheet in imports['stylesheets']:
-                head_parts.append(self._generate_stylesheet_link(stylesheet))
-        
+                write('\n' + self._generate_stylesheet_link(stylesheet))
+
         # Internal styles
         if styles:
             style_content = self._generate_internal_styles(styles)
             if style_content:
-                head_parts.append(style_content)
-        
+                write('\n' + style_content)
+
         # External scripts (in head)
         if imports.get('scripts'):
             for script in imports['scripts']:
                 if script.get('placement') == 'head':
-                    head_parts.append(self._generate_script_tag(script))
-        
+                    write('\n' + self._generate_script_tag(script))
+
         # Additional head elements
         if options.get('additional_head'):
-            head_parts.append(self._indent() + options['additional_head'])
-        
+            write('\n' + self._indent() + options['additional_head'])
+
         self._decrease_indent()
-        head_parts.append(self._indent() + "</head>")
-        
-        return '\n'.join(head_parts)
+        write('\n' + self._indent() + "</head>")
+
+        return buf.getvalue()
     
     def _generate_meta_tags(self, metadata: Dict[str, Any]) -> List[str]:
         """Generate meta tags from metadata."""
@@ -279,15 +313,13 @@ class HTMLConverter(BaseConverter):
                         selector = key
                         if not selector.startswith(('.', '#')):
                             selector = f'.{selector}'
-                        # Parse declarations into dict
-                        properties = {}
-                        for decl in css_text.split(';'):
-                            decl = decl.strip()
-                            if not decl:
-                                continue
-                            if ':' in decl:
-                                prop, val = decl.split(':', 1)
-                                properties[prop.strip()] = val.strip()
+                        # Parse declarations into dict in one regex scan;
+                        # split-on-';' allocated a stripped copy per rule
+                        properties = {
+                            match.group(1).strip(): match.group(2).strip()
+                            for match in self._CSS_DECL_RE.finditer(css_text)
+                            if match.group(1).strip()
+                        }
                         if properties:
                             css_rule = self._generate_css_rule(selector, properties)
                             css_parts.append(css_rule)
@@ -302,19 +334,14 @@ class HTMLConverter(BaseConverter):
     
     def _substitute_css_variables(self, css_text: str, styles: Dict[str, Any]) -> str:
         """Substitute CSS variables with their values."""
-        import re
-        
-        # Find all var(--variable-name) patterns
-        var_pattern = r'var\(--([^)]+)\)'
-        
         def replace_var(match):
             var_name = match.group(1)
             # Look for the variable in styles
             if var_name in styles:
                 return str(styles[var_name])
             return match.group(0)  # Return original if not found
-        
-        return re.sub(var_pattern, replace_var, css_text)
+
+        return self._CSS_VAR_RE.sub(replace_var, css_text)
     
     def _generate_css_rule(self, selector: str, properties: Dict[str, str]) -> str:
         """Generate CSS rule from selector and properties."""
@@ -339,108 +366,164 @@ class HTMLConverter(BaseConverter):
         return "</body>"
     
     async def _generate_structure(self, structure: Dict[str, Any]) -> str:
-        """Generate HTML structure from manifest structure."""
+        """Generate HTML structure from manifest structure.
+
+        Emission appends line fragments into one shared buffer joined a
+        single time at the end; per-level '\\n'.join composition made
+        deep trees pay O(depth) copies per line.
+        """
         if not structure:
             return ""
-        
+
+        buf: List[str] = []
+
         # Handle different structure formats
         if 'tag' in structure:
             # Single element
-            return await self._generate_element(structure)
+            self._emit_element(structure, buf)
         elif 'children' in structure:
             # Container with children
-            return await self._generate_children(structure['children'])
+            self._emit_children(structure['children'], buf)
         else:
             # Process as container
-            content_parts = []
             for key, value in structure.items():
                 if isinstance(value, dict):
-                    element_content = await self._generate_element(value, tag_override=key)
-                    content_parts.append(element_content)
+                    self._emit_element(value, buf, tag_override=key)
                 elif isinstance(value, list):
                     for item in value:
                         if isinstance(item, dict):
-                            element_content = await self._generate_element(item)
-                            content_parts.append(element_content)
-            
-            return '\n'.join(content_parts)
-    
-    async def _generate_element(self, 
-                               element: Dict[str, Any], 
+                            self._emit_element(item, buf)
+
+        return '\n'.join(buf)
+
+    async def _generate_element(self,
+                               element: Dict[str, Any],
                                tag_override: Optional[str] = None) -> str:
         """Generate HTML element from structure definition."""
-        # Support short-form: {'tagname': {...}}
-        if tag_override is None and 'tag' not in element and len(element.keys()) == 1:
-            only_key = next(iter(element.keys()))
-            if only_key not in {'attributes', 'children', 'content', 'text', 'class', 'id', 'style'}:
-                tag_override = only_key
-                element = element[only_key] or {}
-        
-        tag = tag_override or element.get('tag', 'div')
-        
-        # Handle self-closing tags
-        self_closing_tags = {'img', 'br', 'hr', 'input', 'meta', 'link'}
-        is_self_closing = tag in self_closing_tags
-        
-        # Normalize attributes: merge direct keys like class/id/style into attributes
-        attrs = dict(element.get('attributes', {}))
-        for k in ['class', 'id', 'style', 'href', 'src', 'alt', 'title', 'name', 'type', 'value', 'placeholder', 'for', 'role']:
-            if k in element:
-                attrs[k] = element[k]
-        # Write back normalized attributes for opening tag builder
-        normalized_element = dict(element)
-        normalized_element['attributes'] = attrs
-        
-        # Build opening tag
-        opening_tag = await self._build_opening_tag(tag, normalized_element)
-        
-        if is_self_closing:
-            return self._indent() + opening_tag
-        
-        # Handle content
-        content = element.get('content', element.get('text', ''))
-        children = element.get('children', [])
-        # Allow children as dict mapping tag -> def
-        if isinstance(children, dict):
-            children = [{k: v} for k, v in children.items()]
-        
-        if not content and not children:
-            # Empty element
-            return self._indent() + f"<{tag}></{tag}>"
-        
-        if content and not children:
-            # Element with text content only
-            if '\n' in content or len(content) > 80:
-                # Multi-line content
-                return (self._indent() + opening_tag + '\n' +
-                       self._indent_text(content, self.current_indent + 1) + '\n' +
-                       self._indent() + f"</{tag}>")
-            else:
-                # Single line content
-                return self._indent() + f"{opening_tag}{self._escape_html(content)}</{tag}>"
-        
-        # Element with children
-        element_parts = [self._indent() + opening_tag]
-        
-        if content:
-            self._increase_indent()
-            element_parts.append(self._indent() + self._escape_html(content))
-            self._decrease_indent()
-        
-        if children:
+        buf: List[str] = []
+        self._emit_element(element, buf, tag_override=tag_override)
+        return '\n'.join(buf)
+
+    def _emit_element(self,
+                      element: Dict[str, Any],
+                      buf: List[str],
+                      tag_override: Optional[str] = None) -> None:
+        """Emit one element (and its subtree) as lines into buf."""
+        self._emit([('elem', element, tag_override)], buf)
+
+    def _emit(self, stack: List[tuple], buf: List[str]) -> None:
+        """Drive emission from an explicit work stack.
+
+        Replaces per-node recursion (one Python frame per element and
+        child list) with a LIFO of small work items, which also removes
+        the recursion limit on pathological nesting. Items run in pop
+        order, so producers push their continuations reversed.
+        """
+        append = buf.append
+        while stack:
+            item = stack.pop()
+            kind = item[0]
+
+            if kind == 'child':
+                child = item[1]
+                if isinstance(child, dict):
+                    if child.get('type') == 'text':
+                        # Text node
+                        text_content = child.get('content', '')
+                        if text_content:
+                            append(self._indent() + self._escape_html(text_content))
+                    else:
+                        # Element node
+                        stack.append(('elem', child, None))
+                elif isinstance(child, str):
+                    # Direct text content
+                    append(self._indent() + self._escape_html(child))
+                continue
+
+            if kind == 'close':
+                append(self._indent() + f"</{item[1]}>")
+                continue
+
+            if kind == 'dedent':
+                self._decrease_indent()
+                continue
+
+            if kind == 'text':
+                append(self._indent() + self._escape_html(item[1]))
+                continue
+
+            # kind == 'elem'
+            element, tag_override = item[1], item[2]
+
+            # Support short-form: {'tagname': {...}}
+            if tag_override is None and 'tag' not in element and len(element.keys()) == 1:
+                only_key = next(iter(element.keys()))
+                if only_key not in self._ELEMENT_DEF_KEYS:
+                    tag_override = only_key
+                    element = element[only_key] or {}
+
+            tag = tag_override or element.get('tag', 'div')
+            self._element_count += 1
+
+            # Handle self-closing tags
+            is_self_closing = tag in self._SELF_CLOSING_TAGS
+
+            # Normalize attributes: merge direct keys like class/id/style into attributes
+            attrs = dict(element.get('attributes', {}))
+            for k in self._DIRECT_ATTR_KEYS:
+                if k in element:
+                    attrs[k] = element[k]
+            # Write back normalized attributes for opening tag builder
+            normalized_element = dict(element)
+            normalized_element['attributes'] = attrs
+
+            # Build opening tag
+            opening_tag = self._opening_tag(tag, normalized_element)
+            ind = self._indent()
+
+            if is_self_closing:
+                append(ind + opening_tag)
+                continue
+
+            # Handle content
+            content = element.get('content', element.get('text', ''))
+            children = element.get('children', [])
+            # Allow children as dict mapping tag -> def
+            if isinstance(children, dict):
+                children = [{k: v} for k, v in children.items()]
+
+            if not content and not children:
+                # Empty element
+                append(ind + f"<{tag}></{tag}>")
+                continue
+
+            if content and not children:
+                # Element with text content only
+                if '\n' in content or len(content) > 80:
+                    # Multi-line content
+                    append(ind + opening_tag)
+                    append(self._indent_text(content, self.current_indent + 1))
+                    append(ind + f"</{tag}>")
+                else:
+                    # Single line content
+                    append(ind + f"{opening_tag}{self._escape_html(content)}</{tag}>")
+                continue
+
+            # Element with children: open now, queue the indented body
+            # and the closing tag (pushed reversed for pop order)
+            append(ind + opening_tag)
             self._increase_indent()
-            children_content = await self._generate_children(children)
-            element_parts.append(children_content)
-            self._decrease_indent()
-        
-        element_parts.append(self._indent() + f"</{tag}>")
-        
-        return '\n'.join(element_parts)
-    
-    async def _build_opening_tag(self, tag: str, element: Dict[str, Any]) -> str:
+            stack.append(('close', tag))
+            stack.append(('dedent',))
+            for child in reversed(children):
+                stack.append(('child', child))
+            if content:
+                stack.append(('text', content))
+
+    def _opening_tag(self, tag: str, element: Dict[str, Any]) -> str:
         """Build opening HTML tag with attributes."""
         attributes = element.get('attributes', {})
-        
+
         attr_parts = []
         for name, value in attributes.items():
             if value is None or value is False:
@@ -450,35 +533,30 @@ class HTMLConverter(BaseConverter):
                 attr_parts.append(name)
             else:
                 # Regular attribute
-                escaped_value = self._escape_html(str(value))
-                attr_parts.append(f'{name}="{escaped_value}"')
-        
+                prefix = self._ATTR_PREFIX.get(name)
+                if prefix is None:
+                    prefix = name + '="'
+                attr_parts.append(prefix + self._escape_html(str(value)) + '"')
+
         if attr_parts:
             return f"<{tag} {' '.join(attr_parts)}>"
         else:
             return f"<{tag}>"
-    
+
+    async def _build_opening_tag(self, tag: str, element: Dict[str, Any]) -> str:
+        """Build opening HTML tag with attributes (async wrapper)."""
+        return self._opening_tag(tag, element)
+
     async def _generate_children(self, children: List[Any]) -> str:
         """Generate HTML for list of child elements."""
-        child_parts = []
-        
-        for child in children:
-            if isinstance(child, dict):
-                if child.get('type') == 'text':
-                    # Text node
-                    text_content = child.get('content', '')
-                    if text_content:
-                        child_parts.append(self._indent() + self._escape_html(text_content))
-                else:
-                    # Element node
-                    child_content = await self._generate_element(child)
-                    child_parts.append(child_content)
-            elif isinstance(child, str):
-                # Direct text content
-                child_parts.append(self._indent() + self._escape_html(child))
-        
-        return '\n'.join(child_parts)
-    
+        buf: List[str] = []
+        self._emit_children(children, buf)
+        return '\n'.join(buf)
+
+    def _emit_children(self, children: List[Any], buf: List[str]) -> None:
+        """Emit a list of child elements as lines into buf."""
+        self._emit([('child', child) for child in reversed(children)], buf)
+
     def _generate_script_tag(self, script: Dict[str, Any]) -> str:
         """Generate script tag."""
         if script.get('src'):
@@ -531,7 +609,10 @@ class HTMLConverter(BaseConverter):
     
     def _indent(self) -> str:
         """Get current indentation string."""
-        return ' ' * (self.current_indent * self.indent_size)
+        level = self.current_indent
+        if level < 64:
+            return self._indent_cache[level]
+        return ' ' * (level * self.indent_size)
     
     def _increase_indent(self) -> None:
         """Increase indentation level."""
@@ -570,12 +651,35 @@ class HTMLConverter(BaseConverter):
     async def _minify_content(self, content: str) -> str:
         """Minify HTML content."""
         # Remove comments
-        content = re.sub(r'<!--.*?-->', '', content, flags=re.DOTALL)
-        
+        content = self._strip_html_comments(content)
+
         # Remove extra whitespace
-        content = re.sub(r'\s+', ' ', content)
-        
+        content = self._WS_RUN_RE.sub(' ', content)
+
         # Remove whitespace around tags
-        content = re.sub(r'>\s+<', '><', content)
-        
+        content = self._TAG_WS_RE.sub('><', content)
+
         return content.strip()
+
+    @staticmethod
+    def _strip_html_comments(content: str) -> str:
+        """Drop HTML comments via a forward str.find scan.
+
+        Equivalent to the non-greedy DOTALL regex but runs in the C
+        substring search with no backtracking on megabyte documents;
+        an unterminated comment is kept as-is, like the regex did.
+        """
+        start = content.find('<!--')
+        if start == -1:
+            return content
+        parts = []
+        pos = 0
+        while start != -1:
+            end = content.find('-->', start + 4)
+            if end == -1:
+                break
+            parts.append(content[pos:start])
+            pos = end + 3
+            start = content.find('<!--', pos)
+        parts.append(content[pos:])
+        return ''.join(parts)
@@ -44,8 +44,7 @@ class PHPConverter(BaseConverter):
     def convert(self, manifest: Dict[str, Any], **kwargs):
         """Convert manifest to PHP - synchronous wrapper for tests."""
         from .conversion_result import ConversionResult
-        import asyncio
-        
+
         # Determine default class name from metadata title
         metadata = manifest.get('metadata', {})
         title = metadata.get('title', 'Component')
@@ -56,13 +55,7 @@ class PHPConverter(BaseConverter):
         class_name = f"{class_name_base}Component"
         
         # Run async conversion with class_name passed through
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        php_content = loop.run_until_complete(self.convert_manifest(manifest, class_name=class_name, **kwargs))
+        php_content = self._run_sync(self.convert_manifest(manifest, class_name=class_name, **kwargs))
         filename = f"{class_name}.php"
         return ConversionResult(content=php_content, format="php", filename=filename)
     
@@ -43,16 +43,9 @@ class ReactConverter(BaseConverter):
     def convert(self, manifest: Dict[str, Any], **kwargs):
         """Convert manifest to React - synchronous wrapper for tests."""
         from .conversion_result import ConversionResult
-        import asyncio
-        
-        # Run async conversion
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        react_content = loop.run_until_complete(self.convert_manifest(manifest, **kwargs))
+
+        # Run async conversion on the shared sync loop
+        react_content = self._run_sync(self.convert_manifest(manifest, **kwargs))
         
         # Generate filename from manifest metadata or use default
         metadata = manifest.get('metadata', {})
@@ -700,21 +693,23 @@ class ReactConverter(BaseConverter):
     
     def _parse_inline_style(self, style_str: str) -> str:
         """Parse inline CSS style string to React style object."""
-        style_props = []
-        
+        # Single pass into a dict: insertion order preserves the first
+        # occurrence of each property while later duplicates overwrite
+        # the value, matching CSS last-declaration-wins semantics
+        style_props: Dict[str, str] = {}
+
         for declaration in style_str.split(';'):
             declaration = declaration.strip()
             if ':' in declaration:
                 prop, value = declaration.split(':', 1)
                 prop = prop.strip()
                 value = value.strip()
-                
+
                 if prop and value:
                     react_prop = self._css_to_camel_case(prop)
-                    formatted_value = self._format_css_value(value)
-                    style_props.append(f"{react_prop}: {formatted_value}")
-        
-        return f"{{{', '.join(style_props)}}}"
+                    style_props[react_prop] = self._format_css_value(value)
+
+        return f"{{{', '.join(f'{prop}: {value}' for prop, value in style_props.items())}}}"
     
     def _escape_jsx_content(self, content: str) -> str:
         """Escape content for JSX."""
@@ -45,16 +45,9 @@ class VueConverter(BaseConverter):
     def convert(self, manifest: Dict[str, Any], **kwargs):
         """Convert manifest to Vue - synchronous wrapper for tests."""
         from .conversion_result import ConversionResult
-        import asyncio
-        
-        # Run async conversion
-        try:
-            loop = asyncio.get_event_loop()
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-        
-        vue_content = loop.run_until_complete(self.convert_manifest(manifest, **kwargs))
+
+        # Run async conversion on the shared sync loop
+        vue_content = self._run_sync(self.convert_manifest(manifest, **kwargs))
         
         # Generate filename from manifest metadata or use default
         metadata = manifest.get('metadata', {})
@@ -8,11 +8,30 @@ Copyright 2025 Tom Sapletta
 Licensed under the Apache License, Version 2.0
 """
 
-import copy
 from typing import Any, Dict, List, Optional, Set
 from ..exceptions import TemplateInheritanceError, WhyMLError
 
 
+def _fast_clone(obj: Any) -> Any:
+    """Recursively copy YAML-shaped data (dict/list/tuple/scalars).
+
+    Manifests only ever hold JSON/YAML-safe types, so the memo dict and
+    per-node dispatch that make copy.deepcopy slow buy nothing here;
+    this variant is several times faster on large structures.
+    """
+    # Exact type checks: YAML/JSON loaders only ever produce the plain
+    # builtin containers, and `type(x) is dict` skips the subclass walk
+    # isinstance performs on every node
+    obj_type = type(obj)
+    if obj_type is dict:
+        return {key: _fast_clone(value) for key, value in obj.items()}
+    if obj_type is list:
+        return [_fast_clone(item) for item in obj]
+    if obj_type is tuple:
+        return tuple(_fast_clone(item) for item in obj)
+    return obj
+
+
 class InheritanceResolver:
     """Resolves template inheritance and manifest composition."""
     
@@ -41,7 +60,7 @@ class InheritanceResolver:
         """
         # Check cache first
         if manifest_id in self.resolved_cache:
-            return copy.deepcopy(self.resolved_cache[manifest_id])
+            return _fast_clone(self.resolved_cache[manifest_id])
         
         # Reset state for new resolution
         self.inheritance_chain = []
@@ -51,7 +70,7 @@ class InheritanceResolver:
             resolved = self._resolve_recursive(manifest, manifest_id, loader_func)
             
             # Cache the result
-            self.resolved_cache[manifest_id] = copy.deepcopy(resolved)
+            self.resolved_cache[manifest_id] = _fast_clone(resolved)
             
             return resolved
             
@@ -94,7 +113,7 @@ class InheritanceResolver:
         
         if not parent_template:
             # No inheritance, return as is
-            return copy.deepcopy(manifest)
+            return _fast_clone(manifest)
         
         # Load parent template
         if loader_func:
@@ -129,8 +148,13 @@ class InheritanceResolver:
         Returns:
             Merged manifest
         """
-        result = copy.deepcopy(parent)
-        
+        # Shallow top-level copy: every section the child touches is
+        # replaced below with freshly built structures, and the parent
+        # passed in is already a private clone from _resolve_recursive,
+        # so deep-cloning its entire structure subtree up front (only
+        # for the child to override it) was wasted work
+        result = dict(parent)
+
         # Merge each section
         for section, content in child.items():
             if section == 'metadata':
@@ -141,12 +165,10 @@ class InheritanceResolver:
                 )
             elif section == 'template_slots':
                 # Template slots override completely
-                result[section] = copy.deepcopy(content)
+                result[section] = _fast_clone(content)
             elif section == 'styles':
                 # Merge styles - child overrides parent
-                if section not in result:
-                    result[section] = {}
-                result[section].update(copy.deepcopy(content))
+                result[section] = {**result.get(section, {}), **_fast_clone(content)}
             elif section == 'structure':
                 # Structure can be merged or overridden based on slots
                 result[section] = self._merge_structure(
@@ -162,7 +184,7 @@ class InheritanceResolver:
                 )
             else:
                 # Other sections override completely
-                result[section] = copy.deepcopy(content)
+                result[section] = _fast_clone(content)
         
         return result
     
@@ -176,9 +198,8 @@ class InheritanceResolver:
         Returns:
             Merged metadata
         """
-        result = copy.deepcopy(parent_meta)
-        result.update(copy.deepcopy(child_meta))
-        
+        result = {**_fast_clone(parent_meta), **_fast_clone(child_meta)}
+
         # Remove 'extends' from final result to avoid infinite inheritance
         if 'extends' in result:
             del result['extends']
@@ -201,10 +222,10 @@ class InheritanceResolver:
         """
         if not template_slots:
             # No slots, child structure overrides parent completely
-            return copy.deepcopy(child_structure)
+            return _fast_clone(child_structure)
         
         # Start with parent structure
-        result = copy.deepcopy(parent_structure)
+        result = _fast_clone(parent_structure)
         
         # Replace template slots with child content
         result = self._replace_template_slots(result, template_slots)
@@ -252,15 +273,12 @@ class InheritanceResolver:
         Returns:
             Merged imports
         """
-        result = copy.deepcopy(parent_imports)
+        result = _fast_clone(parent_imports)
         
         for import_type, imports_list in child_imports.items():
-            if import_type not in result:
-                result[import_type] = []
-            
-            # Combine lists and remove duplicates
-            combined = result[import_type] + imports_list
-            result[import_type] = list(dict.fromkeys(combined))  # Remove duplicates, preserve order
+            # Combine lists and remove duplicates, preserving order
+            combined = result.get(import_type, []) + imports_list
+            result[import_type] = list(dict.fromkeys(combined))
         
         return result
     
@@ -274,13 +292,13 @@ class InheritanceResolver:
         Returns:
             Merged dictionary
         """
-        result = copy.deepcopy(base)
+        result = _fast_clone(base)
         
         for key, value in overlay.items():
             if key in result and isinstance(result[key], dict) and isinstance(value, dict):
                 result[key] = self._deep_merge_dict(result[key], value)
             else:
-                result[key] = copy.deepcopy(value)
+                result[key] = _fast_clone(value)
         
         return result
     
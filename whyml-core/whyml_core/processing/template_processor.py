@@ -10,6 +10,7 @@ Licensed under the Apache License, Version 2.0
 
 import re
 import logging
+from functools import lru_cache
 from typing import Any, Dict, Optional
 from jinja2 import Template, Environment, BaseLoader, TemplateError
 
@@ -20,7 +21,10 @@ logger = logging.getLogger(__name__)
 
 class TemplateProcessor:
     """Processes template inheritance and variable substitution with Jinja2."""
-    
+
+    __slots__ = ('env', '_compile_template')
+
+
     def __init__(self, enable_autoescape: bool = True, strict_undefined: bool = False):
         """Initialize template processor with Jinja2 environment.
         
@@ -53,6 +57,11 @@ class TemplateProcessor:
             'round': round
         })
         
+        # Memoize template compilation per source string: manifests
+        # reuse the same template strings across sections and repeat
+        # processing runs, and compilation dominates render cost
+        self._compile_template = lru_cache(maxsize=1024)(self.env.from_string)
+
         # Add custom filters
         self.env.filters.update({
             'capitalize_first': self._capitalize_first,
@@ -97,10 +106,15 @@ class TemplateProcessor:
         """
         if not content:
             return content
-        
+
+        # Fast path: no template markers of either syntax, so skip the
+        # context build and both substitution passes entirely
+        if '{{' not in content and '{%' not in content and '<?=' not in content:
+            return content
+
         if not variables:
             variables = {}
-            
+
         # Prepare context with variables and config
         context = {}
         context.update(variables)
@@ -131,8 +145,12 @@ class TemplateProcessor:
         Returns:
             Content with Jinja2 variables substituted
         """
+        # Fast path: nothing for Jinja to do
+        if '{{' not in content and '{%' not in content:
+            return content
+
         try:
-            jinja_template = self.env.from_string(content)
+            jinja_template = self._compile_template(content)
             return jinja_template.render(**context)
         except TemplateError as e:
             logger.warning(f"Jinja2 template error: {e}")
@@ -151,8 +169,12 @@ class TemplateProcessor:
         Returns:
             Content with PHP-style variables substituted
         """
+        # Fast path: nothing PHP-like to substitute
+        if '<?=' not in content:
+            return content
+
         php_pattern = re.compile(r'<\?=([^?]+)\?>')
-        
+
         def php_replacer(match):
             var_expr = match.group(1).strip()
             try:
@@ -262,7 +284,7 @@ class TemplateProcessor:
             WhyMLTemplateError: If template rendering fails
         """
         try:
-            template = self.env.from_string(template_str)
+            template = self._compile_template(template_str)
             return template.render(**context)
         except TemplateError as e:
             raise WhyMLTemplateError(f"Template rendering failed: {e}", template_name="string")
@@ -279,7 +301,7 @@ class TemplateProcessor:
             Tuple of (is_valid, error_message)
         """
         try:
-            self.env.from_string(template_str)
+            self._compile_template(template_str)
             return True, None
         except TemplateError as e:
             return False, str(e)
@@ -376,11 +398,12 @@ class TemplateProcessor:
         """
         result = {}
         for key, value in data.items():
-            if isinstance(value, str):
+            value_type = type(value)
+            if value_type is str:
                 result[key] = self.substitute_template_variables(value, variables)
-            elif isinstance(value, dict):
+            elif value_type is dict:
                 result[key] = self._process_dict_templates(value, variables)
-            elif isinstance(value, list):
+            elif value_type is list:
                 result[key] = self._process_list_templates(value, variables)
             else:
                 result[key] = value
@@ -398,11 +421,12 @@ class TemplateProcessor:
         """
         result = []
         for item in data:
-            if isinstance(item, str):
+            item_type = type(item)
+            if item_type is str:
                 result.append(self.substitute_template_variables(item, variables))
-            elif isinstance(item, dict):
+            elif item_type is dict:
                 result.append(self._process_dict_templates(item, variables))
-            elif isinstance(item, list):
+            elif item_type is list:
                 result.append(self._process_list_templates(item, variables))
             else:
                 result.append(item)
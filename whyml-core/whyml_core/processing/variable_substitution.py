@@ -113,24 +113,27 @@ class VariableSubstitution:
         Returns:
             Object with variables substituted
         """
-        if isinstance(obj, dict):
+        # Exact type dispatch: manifest data only holds plain builtin
+        # containers, and type() comparison is cheaper per node than
+        # isinstance against a tuple in this hot recursive walk
+        obj_type = type(obj)
+        if obj_type is str:
+            return self._substitute_string(obj, context)
+
+        if obj_type is dict:
             result = {}
             for key, value in obj.items():
                 # Substitute in key if it's a string
-                new_key = self._substitute_string(key, context) if isinstance(key, str) else key
+                new_key = self._substitute_string(key, context) if type(key) is str else key
                 # Recursively substitute in value
                 result[new_key] = self._substitute_recursive(value, context)
             return result
-        
-        elif isinstance(obj, list):
+
+        if obj_type is list:
             return [self._substitute_recursive(item, context) for item in obj]
-        
-        elif isinstance(obj, str):
-            return self._substitute_string(obj, context)
-        
-        else:
-            # Return primitive values as-is
-            return obj
+
+        # Return primitive values as-is
+        return obj
     
     def _substitute_shallow(self, obj: Any, context: Dict[str, Any]) -> Any:
         """Substitute variables only at the current level (non-recursive).
@@ -196,15 +199,19 @@ class VariableSubstitution:
         Returns:
             Manifest with template variables processed and applied
         """
-        result = copy.deepcopy(manifest)
-        
+        # Shallow top-level copy is enough: every section is replaced
+        # below with the fresh structures _substitute_recursive builds,
+        # so deep-cloning the whole manifest first only burned memory
+        result = dict(manifest)
+
         # Extract template_vars
         template_vars = result.get('template_vars', {})
         if not isinstance(template_vars, dict):
             return result
         
         # Build context from external + template_vars
-        context = copy.deepcopy(external_context) if external_context else {}
+        # Only the top level is updated, so a shallow copy suffices
+        context = dict(external_context) if external_context else {}
         context.update(template_vars)
         
         # Merge with global context
@@ -243,7 +250,8 @@ class VariableSubstitution:
         
         # Resolve in dependency order
         resolved = {}
-        working_context = copy.deepcopy(context)
+        # Written only at the top level as vars resolve; shallow copy
+        working_context = dict(context)
         
         # Process variables in dependency order
         processed = set()
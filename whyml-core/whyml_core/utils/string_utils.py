@@ -15,6 +15,14 @@ from typing import Any, Dict, List, Optional, Union, Callable
 from urllib.parse import quote, unquote
 from ..exceptions import ValidationError
 
+# Translate tables matching html.escape output, built once at import
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;',
+})
+_HTML_ESCAPE_TABLE_NOQUOTE = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;',
+})
+
 
 class StringUtils:
     """Utility functions for advanced string operations."""
@@ -204,8 +212,11 @@ class StringUtils:
         """
         if not text:
             return ""
-        
-        return html.escape(text, quote=quote)
+
+        # str.translate walks the string once; html.escape chains a
+        # str.replace per entity, each a full scan plus a new string
+        table = _HTML_ESCAPE_TABLE if quote else _HTML_ESCAPE_TABLE_NOQUOTE
+        return text.translate(table)
     
     @staticmethod
     def unescape_html(text: str) -> str:
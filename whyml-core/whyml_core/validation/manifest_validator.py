@@ -8,26 +8,143 @@ Licensed under the Apache License, Version 2.0
 """
 
 import re
+import sys
 import yaml
+
+try:
+    # libyaml-backed loader, several times faster than the pure-Python
+    # SafeLoader; shared by other modules that parse YAML
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
-from jsonschema import validate, ValidationError as JsonSchemaError
+from jsonschema import Draft7Validator
+
+try:
+    # Optional backend: compiles the schema to specialized Python code,
+    # much cheaper per validation than the interpreted schema walker
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
 
 from ..exceptions import ValidationError, SchemaError
 
+# Validation patterns, compiled once at import; the structure walk and
+# style checks match them once per element and per declaration
+_CSS_PROP_RE = re.compile(r'^[a-zA-Z-]+\s*:\s*.+$')
+_CSS_RULE_RE = re.compile(r'^\s*[a-zA-Z0-9._#\-\s,:\[\]()>+~*@]+\s*\{[^{}]*\}\s*$', re.DOTALL)
+_HTML_ELEM_RE = re.compile(r'^[a-zA-Z][a-zA-Z0-9-]*$')
+_SLOT_NAME_RE = re.compile(r'^[a-zA-Z_][a-zA-Z0-9_-]*$')
+
+# Reserved element keys skipped by the structure walk; interned so the
+# per-key membership test in the walk short-circuits on identity for
+# keys that came through the YAML parser (which interns short ASCII keys)
+_SKIP_KEYS = frozenset(map(sys.intern, ('children', 'text', 'style', 'class', 'id')))
+
+# Common HTML element names; every entry matches _HTML_ELEM_RE, so the
+# frozenset is a pure fast path that skips the regex for the names that
+# dominate real manifests
+_KNOWN_HTML_TAGS = {
+    'html', 'head', 'body', 'title', 'meta', 'link', 'script', 'style',
+    'div', 'span', 'p', 'a', 'img', 'ul', 'ol', 'li', 'table', 'thead',
+    'tbody', 'tr', 'td', 'th', 'form', 'input', 'button', 'select',
+    'option', 'textarea', 'label', 'header', 'footer', 'nav', 'main',
+    'section', 'article', 'aside', 'figure', 'figcaption', 'h1', 'h2',
+    'h3', 'h4', 'h5', 'h6', 'strong', 'em', 'br', 'hr', 'iframe',
+    'video', 'audio', 'canvas', 'svg', 'blockquote', 'pre', 'code',
+}
+_KNOWN_HTML_TAGS = frozenset(map(sys.intern, _KNOWN_HTML_TAGS))
+
+
+def _looks_like_css_prop(s: str) -> bool:
+    """Cheap scalar check for the common 'name: value' declaration shape.
+
+    Accepts only what _CSS_PROP_RE would accept; anything ambiguous
+    falls through to the regex, so this just skips the regex engine for
+    the overwhelmingly common well-formed case.
+    """
+    idx = s.find(':')
+    if idx <= 0 or s[0].isspace():
+        return False
+    name = s[:idx].rstrip()
+    return (bool(name) and name.isascii()
+            and name.replace('-', '').isalpha()
+            and bool(s[idx + 1:].strip()))
+
+
+def _is_valid_slot_name(name: str) -> bool:
+    """Scalar check for slot names, mirroring _SLOT_NAME_RE exactly.
+
+    The slot-name language is tiny ([a-zA-Z_][a-zA-Z0-9_-]*), so a
+    hand-rolled character scan beats the regex engine on the short
+    names manifests actually use; non-ASCII input falls through to the
+    regex, which rejects it the same way.
+    """
+    if name and name.isascii():
+        first = name[0]
+        if not (first.isalpha() or first == '_'):
+            return False
+        return all(c.isalnum() or c in '_-' for c in name)
+    return bool(_SLOT_NAME_RE.match(name))
+
+
+def _format_path(segments: tuple) -> str:
+    """Render a structure path from walk segments (str key / int index)."""
+    parts = ['structure']
+    for segment in segments:
+        parts.append(f'[{segment}]' if isinstance(segment, int) else f'.{segment}')
+    return ''.join(parts)
+
+
+# Compiled Draft7Validator instances for the default schema, keyed on
+# the requested-sections tuple; CLI and web handlers build a fresh
+# validator per call and would otherwise recompile an identical schema
+_DEFAULT_VALIDATORS: Dict[tuple, Tuple[Dict[str, Any], Draft7Validator]] = {}
+
 
 class ManifestValidator:
     """Validates manifest structure and content against schema."""
-    
-    def __init__(self, schema_path: Optional[Path] = None, requested_sections: Optional[List[str]] = None):
+
+    __slots__ = ('requested_sections', 'schema', '_validator', '_fastval')
+
+    def __init__(self,
+                 schema_path: Optional[Path] = None,
+                 requested_sections: Optional[List[str]] = None,
+                 use_fastjsonschema: bool = False):
         """Initialize validator with optional custom schema and requested sections.
-        
+
         Args:
             schema_path: Path to custom validation schema file
             requested_sections: List of sections to validate (enables selective validation)
+            use_fastjsonschema: Compile the schema with fastjsonschema
+                when the package is installed; falls back to jsonschema
+                otherwise. Reports only the first schema violation per
+                validation, unlike the default backend.
         """
         self.requested_sections = requested_sections or []
-        self.schema = self._load_schema(schema_path)
+        self._fastval = None
+
+        if schema_path is None:
+            # Reuse the compiled validator for the default schema; it
+            # only varies with the requested sections
+            cache_key = tuple(self.requested_sections)
+            cached = _DEFAULT_VALIDATORS.get(cache_key)
+            if cached is None:
+                schema = self._load_schema(None)
+                Draft7Validator.check_schema(schema)
+                cached = (schema, Draft7Validator(schema))
+                _DEFAULT_VALIDATORS[cache_key] = cached
+            self.schema, self._validator = cached
+        else:
+            self.schema = self._load_schema(schema_path)
+            # Compile the schema once; jsonschema.validate would rebuild a
+            # validator (and re-check the schema) on every call
+            Draft7Validator.check_schema(self.schema)
+            self._validator = Draft7Validator(self.schema)
+
+        if use_fastjsonschema and fastjsonschema is not None:
+            self._fastval = fastjsonschema.compile(self.schema)
     
     def _load_schema(self, schema_path: Optional[Path]) -> Dict[str, Any]:
         """Load the manifest validation schema.
@@ -44,7 +161,7 @@ class ManifestValidator:
         if schema_path and schema_path.exists():
             try:
                 with open(schema_path, 'r') as f:
-                    return yaml.safe_load(f)
+                    return yaml.load(f, Loader=_YamlLoader)
             except Exception as e:
                 raise SchemaError(f"Failed to load custom schema: {e}", str(schema_path))
         
@@ -141,11 +258,17 @@ class ManifestValidator:
         errors = []
         warnings = []
         
-        # Schema validation
-        try:
-            validate(instance=manifest, schema=self.schema)
-        except JsonSchemaError as e:
-            errors.append(f"Schema validation failed: {e.message}")
+        if self._fastval is not None:
+            # fastjsonschema raises on the first violation
+            try:
+                self._fastval(manifest)
+            except fastjsonschema.JsonSchemaException as e:
+                errors.append(f"Schema validation failed: {e.message}")
+        else:
+            # Schema validation against the pre-compiled validator; reports
+            # every schema violation instead of stopping at the first
+            for error in self._validator.iter_errors(manifest):
+                errors.append(f"Schema validation failed: {error.message}")
         
         # Custom validation rules
         self._validate_metadata(manifest, errors, warnings)
@@ -231,9 +354,8 @@ class ManifestValidator:
             errors.append("Styles must be an object/dictionary")
             return
         
-        css_property_pattern = re.compile(r'^[a-zA-Z-]+\s*:\s*.+$')
-        css_rule_pattern = re.compile(r'^\s*[a-zA-Z0-9._#\-\s,:\[\]()>+~*@]+\s*\{[^{}]*\}\s*$', re.DOTALL)
-        
+        css_property_pattern = _CSS_PROP_RE
+
         for style_name, style_value in styles.items():
             # Allow flexible formats: string (CSS rules), object (parsed CSS), or array (multiple styles)
             if not isinstance(style_value, (str, dict, list)):
@@ -260,11 +382,12 @@ class ManifestValidator:
                 properties = style_value.split(';')
                 for prop in properties:
                     prop = prop.strip()
-                    if prop and not css_property_pattern.match(prop):
+                    if prop and not (_looks_like_css_prop(prop) or css_property_pattern.match(prop)):
                         warnings.append(f"Style '{style_name}' may have invalid CSS property: '{prop}'")
             else:
                 # Single property
-                if style_value.strip() and not css_property_pattern.match(style_value.strip()):
+                stripped = style_value.strip()
+                if stripped and not (_looks_like_css_prop(stripped) or css_property_pattern.match(stripped)):
                     warnings.append(f"Style '{style_name}' may have invalid CSS property: '{style_value}'")
     
     def _validate_structure(self, manifest: Dict[str, Any], errors: List[str], warnings: List[str]):
@@ -281,28 +404,34 @@ class ManifestValidator:
             # Structure is now optional - only validate if present
             return
         
-        def validate_element(element, path="structure"):
+        # Iterative walk: no recursion limit on deep manifests and no
+        # Python frame per nested node. Paths ride the stack as segment
+        # tuples (str = key, int = index) and are only rendered to a
+        # string when a warning actually fires.
+        stack = [(structure, ())]
+        while stack:
+            element, segments = stack.pop()
             if isinstance(element, dict):
                 # Check for required HTML element structure
                 for key, value in element.items():
-                    if key in ['children', 'text', 'style', 'class', 'id']:
+                    if key in _SKIP_KEYS:
                         continue
-                    
+
                     # This should be an HTML element
-                    if not re.match(r'^[a-zA-Z][a-zA-Z0-9-]*$', key):
-                        warnings.append(f"Unusual element name at {path}.{key}: '{key}'")
-                    
+                    if key not in _KNOWN_HTML_TAGS and not _HTML_ELEM_RE.match(key):
+                        warnings.append(
+                            f"Unusual element name at {_format_path(segments)}.{key}: '{key}'"
+                        )
+
                     if isinstance(value, dict):
-                        validate_element(value, f"{path}.{key}")
+                        stack.append((value, segments + (key,)))
                     elif isinstance(value, list):
                         for i, item in enumerate(value):
-                            validate_element(item, f"{path}.{key}[{i}]")
-            
+                            stack.append((item, segments + (key, i)))
+
             elif isinstance(element, list):
                 for i, item in enumerate(element):
-                    validate_element(item, f"{path}[{i}]")
-        
-        validate_element(structure)
+                    stack.append((item, segments + (i,)))
     
     def _validate_template_inheritance(self, manifest: Dict[str, Any], errors: List[str], warnings: List[str]):
         """Validate template inheritance configuration.
@@ -320,5 +449,5 @@ class ManifestValidator:
         
         # Validate slot names
         for slot_name in template_slots.keys():
-            if not re.match(r'^[a-zA-Z_][a-zA-Z0-9_-]*$', slot_name):
+            if not _is_valid_slot_name(slot_name):
                 errors.append(f"Invalid template slot name: '{slot_name}'")
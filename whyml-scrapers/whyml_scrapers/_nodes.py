@@ -0,0 +1,33 @@
+"""
+WhyML Scrapers - Internal manifest node representation
+
+Slot-based intermediate frames for element-to-manifest conversion.
+Slotted instances store fields in a fixed array instead of a per-object
+hash table, which cuts allocation and GC pressure on pages with
+thousands of nodes; dicts are built once, at the API boundary.
+
+Copyright 2025 Tom Sapletta
+Licensed under the Apache License, Version 2.0
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+#: Tag name marking a text run rather than an element
+TEXT_TAG = 'text'
+
+
+class SubtreeFrame:
+    """One element frame in the bottom-up manifest conversion.
+
+    ``children`` holds child frames interleaved with plain strings for
+    text runs; ``sig`` and ``out`` are filled during the bottom-up
+    assembly pass (a structural signature and the finished fragment).
+    """
+
+    __slots__ = ('element', 'children', 'sig', 'out')
+
+    def __init__(self, element: Any):
+        self.element = element
+        self.children: List[Any] = []
+        self.sig: Optional[Tuple] = None
+        self.out: Optional[Dict[str, Any]] = None
@@ -15,6 +15,27 @@ from bs4 import BeautifulSoup, Tag, NavigableString
 
 from whyml_core.utils import StringUtils
 
+try:
+    # Real CSS tokenizer: linear-time and correct on @media/@supports
+    # nesting, where the regex splitter below mis-slices rules
+    import tinycss2
+except ImportError:
+    tinycss2 = None
+
+try:
+    # JSON-LD blobs on commerce pages run to hundreds of KB; orjson
+    # parses them several times faster than the stdlib decoder
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Compiled once at import; these run per style block / styled element on
+# every extraction, so per-call compilation and re-cache lookups add up
+_CSS_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_CSS_RULE_RE = re.compile(r'([^{]+)\{([^}]+)\}', re.MULTILINE)
+_BG_IMAGE_RE = re.compile(r'background-image\s*:\s*url\(["\']?([^"\']+)["\']?\)')
+
 
 class ContentExtractor:
     """Advanced content extraction with intelligent parsing and conversion."""
@@ -37,41 +58,48 @@ class ContentExtractor:
             'internal_styles': {},
             'external_stylesheets': []
         }
-        
-        # Extract inline styles
-        elements_with_style = soup.find_all(attrs={'style': True})
-        for i, element in enumerate(elements_with_style):
-            style_content = element['style']
-            if style_content.strip():
-                # Create unique identifier for inline style
-                element_id = element.get('id') or f"element_{i}"
-                styles['inline_styles'][element_id] = self._parse_css_properties(style_content)
-        
-        # Extract internal styles
-        style_tags = soup.find_all('style')
-        for i, style_tag in enumerate(style_tags):
-            css_content = style_tag.get_text()
-            if css_content.strip():
-                parsed_rules = self._parse_css_rules(css_content)
-                styles['internal_styles'][f'style_block_{i}'] = parsed_rules
-        
-        # Extract external stylesheet references
-        link_tags = soup.find_all('link', rel='stylesheet')
-        for link in link_tags:
-            href = link.get('href')
-            if href:
-                stylesheet_info = {
-                    'href': href,
-                    'media': link.get('media', 'all'),
-                    'type': link.get('type', 'text/css')
-                }
-                if link.get('integrity'):
-                    stylesheet_info['integrity'] = link['integrity']
-                if link.get('crossorigin'):
-                    stylesheet_info['crossorigin'] = link['crossorigin']
-                
-                styles['external_stylesheets'].append(stylesheet_info)
-        
+
+        # One walk over the tree feeds all three collectors; the previous
+        # three find_all calls each traversed every node again
+        inline_index = 0
+        block_index = 0
+
+        for element in soup.descendants:
+            if not isinstance(element, Tag):
+                continue
+
+            name = element.name
+
+            if name == 'style':
+                css_content = element.get_text()
+                if css_content.strip():
+                    parsed_rules = self._parse_css_rules(css_content)
+                    styles['internal_styles'][f'style_block_{block_index}'] = parsed_rules
+                block_index += 1
+
+            elif name == 'link' and 'stylesheet' in (element.get('rel') or ()):
+                href = element.get('href')
+                if href:
+                    stylesheet_info = {
+                        'href': href,
+                        'media': element.get('media', 'all'),
+                        'type': element.get('type', 'text/css')
+                    }
+                    if element.get('integrity'):
+                        stylesheet_info['integrity'] = element['integrity']
+                    if element.get('crossorigin'):
+                        stylesheet_info['crossorigin'] = element['crossorigin']
+
+                    styles['external_stylesheets'].append(stylesheet_info)
+
+            style_content = element.get('style')
+            if style_content is not None:
+                if style_content.strip():
+                    # Create unique identifier for inline style
+                    element_id = element.get('id') or f"element_{inline_index}"
+                    styles['inline_styles'][element_id] = self._parse_css_properties(style_content)
+                inline_index += 1
+
         return styles
     
     def _parse_css_properties(self, css_text: str) -> Dict[str, str]:
@@ -108,18 +136,26 @@ class ContentExtractor:
             Dictionary of parsed CSS rules
         """
         rules = {}
-        
-        # Remove comments
-        css_content = re.sub(r'/\*.*?\*/', '', css_content, flags=re.DOTALL)
-        
-        # Find CSS rules with regex
-        rule_pattern = r'([^{]+)\{([^}]+)\}'
-        matches = re.finditer(rule_pattern, css_content, re.MULTILINE)
-        
-        for i, match in enumerate(matches):
-            selector = match.group(1).strip()
-            declarations = match.group(2).strip()
-            
+
+        if tinycss2 is not None:
+            parsed = (
+                (tinycss2.serialize(rule.prelude), tinycss2.serialize(rule.content))
+                for rule in tinycss2.parse_stylesheet(
+                    css_content, skip_comments=True, skip_whitespace=True)
+                if rule.type == 'qualified-rule'
+            )
+        else:
+            # Regex fallback: remove comments, then split on braces
+            css_content = _CSS_COMMENT_RE.sub('', css_content)
+            parsed = (
+                (match.group(1), match.group(2))
+                for match in _CSS_RULE_RE.finditer(css_content)
+            )
+
+        for i, (selector, declarations) in enumerate(parsed):
+            selector = selector.strip()
+            declarations = declarations.strip()
+
             if selector and declarations:
                 # Parse declarations
                 properties = self._parse_css_properties(declarations)
@@ -281,7 +317,7 @@ class ContentExtractor:
         style_elements = soup.find_all(attrs={'style': True})
         for element in style_elements:
             style = element['style']
-            bg_image_match = re.search(r'background-image\s*:\s*url\(["\']?([^"\']+)["\']?\)', style)
+            bg_image_match = _BG_IMAGE_RE.search(style)
             if bg_image_match:
                 media['background_images'].append({
                     'url': bg_image_match.group(1),
@@ -366,14 +402,17 @@ class ContentExtractor:
         # Extract JSON-LD
         json_ld_scripts = soup.find_all('script', type='application/ld+json')
         for script in json_ld_scripts:
+            content = script.get_text()
+            if not content or content.isspace():
+                continue
             try:
-                data = json.loads(script.get_text())
+                data = _json_loads(content)
                 structured_data.append({
                     'type': 'json-ld',
                     'data': data
                 })
-            except json.JSONDecodeError:
-                # Skip invalid JSON
+            except ValueError:
+                # Skip invalid JSON (both decoders raise ValueError subclasses)
                 pass
         
         # Extract microdata
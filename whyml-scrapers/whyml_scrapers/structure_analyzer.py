@@ -14,9 +14,63 @@ from bs4 import BeautifulSoup, Tag, NavigableString
 from whyml_core.utils import StringUtils
 
 
+class _PendingNode:
+    """Mutable per-element frame used by the iterative structure walk.
+
+    __slots__ keeps these roughly dict-free until the final structure is
+    assembled, which matters on pages with thousands of nodes.
+    """
+
+    __slots__ = ('element', 'items', 'text', 'structure')
+
+    def __init__(self, element: Tag):
+        self.element = element
+        self.items: List[Any] = []
+        self.text = ''
+        self.structure: Dict[str, Any] = {}
+
+
 class StructureAnalyzer:
     """Advanced HTML structure analyzer for WhyML manifest generation."""
-    
+
+    # Lookup tables shared by every walk; building these per visited
+    # node dominated allocation on large pages
+    _IMPORTANT_ATTRS = frozenset({
+        'id', 'class', 'role', 'data-*', 'aria-*', 'title', 'alt',
+        'href', 'src', 'type', 'name', 'value', 'placeholder',
+        'action', 'method', 'target', 'rel'
+    })
+
+    _SEMANTIC_ELEMENTS = {
+        'header': 'page_header',
+        'nav': 'navigation',
+        'main': 'main_content',
+        'section': 'content_section',
+        'article': 'article',
+        'aside': 'sidebar',
+        'footer': 'page_footer'
+    }
+
+    _CONTENT_PATTERNS = {
+        'hero': ('hero', 'banner', 'jumbotron'),
+        'card': ('card', 'tile', 'box'),
+        'list': ('list', 'items', 'collection'),
+        'form': ('form', 'contact', 'search'),
+        'media': ('media', 'gallery', 'carousel'),
+        'testimonial': ('testimonial', 'review', 'quote'),
+        'cta': ('cta', 'call-to-action', 'button-group'),
+        'feature': ('feature', 'highlight', 'benefit')
+    }
+
+    _LAYOUT_PATTERNS = {
+        'container': ('container', 'wrapper', 'content'),
+        'row': ('row', 'flex-row'),
+        'column': ('col', 'column', 'flex-col'),
+        'grid': ('grid', 'grid-container'),
+        'sidebar': ('sidebar', 'aside', 'secondary'),
+        'panel': ('panel', 'widget', 'module')
+    }
+
     def __init__(self):
         """Initialize structure analyzer."""
         self.ignored_tags = {'script', 'style', 'meta', 'link', 'title'}
@@ -41,47 +95,97 @@ class StructureAnalyzer:
         return self._convert_element_to_structure(element)
     
     def _convert_element_to_structure(self, element: Tag) -> Dict[str, Any]:
-        """Convert HTML element to WhyML structure format recursively.
-        
+        """Convert HTML element to WhyML structure format.
+
+        The walk is an explicit two-phase stack traversal rather than
+        recursion: phase one gathers each element's interleaved text and
+        child frames, phase two assembles structure dicts bottom-up (a
+        child frame is always created after its parent, so reversed
+        creation order finalizes children first). This avoids Python
+        call overhead per depth level and recursion limits on deeply
+        nested pages.
+
         Args:
             element: HTML element to convert
-            
+
         Returns:
             Structure dictionary
         """
         if not isinstance(element, Tag):
             return {}
-        
+
         # Skip ignored tags
         if element.name in self.ignored_tags:
             return {}
-        
-        structure = {
-            'tag': element.name,
-        }
-        
-        # Extract attributes
-        attrs = self._extract_attributes(element)
-        if attrs:
-            structure['attributes'] = attrs
-        
-        # Extract text content and children
-        content = self._extract_content(element)
-        if content:
-            if isinstance(content, str):
-                structure['content'] = content
-            elif isinstance(content, list) and len(content) == 1 and isinstance(content[0], str):
-                structure['content'] = content[0]
-            else:
-                structure['children'] = content
-        
-        # Add semantic information
-        semantic_info = self._analyze_semantic_role(element)
-        if semantic_info:
-            structure['semantic'] = semantic_info
-        
-        return structure
-    
+
+        ignored_tags = self.ignored_tags
+
+        root = _PendingNode(element)
+        stack = [root]
+        order = [root]
+
+        # Phase one: collect text runs and child frames per element
+        while stack:
+            pending = stack.pop()
+            items = pending.items
+            text_content = ''
+
+            for child in pending.element.children:
+                if isinstance(child, NavigableString):
+                    # Handle text content (NavigableString is a str subclass)
+                    text = child.strip()
+                    if text:
+                        # If we already have children, add text as separate item
+                        if items:
+                            items.append({'type': 'text', 'content': text})
+                        else:
+                            text_content += text
+
+                elif isinstance(child, Tag) and child.name not in ignored_tags:
+                    # If we have accumulated text, add it first
+                    if text_content:
+                        items.append({'type': 'text', 'content': text_content})
+                        text_content = ''
+
+                    child_pending = _PendingNode(child)
+                    items.append(child_pending)
+                    stack.append(child_pending)
+                    order.append(child_pending)
+
+            # Handle remaining text content (already stripped on accumulation)
+            if text_content and items:
+                items.append({'type': 'text', 'content': text_content})
+                text_content = ''
+
+            pending.text = text_content
+
+        # Phase two: assemble structures bottom-up
+        for pending in reversed(order):
+            el = pending.element
+            structure = {
+                'tag': el.name,
+            }
+
+            attrs = self._extract_attributes(el)
+            if attrs:
+                structure['attributes'] = attrs
+
+            if pending.items:
+                structure['children'] = [
+                    item.structure if isinstance(item, _PendingNode) else item
+                    for item in pending.items
+                ]
+            elif pending.text:
+                structure['content'] = StringUtils.clean_text(pending.text)
+
+            semantic_info = self._analyze_semantic_role(el)
+            if semantic_info:
+                structure['semantic'] = semantic_info
+
+            pending.structure = structure
+
+        return root.structure
+
     def _extract_attributes(self, element: Tag) -> Dict[str, Any]:
         """Extract and filter element attributes.
         
@@ -92,14 +196,10 @@ class StructureAnalyzer:
             Filtered attributes dictionary
         """
         attrs = {}
-        
+
         # Important attributes to preserve
-        important_attrs = {
-            'id', 'class', 'role', 'data-*', 'aria-*', 'title', 'alt',
-            'href', 'src', 'type', 'name', 'value', 'placeholder',
-            'action', 'method', 'target', 'rel'
-        }
-        
+        important_attrs = self._IMPORTANT_ATTRS
+
         for attr_name, attr_value in element.attrs.items():
             # Check if attribute should be preserved
             if (attr_name in important_attrs or 
@@ -114,55 +214,6 @@ class StructureAnalyzer:
         
         return attrs
     
-    def _extract_content(self, element: Tag) -> Union[str, List[Any], None]:
-        """Extract content from element (text and children).
-        
-        Args:
-            element: HTML element
-            
-        Returns:
-            Content as string, list of children, or None
-        """
-        children = []
-        text_content = ""
-        
-        for child in element.children:
-            if isinstance(child, NavigableString):
-                # Handle text content
-                text = str(child).strip()
-                if text:
-                    # If we already have children, add text as separate item
-                    if children:
-                        children.append({'type': 'text', 'content': text})
-                    else:
-                        text_content += text
-            
-            elif isinstance(child, Tag) and child.name not in self.ignored_tags:
-                # Handle child elements
-                if text_content.strip():
-                    # If we have accumulated text, add it first
-                    children.append({'type': 'text', 'content': text_content.strip()})
-                    text_content = ""
-                
-                # Process child element
-                child_structure = self._convert_element_to_structure(child)
-                if child_structure:
-                    children.append(child_structure)
-        
-        # Handle remaining text content
-        if text_content.strip() and not children:
-            return StringUtils.clean_text(text_content)
-        elif text_content.strip() and children:
-            children.append({'type': 'text', 'content': text_content.strip()})
-        
-        # Return appropriate content format
-        if children:
-            return children
-        elif text_content.strip():
-            return StringUtils.clean_text(text_content)
-        else:
-            return None
-    
     def _analyze_semantic_role(self, element: Tag) -> Optional[Dict[str, Any]]:
         """Analyze semantic role and meaning of element.
         
@@ -173,18 +224,10 @@ class StructureAnalyzer:
             Semantic information dictionary
         """
         semantic = {}
-        
+
         # HTML5 semantic elements
-        semantic_elements = {
-            'header': 'page_header',
-            'nav': 'navigation',
-            'main': 'main_content',
-            'section': 'content_section',
-            'article': 'article',
-            'aside': 'sidebar',
-            'footer': 'page_footer'
-        }
-        
+        semantic_elements = self._SEMANTIC_ELEMENTS
+
         if element.name in semantic_elements:
             semantic['role'] = semantic_elements[element.name]
         
@@ -217,20 +260,8 @@ class StructureAnalyzer:
         # Check classes for content type hints
         classes = element.get('class', [])
         class_string = ' '.join(classes).lower() if classes else ''
-        
-        # Content type patterns
-        content_patterns = {
-            'hero': ['hero', 'banner', 'jumbotron'],
-            'card': ['card', 'tile', 'box'],
-            'list': ['list', 'items', 'collection'],
-            'form': ['form', 'contact', 'search'],
-            'media': ['media', 'gallery', 'carousel'],
-            'testimonial': ['testimonial', 'review', 'quote'],
-            'cta': ['cta', 'call-to-action', 'button-group'],
-            'feature': ['feature', 'highlight', 'benefit']
-        }
-        
-        for content_type, patterns in content_patterns.items():
+
+        for content_type, patterns in self._CONTENT_PATTERNS.items():
             if any(pattern in class_string for pattern in patterns):
                 return content_type
         
@@ -257,18 +288,8 @@ class StructureAnalyzer:
         """
         classes = element.get('class', [])
         class_string = ' '.join(classes).lower() if classes else ''
-        
-        # Layout patterns
-        layout_patterns = {
-            'container': ['container', 'wrapper', 'content'],
-            'row': ['row', 'flex-row'],
-            'column': ['col', 'column', 'flex-col'],
-            'grid': ['grid', 'grid-container'],
-            'sidebar': ['sidebar', 'aside', 'secondary'],
-            'panel': ['panel', 'widget', 'module']
-        }
-        
-        for layout_role, patterns in layout_patterns.items():
+
+        for layout_role, patterns in self._LAYOUT_PATTERNS.items():
             if any(pattern in class_string for pattern in patterns):
                 return layout_role
         
@@ -281,34 +302,48 @@ class StructureAnalyzer:
     
     def _simplify_structure(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Simplify structure by removing unnecessary nesting.
-        
+
+        Iterative: wrapper chains are collapsed in a loop and children
+        processed from an explicit stack, so deeply nested pages cost
+        neither a frame per level nor a RecursionError.
+
         Args:
             structure: Structure dictionary
-            
+
         Returns:
             Simplified structure
         """
         if not isinstance(structure, dict):
             return structure
-        
-        # If element has only one child and no meaningful attributes
-        if (structure.get('children') and 
-            len(structure['children']) == 1 and
-            not structure.get('attributes') and
-            structure.get('tag') == 'div'):
-            
-            child = structure['children'][0]
-            if isinstance(child, dict) and child.get('tag'):
-                return self._simplify_structure(child)
-        
-        # Recursively simplify children
-        if structure.get('children'):
-            structure['children'] = [
-                self._simplify_structure(child) if isinstance(child, dict) else child
-                for child in structure['children']
-            ]
-        
-        return structure
+
+        def collapse(node: Dict[str, Any]) -> Dict[str, Any]:
+            # Unwrap attribute-less divs that hold a single element child
+            while (node.get('tag') == 'div' and
+                   not node.get('attributes') and
+                   node.get('children') and
+                   len(node['children']) == 1):
+                child = node['children'][0]
+                if isinstance(child, dict) and child.get('tag'):
+                    node = child
+                else:
+                    break
+            return node
+
+        root = collapse(structure)
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            children = node.get('children')
+            if children:
+                node['children'] = [
+                    collapse(child) if isinstance(child, dict) else child
+                    for child in children
+                ]
+                for child in node['children']:
+                    if isinstance(child, dict):
+                        stack.append(child)
+
+        return root
     
     def _calculate_structure_metrics(self, structure: Dict[str, Any]) -> Dict[str, Any]:
         """Calculate metrics about the structure.
@@ -9,12 +9,59 @@ Licensed under the Apache License, Version 2.0
 """
 
 import re
+import weakref
+from collections import Counter
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Set
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 from bs4 import BeautifulSoup, Tag
 
 from whyml_core.utils import StringUtils
 
+# Detector patterns compiled once at import; these run against every
+# analyzed page, so per-call re.compile would dominate detection cost
+_BLOG_CLASS_RE = re.compile(r'post|blog|entry', re.I)
+_ECOMMERCE_CLASS_RE = re.compile(r'product|price|cart|buy|shop', re.I)
+_ECOMMERCE_BUTTON_RE = re.compile(r'add to cart|buy now', re.I)
+_LANDING_FORM_RE = re.compile(r'contact|subscribe|signup', re.I)
+_LANDING_CLASS_RE = re.compile(r'hero|cta|landing', re.I)
+_PORTFOLIO_CLASS_RE = re.compile(r'portfolio|gallery|work', re.I)
+_NAV_CLASS_RE = re.compile(r'main|primary|navigation', re.I)
+
+# Layout-framework and responsive-breakpoint detection over a single
+# joined class string instead of per-element scans
+_FRAMEWORK_NAME_RE = re.compile(r'\b(bootstrap|tailwind|bulma|foundation)\b', re.I)
+_BOOTSTRAP_CLASS_RE = re.compile(
+    r'\b(?:btn(?:-\w+)?|col-(?:sm|md|lg|xl|xxl)(?:-\d+)?|container(?:-fluid)?|'
+    r'row|navbar(?:-\w+)?|d-(?:none|block|flex|inline)|card-body)\b'
+)
+_TAILWIND_CLASS_RE = re.compile(r'\b(?:[mp][txyblr]?-\d+|text-\w+-\d{3}|bg-\w+-\d{3}|w-\d+|h-\d+)\b')
+_BREAKPOINT_RE = re.compile(r'\b(?:col|d|flex|grid|text)-(sm|md|lg|xl|xxl)\b')
+
+_HEADING_TAGS = frozenset({'h1', 'h2', 'h3', 'h4', 'h5', 'h6'})
+_SEMANTIC_TAGS = frozenset({
+    'header', 'nav', 'main', 'section', 'article', 'aside', 'footer'
+})
+_SKIP_LINK_RE = re.compile(r'#.*skip|#main', re.I)
+
+
+@lru_cache(maxsize=4096)
+def _parse_url(url: str) -> Dict[str, Any]:
+    """Split a URL into the fields _analyze_url_structure reports.
+
+    urlsplit skips the params field urlparse computes, and the same
+    hosts and paths recur constantly when crawling a site, so results
+    are memoized per URL string.
+    """
+    parts = urlsplit(url)
+    return {
+        'domain': parts.netloc,
+        'scheme': parts.scheme,
+        'is_secure': parts.scheme == 'https',
+        'has_query_params': bool(parts.query),
+        'path_segments': [segment for segment in parts.path.split('/') if segment]
+    }
+
 
 class WebpageAnalyzer:
     """Comprehensive webpage analyzer for content and structure assessment."""
@@ -49,7 +96,9 @@ class WebpageAnalyzer:
         self.sections = sections or []
         self.min_content_length = min_content_length
         self.analyze_accessibility = analyze_accessibility
-    
+        # Single-entry accumulator cache; see _single_pass
+        self._pass_cache: Dict[int, Any] = {}
+
     async def analyze_page(self, url: str, soup: BeautifulSoup) -> Dict[str, Any]:
         """Perform comprehensive page analysis.
         
@@ -71,161 +120,479 @@ class WebpageAnalyzer:
         
         return analysis
     
-    async def analyze_webpage(self, url: str, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Analyze webpage - alias for analyze_page method.
-        
+    def analyze_webpage(self, soup: BeautifulSoup, url: Optional[str] = None) -> Dict[str, Any]:
+        """Analyze a parsed webpage structure, layout and accessibility.
+
         Args:
-            url: Source URL
             soup: Parsed HTML
-            
+            url: Source URL (optional)
+
         Returns:
             Complete analysis results
         """
-        return await self.analyze_page(url, soup)
-    
+        # Populate the shared accumulator up front; every helper below
+        # then reads its slice instead of re-traversing the tree
+        self._single_pass(soup)
+
+        return {
+            'page_type': self._detect_page_type(soup),
+            'layout_structure': self._analyze_layout_structure(soup),
+            'content_sections': self._extract_content_sections(soup),
+            'semantic_structure': self._analyze_semantic_structure(soup),
+            'accessibility': self._analyze_accessibility(soup),
+            'navigation': self._find_navigation_elements(soup),
+            'media_elements': self._analyze_media_elements(soup),
+            'optimization_suggestions': self._generate_optimization_suggestions(soup),
+            'content_stats': self._analyze_content_statistics(soup),
+            'seo_analysis': self._analyze_seo(soup),
+            'structure_complexity': self._analyze_structure_complexity(soup),
+            'performance_hints': self._analyze_performance(soup)
+        }
+
+    def _single_pass(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Walk the tree once and accumulate metrics shared by the analyzers.
+
+        analyze_webpage fans out into around eight helpers which would each
+        run their own full traversal; fusing them into one find_all(True)
+        pass makes a complete analysis cost a single walk. The accumulator
+        is cached per soup identity, guarded by a weak reference so a
+        recycled id can never alias a different document.
+        """
+        cached = self._pass_cache.get(id(soup))
+        if cached is not None and cached[0]() is soup:
+            return cached[1]
+
+        headings: Counter = Counter()
+        roles: Counter = Counter()
+        semantic_elements: Counter = Counter()
+        nav_elements: List[Tag] = []
+        section_elements: List[Tag] = []
+        class_parts: List[str] = []
+        table_elements: List[Tag] = []
+        images_with_alt = 0
+        images_with_nonempty_alt = 0
+        images_without_alt = 0
+        images_without_loading = 0
+        video_count = 0
+        audio_count = 0
+        inline_style_count = 0
+        aria_label_count = 0
+        skip_link_count = 0
+        form_input_count = 0
+        form_label_count = 0
+        has_lang_attribute = False
+        main_element: Optional[Tag] = None
+        total_elements = 0
+        paragraph_count = 0
+        div_count = 0
+        list_count = 0
+        form_count = 0
+        link_count = 0
+        internal_links = 0
+        external_links = 0
+        stylesheet_count = 0
+        script_src_count = 0
+        title_text: Optional[str] = None
+        meta_description: Optional[str] = None
+        meta_robots: Optional[str] = None
+        canonical_url: Optional[str] = None
+
+        for element in soup.find_all(True):
+            name = element.name
+            attrs = element.attrs
+            total_elements += 1
+
+            if name in _HEADING_TAGS:
+                headings[name] += 1
+            if name in _SEMANTIC_TAGS:
+                semantic_elements[name] += 1
+
+            if name == 'div':
+                div_count += 1
+            elif name == 'a':
+                href = attrs.get('href')
+                if href:
+                    link_count += 1
+                    if href.startswith(('http://', 'https://')):
+                        external_links += 1
+                    else:
+                        internal_links += 1
+                    if _SKIP_LINK_RE.search(href):
+                        skip_link_count += 1
+            elif name == 'p':
+                paragraph_count += 1
+            elif name == 'img':
+                alt = attrs.get('alt')
+                if alt is not None:
+                    images_with_alt += 1
+                    if alt:
+                        images_with_nonempty_alt += 1
+                else:
+                    images_without_alt += 1
+                if 'loading' not in attrs:
+                    images_without_loading += 1
+            elif name == 'video':
+                video_count += 1
+            elif name == 'audio':
+                audio_count += 1
+            elif name == 'nav':
+                nav_elements.append(element)
+            elif name in ('article', 'section'):
+                section_elements.append(element)
+            elif name in ('ul', 'ol'):
+                list_count += 1
+            elif name == 'table':
+                table_elements.append(element)
+            elif name == 'form':
+                form_count += 1
+            elif name in ('input', 'textarea', 'select'):
+                form_input_count += 1
+            elif name == 'label':
+                form_label_count += 1
+            elif name == 'script':
+                if attrs.get('src'):
+                    script_src_count += 1
+            elif name == 'link':
+                rel = attrs.get('rel') or ()
+                if 'stylesheet' in rel:
+                    stylesheet_count += 1
+                if 'canonical' in rel and canonical_url is None and attrs.get('href'):
+                    canonical_url = attrs['href']
+            elif name == 'title':
+                if title_text is None:
+                    title_text = element.get_text()
+            elif name == 'meta':
+                meta_name = attrs.get('name')
+                content = attrs.get('content')
+                if content:
+                    if meta_name == 'description' and meta_description is None:
+                        meta_description = content
+                    elif meta_name == 'robots' and meta_robots is None:
+                        meta_robots = content
+            elif name == 'html' and attrs.get('lang'):
+                has_lang_attribute = True
+
+            role = attrs.get('role')
+            if role:
+                roles[role] += 1
+            if main_element is None and (name == 'main' or role == 'main'):
+                main_element = element
+
+            classes = attrs.get('class')
+            if classes:
+                class_parts.extend(classes)
+            if 'style' in attrs:
+                inline_style_count += 1
+            if 'aria-label' in attrs:
+                aria_label_count += 1
+
+        accumulator = {
+            'headings': headings,
+            'roles': roles,
+            'semantic_elements': semantic_elements,
+            'nav_elements': nav_elements,
+            'section_elements': section_elements,
+            'table_elements': table_elements,
+            'class_blob': ' '.join(class_parts),
+            'images_with_alt': images_with_alt,
+            'images_with_nonempty_alt': images_with_nonempty_alt,
+            'images_without_alt': images_without_alt,
+            'images_without_loading': images_without_loading,
+            'video_count': video_count,
+            'audio_count': audio_count,
+            'inline_style_count': inline_style_count,
+            'aria_label_count': aria_label_count,
+            'skip_link_count': skip_link_count,
+            'form_input_count': form_input_count,
+            'form_label_count': form_label_count,
+            'has_lang_attribute': has_lang_attribute,
+            'main_element': main_element,
+            'total_elements': total_elements,
+            'paragraph_count': paragraph_count,
+            'div_count': div_count,
+            'list_count': list_count,
+            'form_count': form_count,
+            'link_count': link_count,
+            'internal_links': internal_links,
+            'external_links': external_links,
+            'stylesheet_count': stylesheet_count,
+            'script_src_count': script_src_count,
+            'title_text': title_text,
+            'meta_description': meta_description,
+            'meta_robots': meta_robots,
+            'canonical_url': canonical_url
+        }
+
+        # Keep only the most recent document; analyses are soup-at-a-time
+        self._pass_cache = {id(soup): (weakref.ref(soup), accumulator)}
+        return accumulator
+
     def _detect_page_type(self, soup: BeautifulSoup) -> str:
         """Detect page type based on content patterns."""
         # Blog detection
-        if (soup.find('article') or 
-            soup.find(class_=re.compile(r'post|blog|entry', re.I)) or
+        if (soup.find('article') or
+            soup.find(class_=_BLOG_CLASS_RE) or
             soup.find('time', attrs={'datetime': True})):
             return 'blog'
-        
-        # E-commerce detection  
-        if (soup.find(class_=re.compile(r'product|price|cart|buy|shop', re.I)) or
-            soup.find('button', text=re.compile(r'add to cart|buy now', re.I))):
+
+        # E-commerce detection
+        if (soup.find(class_=_ECOMMERCE_CLASS_RE) or
+            soup.find('button', text=_ECOMMERCE_BUTTON_RE)):
             return 'e-commerce'
-        
+
         # Landing page detection
-        if (soup.find('form', action=re.compile(r'contact|subscribe|signup', re.I)) or
-            soup.find(class_=re.compile(r'hero|cta|landing', re.I))):
+        if (soup.find('form', action=_LANDING_FORM_RE) or
+            soup.find(class_=_LANDING_CLASS_RE)):
             return 'landing'
-        
+
         # Portfolio detection
-        if (soup.find(class_=re.compile(r'portfolio|gallery|work', re.I)) or
+        if (soup.find(class_=_PORTFOLIO_CLASS_RE) or
             len(soup.find_all('img')) > 10):
             return 'portfolio'
-        
+
         # Corporate website
-        if soup.find('nav', class_=re.compile(r'main|primary|navigation', re.I)):
+        if soup.find('nav', class_=_NAV_CLASS_RE):
             return 'website'
-        
+
         return 'unknown'
+
+    def _collect_class_blob(self, soup: BeautifulSoup) -> str:
+        """Join every class attribute on the page into one string.
+
+        The framework/breakpoint detectors run their compiled regexes
+        against this blob once instead of scanning per element.
+        """
+        return self._single_pass(soup)['class_blob']
+
+    def _analyze_layout_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Analyze the page's top-level layout regions."""
+        accumulator = self._single_pass(soup)
+        semantic_elements = accumulator['semantic_elements']
+        roles = accumulator['roles']
+        main_element = accumulator['main_element']
+
+        return {
+            'has_header': semantic_elements['header'] > 0 or roles['banner'] > 0,
+            'has_footer': semantic_elements['footer'] > 0 or roles['contentinfo'] > 0,
+            'has_navigation': bool(accumulator['nav_elements']) or roles['navigation'] > 0,
+            'layout_type': self._detect_layout_type(soup),
+            'main_content_area': main_element.name if main_element is not None else None
+        }
+
+    def _extract_content_sections(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """Extract content sections with substantial text."""
+        accumulator = self._single_pass(soup)
+        candidates = accumulator['section_elements']
+        if not candidates and accumulator['main_element'] is not None:
+            candidates = [accumulator['main_element']]
+
+        sections = []
+        for element in candidates:
+            text = element.get_text(separator=' ', strip=True)
+            if len(text) < self.min_content_length:
+                continue
+            heading = element.find(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
+            sections.append({
+                'tag': element.name,
+                'heading': heading.get_text(strip=True) if heading else None,
+                'text_length': len(text)
+            })
+        return sections
+
+    def _find_navigation_elements(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Locate navigation elements and summarize their link structure."""
+        accumulator = self._single_pass(soup)
+
+        navs = []
+        main_nav = None
+        for nav in accumulator['nav_elements']:
+            info = {
+                'tag': nav.name,
+                'classes': nav.get('class', []),
+                'links_count': len(nav.find_all('a', href=True))
+            }
+            navs.append(info)
+            if main_nav is None and (
+                    nav.get('role') == 'navigation' or
+                    _NAV_CLASS_RE.search(' '.join(info['classes']))):
+                main_nav = info
+
+        if main_nav is None and navs:
+            main_nav = navs[0]
+
+        return {
+            'main_nav': main_nav,
+            'nav_count': len(navs),
+            'all_navs': navs
+        }
+
+    def _analyze_media_elements(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Summarize media usage on the page."""
+        accumulator = self._single_pass(soup)
+        images_with_alt = accumulator['images_with_alt']
+        images_without_alt = accumulator['images_without_alt']
+
+        return {
+            'images': {
+                'count': images_with_alt + images_without_alt,
+                'has_alt_text': images_with_alt,
+                'missing_alt_text': images_without_alt
+            },
+            'videos': {'count': accumulator['video_count']},
+            'audio': {'count': accumulator['audio_count']}
+        }
+
+    def _analyze_url_structure(self, url: str) -> Dict[str, Any]:
+        """Analyze the structure of a page URL."""
+        # Copy so callers embedding the result in manifests cannot
+        # mutate the memoized entry
+        cached = _parse_url(url)
+        return {**cached, 'path_segments': list(cached['path_segments'])}
+
+    def _detect_component_patterns(self, soup: BeautifulSoup) -> List[Dict[str, Any]]:
+        """Detect repeated component patterns from class usage.
+
+        A class appearing on several elements usually marks a repeated
+        component (cards, list items, product tiles). Counting happens in
+        one Counter pass over the class tokens gathered by _single_pass,
+        so no extra traversal is needed.
+        """
+        accumulator = self._single_pass(soup)
+        counts = Counter(accumulator['class_blob'].split())
+
+        return [
+            {'pattern': cls, 'count': count}
+            for cls, count in counts.most_common()
+            if count >= 2
+        ]
+
+    def _generate_optimization_suggestions(self, soup: BeautifulSoup) -> List[str]:
+        """Generate structural and accessibility improvement suggestions."""
+        accumulator = self._single_pass(soup)
+        suggestions = []
+
+        h1_count = accumulator['headings']['h1']
+        if h1_count == 0:
+            suggestions.append("Add an h1 tag to establish the page topic")
+        elif h1_count > 1:
+            suggestions.append(f"Use a single h1 tag instead of {h1_count}")
+
+        if accumulator['images_without_alt']:
+            suggestions.append(
+                f"Add alt text to {accumulator['images_without_alt']} images")
+
+        if accumulator['inline_style_count']:
+            suggestions.append(
+                f"Move {accumulator['inline_style_count']} inline styles into stylesheets")
+
+        if not accumulator['has_lang_attribute']:
+            suggestions.append("Declare a lang attribute on the html element")
+
+        return suggestions
+
+    def _detect_layout_type(self, soup: BeautifulSoup) -> str:
+        """Detect the CSS framework/layout system used by the page."""
+        class_blob = self._collect_class_blob(soup)
+
+        # Explicit framework names win over heuristics
+        match = _FRAMEWORK_NAME_RE.search(class_blob)
+        if match:
+            return match.group(1).lower()
+
+        if _BOOTSTRAP_CLASS_RE.search(class_blob):
+            return 'bootstrap'
+        if _TAILWIND_CLASS_RE.search(class_blob):
+            return 'tailwind'
+
+        return 'custom'
+
+    def _detect_responsive_breakpoints(self, soup: BeautifulSoup) -> List[str]:
+        """Detect responsive breakpoints referenced by utility classes."""
+        class_blob = self._collect_class_blob(soup)
+        order = {'sm': 0, 'md': 1, 'lg': 2, 'xl': 3, 'xxl': 4}
+        return sorted(set(_BREAKPOINT_RE.findall(class_blob)), key=order.get)
     
+    def _analyze_semantic_structure(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Analyze semantic HTML usage (headings, landmarks, HTML5 tags).
+
+        Counts come from the shared _single_pass accumulator rather than
+        one find_all per tag of interest.
+        """
+        accumulator = self._single_pass(soup)
+        heading_counts = accumulator['headings']
+
+        return {
+            'heading_structure': {
+                'count_by_level': dict(heading_counts),
+                'total_count': sum(heading_counts.values())
+            },
+            'landmark_roles': dict(accumulator['roles']),
+            'semantic_elements': dict(accumulator['semantic_elements'])
+        }
+
     def _analyze_content_statistics(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Analyze content statistics."""
+        accumulator = self._single_pass(soup)
         text_content = soup.get_text()
-        
-        stats = {
-            'word_count': StringUtils.count_words(text_content),
+
+        # Tokenize the page text once; calculate_reading_time would run
+        # the same word-extraction regex over the full document again
+        word_count = StringUtils.count_words(text_content)
+
+        return {
+            'word_count': word_count,
             'character_count': len(text_content),
-            'paragraph_count': len(soup.find_all('p')),
-            'heading_count': len(soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])),
-            'link_count': len(soup.find_all('a', href=True)),
-            'image_count': len(soup.find_all('img')),
-            'list_count': len(soup.find_all(['ul', 'ol'])),
-            'table_count': len(soup.find_all('table')),
-            'form_count': len(soup.find_all('form')),
-            'reading_time': StringUtils.calculate_reading_time(text_content)
+            'paragraph_count': accumulator['paragraph_count'],
+            'heading_count': sum(accumulator['headings'].values()),
+            'link_count': accumulator['link_count'],
+            'image_count': accumulator['images_with_alt'] + accumulator['images_without_alt'],
+            'list_count': accumulator['list_count'],
+            'table_count': len(accumulator['table_elements']),
+            'form_count': accumulator['form_count'],
+            # StringUtils.calculate_reading_time at its default 200 wpm,
+            # reusing the word count computed above
+            'reading_time': max(1, round(word_count / 200))
         }
-        
-        return stats
     
     def _analyze_seo(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Analyze SEO factors."""
-        seo = {
-            'title_length': 0,
-            'meta_description_length': 0,
-            'has_h1': False,
-            'h1_count': 0,
-            'heading_structure': {},
-            'alt_text_coverage': 0.0,
-            'internal_links': 0,
-            'external_links': 0,
-            'canonical_url': None,
-            'meta_robots': None,
+        accumulator = self._single_pass(soup)
+        headings = accumulator['headings']
+        title_text = accumulator['title_text']
+        meta_description = accumulator['meta_description']
+        image_count = accumulator['images_with_alt'] + accumulator['images_without_alt']
+
+        return {
+            'title_length': len(title_text.strip()) if title_text else 0,
+            'meta_description_length': len(meta_description) if meta_description else 0,
+            'has_h1': headings['h1'] > 0,
+            'h1_count': headings['h1'],
+            'heading_structure': {f'h{i}': headings[f'h{i}'] for i in range(1, 7)},
+            'alt_text_coverage': (
+                accumulator['images_with_nonempty_alt'] / image_count
+                if image_count else 0.0
+            ),
+            'internal_links': accumulator['internal_links'],
+            'external_links': accumulator['external_links'],
+            'canonical_url': accumulator['canonical_url'],
+            'meta_robots': accumulator['meta_robots'],
             'structured_data': []
         }
-        
-        # Title analysis
-        title_tag = soup.find('title')
-        if title_tag:
-            seo['title_length'] = len(title_tag.get_text().strip())
-        
-        # Meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            seo['meta_description_length'] = len(meta_desc['content'])
-        
-        # Heading analysis
-        h1_tags = soup.find_all('h1')
-        seo['has_h1'] = len(h1_tags) > 0
-        seo['h1_count'] = len(h1_tags)
-        
-        for i in range(1, 7):
-            headings = soup.find_all(f'h{i}')
-            seo['heading_structure'][f'h{i}'] = len(headings)
-        
-        # Image alt text coverage
-        images = soup.find_all('img')
-        if images:
-            images_with_alt = len([img for img in images if img.get('alt')])
-            seo['alt_text_coverage'] = images_with_alt / len(images)
-        
-        # Link analysis
-        links = soup.find_all('a', href=True)
-        for link in links:
-            href = link['href']
-            if href.startswith(('http://', 'https://')):
-                seo['external_links'] += 1
-            else:
-                seo['internal_links'] += 1
-        
-        # Canonical URL
-        canonical = soup.find('link', rel='canonical')
-        if canonical and canonical.get('href'):
-            seo['canonical_url'] = canonical['href']
-        
-        # Meta robots
-        meta_robots = soup.find('meta', attrs={'name': 'robots'})
-        if meta_robots and meta_robots.get('content'):
-            seo['meta_robots'] = meta_robots['content']
-        
-        return seo
     
     def _analyze_accessibility(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Analyze accessibility factors."""
-        accessibility = {
-            'has_lang_attribute': False,
-            'images_with_alt': 0,
-            'images_without_alt': 0,
-            'form_labels': 0,
-            'form_inputs': 0,
+        accumulator = self._single_pass(soup)
+
+        return {
+            'has_lang_attribute': accumulator['has_lang_attribute'],
+            'images_with_alt': accumulator['images_with_alt'],
+            'images_without_alt': accumulator['images_without_alt'],
+            'form_labels': accumulator['form_label_count'],
+            'form_inputs': accumulator['form_input_count'],
             'heading_hierarchy_issues': [],
-            'aria_labels': len(soup.find_all(attrs={'aria-label': True})),
-            'skip_links': len(soup.find_all('a', href=re.compile(r'#.*skip|#main', re.I)))
+            'aria_labels': accumulator['aria_label_count'],
+            'skip_links': accumulator['skip_link_count']
         }
-        
-        # Language attribute
-        html_tag = soup.find('html')
-        if html_tag and html_tag.get('lang'):
-            accessibility['has_lang_attribute'] = True
-        
-        # Image alt text
-        images = soup.find_all('img')
-        for img in images:
-            if img.get('alt') is not None:
-                accessibility['images_with_alt'] += 1
-            else:
-                accessibility['images_without_alt'] += 1
-        
-        # Form accessibility
-        inputs = soup.find_all(['input', 'textarea', 'select'])
-        labels = soup.find_all('label')
-        accessibility['form_inputs'] = len(inputs)
-        accessibility['form_labels'] = len(labels)
-        
-        return accessibility
     
     def _analyze_structure_complexity(self, soup: BeautifulSoup) -> Dict[str, Any]:
         """Analyze structure complexity metrics."""
@@ -252,44 +619,38 @@ class WebpageAnalyzer:
         depth = calculate_depth(body)
         complexity['max_depth'] = depth
         complexity['max_nesting_depth'] = depth  # Same value, different name for compatibility
-        
-        # Element counts
-        complexity['total_elements'] = len(soup.find_all())
-        complexity['div_count'] = len(soup.find_all('div'))
-        
-        # Semantic elements
-        semantic_tags = ['header', 'nav', 'main', 'section', 'article', 'aside', 'footer']
-        complexity['semantic_elements'] = len(soup.find_all(semantic_tags))
-        
-        # Nested tables
-        tables = soup.find_all('table')
-        complexity['nested_tables'] = sum(1 for table in tables if table.find('table'))
-        
+
+        # Element counts from the shared single-pass accumulator
+        accumulator = self._single_pass(soup)
+        complexity['total_elements'] = accumulator['total_elements']
+        complexity['div_count'] = accumulator['div_count']
+        complexity['semantic_elements'] = sum(accumulator['semantic_elements'].values())
+        complexity['nested_tables'] = sum(
+            1 for table in accumulator['table_elements'] if table.find('table')
+        )
+
         return complexity
     
     def _analyze_performance(self, soup: BeautifulSoup) -> List[str]:
         """Generate performance optimization hints."""
+        accumulator = self._single_pass(soup)
         hints = []
-        
+
         # Image optimization
-        images = soup.find_all('img')
-        large_images = [img for img in images if not img.get('loading')]
-        if large_images:
-            hints.append(f"Consider lazy loading for {len(large_images)} images")
-        
+        if accumulator['images_without_loading']:
+            hints.append(
+                f"Consider lazy loading for {accumulator['images_without_loading']} images")
+
         # CSS optimization
-        stylesheets = soup.find_all('link', rel='stylesheet')
-        if len(stylesheets) > 5:
-            hints.append(f"Consider combining {len(stylesheets)} CSS files")
-        
+        if accumulator['stylesheet_count'] > 5:
+            hints.append(f"Consider combining {accumulator['stylesheet_count']} CSS files")
+
         # JavaScript optimization
-        scripts = soup.find_all('script', src=True)
-        if len(scripts) > 10:
-            hints.append(f"Consider optimizing {len(scripts)} script files")
-        
+        if accumulator['script_src_count'] > 10:
+            hints.append(f"Consider optimizing {accumulator['script_src_count']} script files")
+
         # Inline styles
-        inline_styles = soup.find_all(attrs={'style': True})
-        if len(inline_styles) > 20:
-            hints.append(f"Reduce {len(inline_styles)} inline styles")
-        
+        if accumulator['inline_style_count'] > 20:
+            hints.append(f"Reduce {accumulator['inline_style_count']} inline styles")
+
         return hints
@@ -8,6 +8,8 @@ Copyright 2025 Tom Sapletta
 Licensed under the Apache License, Version 2.0
 """
 
+import importlib
+
 __version__ = "1.0.0"
 __author__ = "Tom Sapletta"
 __email__ = "info@softreck.dev"
@@ -24,21 +26,49 @@ from whyml_core.exceptions import (
     LoaderError
 )
 
-# Converter imports from whyml-converters
-from whyml_converters import (
-    HTMLConverter,
-    ReactConverter,
-    VueConverter,
-    PHPConverter,
-    BaseConverter,
-    ConversionResult
-)
+# Fast JSON serialization helper
+from .utils import dumps
+
+# Converters, scrapers and the processor pull in aiohttp, bs4, lxml and
+# the template engines transitively; resolving them on first attribute
+# access (PEP 562) keeps `import whyml` cheap for users who only need
+# manifest loading/processing
+_LAZY = {
+    # Converters from whyml-converters
+    'HTMLConverter': ('whyml_converters', 'HTMLConverter'),
+    'ReactConverter': ('whyml_converters', 'ReactConverter'),
+    'VueConverter': ('whyml_converters', 'VueConverter'),
+    'PHPConverter': ('whyml_converters', 'PHPConverter'),
+    'BaseConverter': ('whyml_converters', 'BaseConverter'),
+    'ConversionResult': ('whyml_converters', 'ConversionResult'),
+
+    # Scrapers from whyml-scrapers
+    'URLScraper': ('whyml_scrapers', 'URLScraper'),
+    'WebpageAnalyzer': ('whyml_scrapers', 'WebpageAnalyzer'),
+
+    # Main processor
+    'WhyMLProcessor': ('whyml.processor', 'WhyMLProcessor'),
+    'convert_manifest': ('whyml.processor', 'convert_manifest'),
+    'scrape_and_convert': ('whyml.processor', 'scrape_and_convert'),
+
+    # ASCII logo
+    'LOGO': ('whyml._logo', 'LOGO'),
+}
+
 
-# Scraper imports from whyml-scrapers
-from whyml_scrapers import URLScraper, WebpageAnalyzer
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # cache so later lookups skip this hook
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-# Main processor
-from .processor import WhyMLProcessor, convert_manifest, scrape_and_convert
 
 # Main API
 __all__ = [
@@ -46,30 +76,31 @@ __all__ = [
     'WhyMLProcessor',
     'convert_manifest',
     'scrape_and_convert',
-    
+    'dumps',
+
     # Core classes
     'ManifestLoader',
     'ManifestProcessor',
-    
+
     # Converters
     'HTMLConverter',
-    'ReactConverter', 
+    'ReactConverter',
     'VueConverter',
     'PHPConverter',
     'BaseConverter',
     'ConversionResult',
-    
+
     # Scrapers
     'URLScraper',
     'WebpageAnalyzer',
-    
+
     # Exceptions
     'WhyMLError',
     'ManifestError',
     'ValidationError',
     'ConversionError',
     'LoaderError',
-    
+
     # Metadata
     '__version__',
     '__author__',
@@ -77,25 +108,6 @@ __all__ = [
     '__license__',
 ]
 
-# ASCII Logo
-LOGO = """
-╔═══════════════════════════════════════════════════════════╗
-║                                                           ║
-║  🎯 WhyML - Advanced YAML Manifest System               ║
-║  Modern Web Development Framework                         ║
-║                                                           ║
-║  ┌─────────────┐    ┌─────────────┐    ┌─────────────┐  ║
-║  │    YAML     │───▶│  MANIFEST   │───▶│   OUTPUT    │  ║
-║  │  MANIFESTS  │    │  PROCESSOR  │    │   FORMATS   │  ║
-║  └─────────────┘    └─────────────┘    └─────────────┘  ║
-║       │                     │                   │       ║
-║  ┌────▼────┐           ┌────▼────┐         ┌────▼────┐  ║
-║  │Templates│           │Modules  │         │HTML/CSS │  ║
-║  │& Styles │           │& Imports│         │React/Vue│  ║
-║  │Inherit. │           │Python   │         │PHP/JSON │  ║
-║  └─────────┘           └─────────┘         └─────────┘  ║
-╚═══════════════════════════════════════════════════════════╝
-"""
 
 def get_version():
     """Get the current version of WhyML."""
@@ -103,4 +115,5 @@ def get_version():
 
 def show_logo():
     """Display the WhyML ASCII logo."""
+    from ._logo import LOGO
     print(LOGO)
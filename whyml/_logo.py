@@ -0,0 +1,25 @@
+"""
+WhyML ASCII Logo - loaded on demand by show_logo()
+
+Copyright 2025 Tom Sapletta
+Licensed under the Apache License, Version 2.0
+"""
+
+LOGO = """
+╔═══════════════════════════════════════════════════════════╗
+║                                                           ║
+║  🎯 WhyML - Advanced YAML Manifest System               ║
+║  Modern Web Development Framework                         ║
+║                                                           ║
+║  ┌─────────────┐    ┌─────────────┐    ┌─────────────┐  ║
+║  │    YAML     │───▶│  MANIFEST   │───▶│   OUTPUT    │  ║
+║  │  MANIFESTS  │    │  PROCESSOR  │    │   FORMATS   │  ║
+║  └─────────────┘    └─────────────┘    └─────────────┘  ║
+║       │                     │                   │       ║
+║  ┌────▼────┐           ┌────▼────┐         ┌────▼────┐  ║
+║  │Templates│           │Modules  │         │HTML/CSS │  ║
+║  │& Styles │           │& Imports│         │React/Vue│  ║
+║  │Inherit. │           │Python   │         │PHP/JSON │  ║
+║  └─────────┘           └─────────┘         └─────────┘  ║
+╚═══════════════════════════════════════════════════════════╝
+"""
@@ -12,6 +12,24 @@ from aiohttp import web
 
 from . import __version__
 
+try:
+    # orjson serializes straight to bytes, skipping both the slower
+    # stdlib encoder and the UTF-8 encode web.json_response performs
+    import orjson
+
+    def _json_response(data, status: int = 200) -> web.Response:
+        return web.Response(body=orjson.dumps(data, default=str),
+                            status=status, content_type='application/json')
+
+    _json_loads = orjson.loads
+except ImportError:
+    import json as _json
+
+    def _json_response(data, status: int = 200) -> web.Response:
+        return web.json_response(data, status=status)
+
+    _json_loads = _json.loads
+
 
 class APIHandlers:
     """API endpoint handlers for WhyML server."""
@@ -50,10 +68,10 @@ class APIHandlers:
             }
             
             status_code = 200 if health_data["status"] == "healthy" else 503
-            return web.json_response(health_data, status=status_code)
+            return _json_response(health_data, status=status_code)
             
         except Exception as e:
-            return web.json_response({
+            return _json_response({
                 "status": "error",
                 "error": str(e),
                 "timestamp": time.time()
@@ -99,10 +117,10 @@ class APIHandlers:
                 ]
             }
             
-            return web.json_response(info_data)
+            return _json_response(info_data)
             
         except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
     
     async def handle_validate(self, request: web.Request) -> web.Response:
         """Handle manifest validation endpoint."""
@@ -115,7 +133,7 @@ class APIHandlers:
                 try:
                     manifest_data = yaml.safe_load(manifest_content)
                 except yaml.YAMLError as e:
-                    return web.json_response({
+                    return _json_response({
                         "valid": False,
                         "errors": [f"YAML parsing error: {e}"],
                         "warnings": []
@@ -123,7 +141,7 @@ class APIHandlers:
             else:
                 # Use default manifest file
                 if not self.server.manifest_file.exists():
-                    return web.json_response({
+                    return _json_response({
                         "valid": False,
                         "errors": [f"Manifest file not found: {self.server.manifest_file}"],
                         "warnings": []
@@ -135,7 +153,7 @@ class APIHandlers:
             try:
                 validation_result = self.server.processor.processor.validate_manifest(manifest_data)
                 
-                return web.json_response({
+                return _json_response({
                     "valid": validation_result.get("valid", True),
                     "errors": validation_result.get("errors", []),
                     "warnings": validation_result.get("warnings", []),
@@ -143,7 +161,7 @@ class APIHandlers:
                 })
                 
             except Exception as e:
-                return web.json_response({
+                return _json_response({
                     "valid": False,
                     "errors": [f"Validation error: {e}"],
                     "warnings": [],
@@ -151,7 +169,7 @@ class APIHandlers:
                 }, status=400)
             
         except Exception as e:
-            return web.json_response({
+            return _json_response({
                 "valid": False,
                 "errors": [f"Server error: {e}"],
                 "warnings": []
@@ -181,7 +199,7 @@ class APIHandlers:
                 }
             }
             
-            return web.json_response(debug_info)
+            return _json_response(debug_info)
             
         except Exception as e:
-            return web.json_response({"error": str(e)}, status=500)
+            return _json_response({"error": str(e)}, status=500)
@@ -83,13 +83,15 @@ class CaddyConfig:
         upstreams: Optional[List[UpstreamConfig]] = None,
         cache_config: Optional[CacheConfig] = None,
         security_config: Optional[SecurityConfig] = None,
-        custom_config: Optional[Dict[str, Any]] = None
+        custom_config: Optional[Dict[str, Any]] = None,
+        manifest: Optional[Dict[str, Any]] = None
     ) -> str:
         """
         Generate Caddy configuration for WhyML application.
-        
+
         Args:
             manifest_file: Path to the WhyML manifest
+            manifest: Pre-parsed manifest dict; skips re-reading the file
             host: Host to bind to
             port: Port to bind to
             domain: Domain name for production deployment
@@ -103,8 +105,10 @@ class CaddyConfig:
             Caddy configuration as JSON string
         """
         
-        # Load manifest to understand the application requirements
-        manifest = await self._load_manifest(manifest_file)
+        # Load manifest to understand the application requirements,
+        # unless the caller already parsed it
+        if manifest is None:
+            manifest = await self._load_manifest(manifest_file)
         
         # Set up basic server configuration
         server_name = domain if domain else f"{host}:{port}"
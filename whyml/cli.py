@@ -10,17 +10,79 @@ import asyncio
 import os
 import sys
 import argparse
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
-import json
-import yaml
-from dotenv import load_dotenv
 
-from . import __version__, show_logo
-from .processor import WhyMLProcessor
+from . import __version__
 from .exceptions import WhyMLError
-from .server import WhyMLServer
-from .caddy import CaddyConfig
+
+# The processor, server and YAML stack are imported inside the command
+# handlers that need them: CLI startup is dominated by imports, and
+# `whyml --help` or `whyml validate` should not pay for aiohttp, jinja
+# and the scraping stack they never touch.
+
+
+def _yaml_components():
+    """Import PyYAML lazily and pick the libyaml classes when available.
+
+    YAML I/O dominates short CLI invocations and the C-backed
+    CSafeLoader/CSafeDumper are several times faster than the
+    pure-Python implementations.
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
+
+@lru_cache(maxsize=32)
+def _load_config_cached(abspath: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a config file; memoized so repeat loads skip tokenization.
+
+    mtime and size participate in the cache key purely to invalidate
+    entries when the file changes on disk.
+    """
+    with open(abspath, 'rb') as f:
+        data = f.read()
+    if abspath.endswith('.json'):
+        try:
+            # orjson parses straight from bytes, several times faster
+            # than stdlib json; fall back silently when not installed
+            from orjson import loads as json_loads
+        except ImportError:
+            from json import loads as json_loads
+        return json_loads(data)
+    yaml, SafeLoader, _ = _yaml_components()
+    return yaml.load(data, Loader=SafeLoader)
+
+
+def _load_config(path: str) -> Dict[str, Any]:
+    """Load a JSON or YAML configuration file with caching."""
+    abspath = os.path.abspath(path)
+    stat = os.stat(abspath)
+    return _load_config_cached(abspath, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_env_cached(abspath: str, mtime_ns: int) -> bool:
+    """Apply a dotenv file once per content version.
+
+    mtime keys the cache so an edited file is re-read, while repeated
+    invocations in the same process (watch-mode restarts) skip the
+    parse entirely.
+    """
+    from dotenv import load_dotenv
+    load_dotenv(abspath)
+    return True
+
+
+def _load_env(path: str) -> None:
+    """Load environment variables from a dotenv file with caching."""
+    abspath = os.path.abspath(path)
+    _load_env_cached(abspath, os.stat(abspath).st_mtime_ns)
 
 
 def create_parser() -> argparse.ArgumentParser:
@@ -111,9 +173,9 @@ def create_parser() -> argparse.ArgumentParser:
     convert_parser.add_argument(
         '-as', '--as',
         dest='format',
-        choices=['html', 'react', 'vue', 'php', 'spa', 'pwa', 'docker', 'tauri'],
         default='html',
-        help='Output format'
+        help='Output format, or several comma-separated '
+             '(html, react, vue, php, spa, pwa, docker, tauri)'
     )
     convert_parser.add_argument(
         '--config',
@@ -259,15 +321,16 @@ async def run_command(args) -> int:
     try:
         # Load environment variables if specified
         if hasattr(args, 'env_file') and args.env_file:
-            load_dotenv(args.env_file)
-        
+            _load_env(args.env_file)
+
         # Check if manifest file exists
         if not Path(args.file).exists():
             print(f"Error: Manifest file '{args.file}' not found")
             return 1
-        
+
         # Generate Caddy configuration if requested
         if hasattr(args, 'caddy_config') and args.caddy_config:
+            from .caddy import CaddyConfig
             caddy_config = CaddyConfig()
             config = await caddy_config.generate_config(
                 manifest_file=args.file,
@@ -276,12 +339,12 @@ async def run_command(args) -> int:
                 tls_provider=getattr(args, 'tls_provider', None)
             )
             
-            with open(args.caddy_config, 'w') as f:
-                f.write(config)
-            
+            await asyncio.to_thread(Path(args.caddy_config).write_text, config)
+
             print(f"Caddy configuration written to {args.caddy_config}")
         
         # Start the development server
+        from .server import WhyMLServer
         server = WhyMLServer(
             manifest_file=args.file,
             host=args.host,
@@ -315,18 +378,13 @@ async def convert_command(args) -> int:
     try:
         # Load environment variables
         if args.env_file:
-            load_dotenv(args.env_file)
-        
-        # Load configuration
-        config = {}
-        if args.config:
-            with open(args.config) as f:
-                if args.config.endswith('.json'):
-                    config = json.load(f)
-                else:
-                    config = yaml.safe_load(f)
-        
+            _load_env(args.env_file)
+
+        # Load configuration off the event loop (cache misses hit disk)
+        config = await asyncio.to_thread(_load_config, args.config) if args.config else {}
+
         # Initialize processor
+        from .processor import WhyMLProcessor
         processor = WhyMLProcessor(config=config)
         
         # Determine output format and perform conversion
@@ -341,20 +399,44 @@ async def convert_command(args) -> int:
             'tauri': 'generate_tauri'
         }
         
-        converter_method = format_mapping.get(args.format)
-        if not converter_method:
-            print(f"Unsupported format: {args.format}")
-            return 1
-        
-        # Perform conversion
-        method = getattr(processor, converter_method)
-        result = await method(args.source)
-        
-        # Save result
-        result.save_to_file(args.target)
-        
-        print(f"Successfully converted {args.source} to {args.target} as {args.format}")
-        
+        formats = [fmt.strip() for fmt in args.format.split(',') if fmt.strip()]
+        methods = []
+        for fmt in formats:
+            converter_method = format_mapping.get(fmt)
+            if not converter_method:
+                print(f"Unsupported format: {fmt}")
+                return 1
+            methods.append(getattr(processor, converter_method))
+
+        # With several formats, parse the manifest once and share the
+        # dict — every processor method accepts a pre-parsed manifest
+        source = args.source
+        if len(methods) > 1:
+            source = await processor.load_manifest(args.source)
+
+        # Perform conversions; independent formats run concurrently
+        results = await asyncio.gather(*(method(source) for method in methods))
+
+        if len(results) == 1:
+            # Save result
+            results[0].save_to_file(args.target)
+            print(f"Successfully converted {args.source} to {args.target} as {formats[0]}")
+        else:
+            # One output per format next to the requested target, with
+            # each converter's own extension; writes overlap in threads
+            target = Path(args.target)
+            paths = []
+            for fmt, result in zip(formats, results):
+                filename = getattr(result, 'filename', None)
+                suffix = Path(filename).suffix if filename else f'.{fmt}'
+                paths.append(target.with_name(target.stem + suffix))
+            await asyncio.gather(*(
+                asyncio.to_thread(result.save_to_file, path)
+                for result, path in zip(results, paths)
+            ))
+            for fmt, path in zip(formats, paths):
+                print(f"Successfully converted {args.source} to {path} as {fmt}")
+
     except WhyMLError as e:
         print(f"WhyML Error: {e}")
         return 1
@@ -372,6 +454,7 @@ async def convert_command(args) -> int:
 async def generate_command(args) -> int:
     """Handle the generate command for various artifacts."""
     try:
+        from .processor import WhyMLProcessor
         processor = WhyMLProcessor()
         
         generators = {
@@ -389,13 +472,7 @@ async def generate_command(args) -> int:
             return 1
         
         # Load configuration if provided
-        config = {}
-        if args.config:
-            with open(args.config) as f:
-                if args.config.endswith('.json'):
-                    config = json.load(f)
-                else:
-                    config = yaml.safe_load(f)
+        config = await asyncio.to_thread(_load_config, args.config) if args.config else {}
         
         # Generate artifact
         result = await generator(args.file, output=args.output, config=config)
@@ -424,6 +501,7 @@ async def generate_command(args) -> int:
 async def validate_command(args) -> int:
     """Handle the validate command."""
     try:
+        from .processor import WhyMLProcessor
         processor = WhyMLProcessor()
         is_valid, errors = await processor.validate_manifest(args.file)
         
@@ -444,6 +522,7 @@ async def validate_command(args) -> int:
 async def scrape_command(args) -> int:
     """Handle the scrape command with advanced simplification options."""
     try:
+        from .processor import WhyMLProcessor
         processor = WhyMLProcessor()
         
         # Prepare parameters for advanced scraping
@@ -460,10 +539,15 @@ async def scrape_command(args) -> int:
         # Scrape with advanced parameters
         manifest = await processor.scrape_url_to_manifest(args.url, **scrape_params)
         
-        # Save manifest
-        with open(args.output, 'w') as f:
-            yaml.dump(manifest, f, default_flow_style=False, sort_keys=False, indent=2)
-        
+        # Save manifest; dump and write run in a worker thread so the
+        # event loop stays free
+        yaml, _, SafeDumper = _yaml_components()
+        manifest_yaml = await asyncio.to_thread(
+            yaml.dump, manifest,
+            Dumper=SafeDumper, default_flow_style=False, sort_keys=False, indent=2
+        )
+        await asyncio.to_thread(Path(args.output).write_text, manifest_yaml)
+
         print(f"Successfully scraped {args.url} to {args.output}")
         
         # Print simplification report
@@ -513,27 +597,33 @@ async def _test_conversion_workflow(url: str, manifest_file: str, output_html: O
         
         # Step 2: Convert manifest back to HTML
         print("🔄 2. Converting manifest back to HTML...")
+        from .processor import WhyMLProcessor
         processor = WhyMLProcessor()
-        
+
         # Load the saved manifest
-        with open(manifest_file, 'r') as f:
-            loaded_manifest = yaml.safe_load(f)
-        
+        yaml, SafeLoader, _ = _yaml_components()
+        manifest_text = await asyncio.to_thread(Path(manifest_file).read_text)
+        loaded_manifest = yaml.load(manifest_text, Loader=SafeLoader)
+
         # Convert to HTML
         conversion_result = await processor.convert_to_html(loaded_manifest)
         regenerated_html = conversion_result.content
         
         # Step 3: Save regenerated HTML if output file specified
         if output_html:
-            with open(output_html, 'w', encoding='utf-8') as f:
-                f.write(regenerated_html)
+            await asyncio.to_thread(
+                Path(output_html).write_text, regenerated_html, encoding='utf-8'
+            )
             print(f"💾 3. Saved regenerated HTML to: {output_html}")
         else:
             # Create temporary file for comparison
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
-                f.write(regenerated_html)
-                output_html = f.name
-                print(f"💾 3. Created temporary HTML file: {output_html}")
+            def _write_temp_html() -> str:
+                with tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8') as f:
+                    f.write(regenerated_html)
+                    return f.name
+
+            output_html = await asyncio.to_thread(_write_temp_html)
+            print(f"💾 3. Created temporary HTML file: {output_html}")
         
         # Step 4: Analyze differences
         print("📊 4. Analyzing conversion accuracy...")
@@ -680,18 +770,24 @@ def _show_text_diff_sample(original: str, regenerated: str, max_lines: int = 10)
             print(f"   {line}")
 
 
-async def main_async() -> int:
+async def main_async(args=None) -> int:
     """Main async entry point."""
-    parser = create_parser()
-    
-    # If no arguments provided, show help
-    if len(sys.argv) == 1:
-        show_logo()
-        parser.print_help()
-        return 0
-    
-    args = parser.parse_args()
-    
+    # Argument parsing normally happens in main() before the event loop
+    # starts; parse here only when invoked directly
+    if args is None:
+        parser = create_parser()
+
+        # If no arguments provided, show help
+        if len(sys.argv) == 1:
+            from . import show_logo
+            show_logo()
+            parser.print_help()
+            return 0
+
+        args = parser.parse_args()
+    else:
+        parser = None
+
     # Handle commands
     if args.command in ['run', 'serve']:
         return await run_command(args)
@@ -704,14 +800,38 @@ async def main_async() -> int:
     elif args.command == 'scrape':
         return await scrape_command(args)
     else:
-        parser.print_help()
+        (parser or create_parser()).print_help()
         return 1
 
 
 def main():
     """Main entry point for CLI."""
+    # Parse arguments before touching asyncio so help/usage paths never
+    # pay event-loop setup; every real command handler is async
+    parser = create_parser()
+
+    if len(sys.argv) == 1:
+        from . import show_logo
+        show_logo()
+        parser.print_help()
+        sys.exit(0)
+
+    args = parser.parse_args()
+
+    if not args.command:
+        parser.print_help()
+        sys.exit(1)
+
+    # Opt into uvloop's faster event loop when available; scraping
+    # commands drive many concurrent aiohttp requests through it
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
-        exit_code = asyncio.run(main_async())
+        exit_code = asyncio.run(main_async(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
         print("\nInterrupted by user")
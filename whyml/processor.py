@@ -9,13 +9,39 @@ Licensed under the Apache License, Version 2.0
 """
 
 import asyncio
+import copy
+import hashlib
+import importlib.util
 import json
+import logging
 import yaml
 import os
 import tempfile
+from collections import OrderedDict
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union, Tuple
 from pathlib import Path
 
+# C-backed HTML parser when available; an order of magnitude faster than
+# the pure-Python html.parser on large scraped pages
+_HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+try:
+    # orjson serializes straight to sorted bytes, which is what the
+    # cache-key hashing and disk cache below actually want; the stdlib
+    # fallback matches its output semantics via sort_keys + encode
+    import orjson
+
+    def _json_dumps(obj: Any, default=None) -> bytes:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_SORT_KEYS)
+
+    _json_loads = orjson.loads
+except ImportError:
+    def _json_dumps(obj: Any, default=None) -> bytes:
+        return json.dumps(obj, sort_keys=True, default=default).encode('utf-8')
+
+    _json_loads = json.loads
+
 from whyml_core.loading.manifest_loader import ManifestLoader
 from whyml_core.processing.manifest_processor import ManifestProcessor
 from whyml_core.exceptions import WhyMLError, ConversionError
@@ -25,6 +51,7 @@ from whyml_converters import (
 )
 from whyml_scrapers import URLScraper, WebpageAnalyzer
 from .caddy import CaddyConfig
+from .utils import dumps
 from .generators import (
     enhance_for_spa, enhance_for_pwa, generate_service_worker,
     generate_web_manifest, generate_offline_page, generate_spa_router,
@@ -33,6 +60,8 @@ from .generators import (
     generate_tauri_config, generate_cargo_toml, generate_tauri_main_rs
 )
 
+logger = logging.getLogger(__name__)
+
 
 class WhyMLProcessor:
     """
@@ -76,35 +105,256 @@ class WhyMLProcessor:
             strict_validation=enable_validation
         )
         
-        # Initialize converters
-        self.html_converter = HTMLConverter(optimize_output=optimize_output)
-        self.react_converter = ReactConverter(optimize_output=optimize_output)
-        self.vue_converter = VueConverter(optimize_output=optimize_output)
-        self.php_converter = PHPConverter(optimize_output=optimize_output)
-        
-        # Initialize scrapers
-        self.url_scraper = URLScraper()
-        self.webpage_analyzer = WebpageAnalyzer()
-    
-    async def load_manifest(self, 
+        # Converters and scrapers are cached_property instances below:
+        # a single-format CLI run only pays for the converter it uses
+
+        # Processed-manifest cache shared by the convert_to_* methods;
+        # batch runs hit the same sources repeatedly and the per-key
+        # locks keep concurrent conversions from loading a source twice
+        self._manifest_cache: Dict[str, Dict[str, Any]] = {}
+        self._manifest_locks: Dict[str, asyncio.Lock] = {}
+
+        # Shared HTTP session for scraping helpers; aiohttp sessions are
+        # meant to live per-application so the connection pool and DNS
+        # cache survive across requests. Created in __aenter__, closed
+        # in __aexit__; callers outside the context manager fall back to
+        # a per-call session.
+        self._session = None
+
+        # Converter-output cache keyed on (format, manifest+kwargs hash);
+        # repeated conversions of identical manifests become lookups
+        self._conv_cache: "OrderedDict[tuple, ConversionResult]" = OrderedDict()
+
+        # True while the loader is held open by __aenter__/__aexit__ so
+        # batch runs reuse its pool and cache instead of cycling them
+        # per load_manifest call
+        self._loader_entered = False
+
+    @cached_property
+    def html_converter(self) -> HTMLConverter:
+        """HTML converter, built on first use."""
+        return HTMLConverter(optimize_output=self.optimize_output)
+
+    @cached_property
+    def react_converter(self) -> ReactConverter:
+        """React converter, built on first use."""
+        return ReactConverter(optimize_output=self.optimize_output)
+
+    @cached_property
+    def vue_converter(self) -> VueConverter:
+        """Vue converter, built on first use."""
+        return VueConverter(optimize_output=self.optimize_output)
+
+    @cached_property
+    def php_converter(self) -> PHPConverter:
+        """PHP converter, built on first use."""
+        return PHPConverter(optimize_output=self.optimize_output)
+
+    @cached_property
+    def url_scraper(self) -> URLScraper:
+        """URL scraper, built on first use."""
+        return URLScraper()
+
+    @cached_property
+    def webpage_analyzer(self) -> WebpageAnalyzer:
+        """Webpage analyzer, built on first use."""
+        return WebpageAnalyzer()
+
+    async def _cached_convert(self,
+                             format_name: str,
+                             convert_func,
+                             manifest: Dict[str, Any],
+                             kwargs: Dict[str, Any]) -> ConversionResult:
+        """Run a conversion through the bounded output cache.
+
+        Keyed on the format plus a hash of the manifest and options;
+        hits return a shallow copy so callers never share a mutable
+        result. Non-JSON-serializable inputs skip caching.
+
+        Args:
+            format_name: Target format identifier
+            convert_func: Bound convert_to_* coroutine function
+            manifest: Processed manifest dictionary
+            kwargs: Conversion options
+
+        Returns:
+            ConversionResult for the format
+        """
+        try:
+            payload = (_json_dumps(manifest, default=str)
+                       + b'\0' + _json_dumps(kwargs, default=str))
+            key = (format_name,
+                   hashlib.blake2b(payload, digest_size=16).digest())
+        except (TypeError, ValueError):
+            key = None
+
+        if key is not None:
+            cached = self._conv_cache.get(key)
+            if cached is not None:
+                self._conv_cache.move_to_end(key)
+                return copy.copy(cached)
+
+        result = await convert_func(manifest, **kwargs)
+
+        if key is not None and isinstance(result, ConversionResult):
+            self._conv_cache[key] = result
+            if len(self._conv_cache) > self.cache_size:
+                self._conv_cache.popitem(last=False)
+
+        return result
+
+    async def _fetch_body(self, url: str) -> Tuple[Union[bytes, str], Optional[str]]:
+        """Fetch a URL body as raw bytes plus the declared charset.
+
+        Returning bytes lets the HTML parser handle decoding itself, so
+        the page is never resident as both bytes and a decoded str.
+        Reuses the shared session when available; instrumented sessions
+        that only provide text() fall back to the decoded body.
+        """
+        import aiohttp
+
+        if self._session is not None and not self._session.closed:
+            async with self._session.get(url) as response:
+                return await self._read_response(response)
+
+        async with aiohttp.ClientSession() as session:
+            async with session.get(url) as response:
+                return await self._read_response(response)
+
+    @staticmethod
+    async def _read_response(response) -> Tuple[Union[bytes, str], Optional[str]]:
+        """Read a response body, preferring raw bytes over decoding."""
+        raw = await response.read()
+        if isinstance(raw, (bytes, bytearray)):
+            return bytes(raw), response.charset
+        return await response.text(), None
+
+    async def _resolve_manifest(self,
+                               source: Union[str, Path, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Resolve a manifest source to a processed manifest dict.
+
+        Dict sources pass through unchanged; path/URL sources are loaded
+        once and cached, so converting the same source to several formats
+        only runs the load/process pipeline a single time.
+
+        Args:
+            source: Manifest source (file path, URL, or dict)
+
+        Returns:
+            Processed manifest dictionary
+        """
+        if isinstance(source, dict):
+            return source
+
+        key = str(source)
+        cached = self._manifest_cache.get(key)
+        if cached is not None:
+            return cached
+
+        lock = self._manifest_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            cached = self._manifest_cache.get(key)
+            if cached is None:
+                cached = await self.load_manifest(source)
+                self._manifest_cache[key] = cached
+            return cached
+
+    def invalidate_manifest_cache(self, source: Optional[Union[str, Path]] = None) -> None:
+        """Drop cached processed manifests.
+
+        Long-running callers (the dev server) use this when a watched
+        source changes on disk; with no argument the whole cache is
+        cleared.
+
+        Args:
+            source: Manifest source to evict, or None for all
+        """
+        if source is None:
+            self._manifest_cache.clear()
+        else:
+            self._manifest_cache.pop(str(source), None)
+
+
+    # Bump when the cached-manifest format or processing semantics change
+    _DISK_CACHE_VERSION = 1
+
+    def _disk_cache_path(self, source: Union[str, Path]) -> Optional[Path]:
+        """
+        Compute the disk-cache file for a local manifest source.
+
+        Returns None when disk caching does not apply: the source is not
+        a local file, or caching is disabled via WHYML_CACHE_MANIFESTS=0.
+        """
+        if os.environ.get('WHYML_CACHE_MANIFESTS', '1') == '0':
+            return None
+        try:
+            source_path = Path(source)
+            if not source_path.is_file():
+                return None
+            raw_bytes = source_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        key = hashlib.blake2b(
+            raw_bytes + f'|v{self._DISK_CACHE_VERSION}|validate={self.enable_validation}'.encode(),
+            digest_size=16,
+        ).hexdigest()
+        return Path.home() / '.whyml' / 'cache' / 'manifests' / f'{key}.json'
+
+    async def load_manifest(self,
                            source: Union[str, Path],
                            options: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Load and process a manifest from file or URL.
-        
+
+        Local files are backed by a JSON cache under
+        ~/.whyml/cache/manifests keyed on the raw source bytes, so
+        repeated CLI runs over unchanged manifests skip the YAML parse
+        and processing pipeline entirely. Set WHYML_CACHE_MANIFESTS=0
+        to disable.
+
         Args:
             source: Path to manifest file or URL
             options: Loading options
-            
+
         Returns:
             Processed manifest dictionary
         """
-        async with self.loader:
+        cache_file = self._disk_cache_path(source) if not options else None
+        if cache_file is not None and cache_file.exists():
+            try:
+                cached = _json_loads(await asyncio.to_thread(cache_file.read_bytes))
+                if cached.get('version') == self._DISK_CACHE_VERSION:
+                    return cached['manifest']
+            except (OSError, ValueError, KeyError):
+                pass  # Corrupt or unreadable cache entry; rebuild below
+
+        if self._loader_entered:
+            # Loader lifecycle is owned by the processor context manager
             loaded_manifest = await self.loader.load_manifest(str(source), options or {})
-            # Extract content from LoadedManifest before processing
-            raw_manifest = loaded_manifest.content if hasattr(loaded_manifest, 'content') else loaded_manifest
-            processed_manifest = self.processor.process_manifest(raw_manifest)
-            return processed_manifest
+        else:
+            async with self.loader:
+                loaded_manifest = await self.loader.load_manifest(str(source), options or {})
+        # Extract content from LoadedManifest before processing
+        raw_manifest = loaded_manifest.content if hasattr(loaded_manifest, 'content') else loaded_manifest
+        processed_manifest = self.processor.process_manifest(raw_manifest)
+
+        if cache_file is not None:
+            await asyncio.to_thread(self._write_disk_cache, cache_file, processed_manifest)
+
+        return processed_manifest
+
+    def _write_disk_cache(self, cache_file: Path, manifest: Dict[str, Any]) -> None:
+        """Atomically persist a processed manifest to the disk cache."""
+        try:
+            payload = _json_dumps({'version': self._DISK_CACHE_VERSION, 'manifest': manifest})
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(cache_file.parent), suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(payload)
+            os.replace(tmp_path, cache_file)
+        except (OSError, TypeError, ValueError):
+            pass  # Caching is best-effort; never fail the load for it
     
     async def convert_to_html(self,
                              source: Union[str, Path, Dict[str, Any]],
@@ -120,10 +370,7 @@ class WhyMLProcessor:
             ConversionResult with HTML content
         """
         
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         # Use async conversion to avoid running a new loop inside an active loop
         html_content = await self.html_converter.convert_manifest(manifest, **kwargs)
@@ -147,10 +394,7 @@ class WhyMLProcessor:
         Returns:
             ConversionResult with React content
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         react_content = await self.react_converter.convert_manifest(manifest, **kwargs)
         title = manifest.get('metadata', {}).get('title', 'component')
@@ -176,10 +420,7 @@ class WhyMLProcessor:
         Returns:
             ConversionResult with Vue content
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         vue_content = await self.vue_converter.convert_manifest(manifest, **kwargs)
         title = manifest.get('metadata', {}).get('title', 'app')
@@ -201,10 +442,7 @@ class WhyMLProcessor:
         Returns:
             ConversionResult with PHP content
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         php_content = await self.php_converter.convert_manifest(manifest, **kwargs)
         title = manifest.get('metadata', {}).get('title', 'Component')
@@ -228,53 +466,39 @@ class WhyMLProcessor:
         Returns:
             Dictionary mapping format names to ConversionResults
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
-        
-        # Convert to all formats concurrently
+        manifest = await self._resolve_manifest(source)
+        
+        # Convert to all formats concurrently; return_exceptions keeps
+        # partial results in one pass instead of rerunning everything
+        # serially when a single format fails
+        formats = (('html', 'HTML'), ('react', 'React'), ('vue', 'Vue'), ('php', 'PHP'))
+        outcomes = await asyncio.gather(
+            self._cached_convert('html', self.convert_to_html, manifest, kwargs),
+            self._cached_convert('react', self.convert_to_react, manifest, kwargs),
+            self._cached_convert('vue', self.convert_to_vue, manifest, kwargs),
+            self._cached_convert('php', self.convert_to_php, manifest, kwargs),
+            return_exceptions=True,
+        )
+
         results: Dict[str, ConversionResult] = {}
-        try:
-            html_res, react_res, vue_res, php_res = await asyncio.gather(
-                self.convert_to_html(manifest, **kwargs),
-                self.convert_to_react(manifest, **kwargs),
-                self.convert_to_vue(manifest, **kwargs),
-                self.convert_to_php(manifest, **kwargs),
-            )
-            results['html'] = html_res
-            results['react'] = react_res
-            results['vue'] = vue_res
-            results['php'] = php_res
-        except Exception as e:
-            # If any conversion fails, try individually to collect partial results
-            try:
-                results['html'] = await self.convert_to_html(manifest, **kwargs)
-            except Exception as e_html:
-                results['html'] = ConversionError(f"HTML conversion failed: {e_html}")
-            try:
-                results['react'] = await self.convert_to_react(manifest, **kwargs)
-            except Exception as e_react:
-                results['react'] = ConversionError(f"React conversion failed: {e_react}")
-            try:
-                results['vue'] = await self.convert_to_vue(manifest, **kwargs)
-            except Exception as e_vue:
-                results['vue'] = ConversionError(f"Vue conversion failed: {e_vue}")
-            try:
-                results['php'] = await self.convert_to_php(manifest, **kwargs)
-            except Exception as e_php:
-                results['php'] = ConversionError(f"PHP conversion failed: {e_php}")
-        
+        for (format_name, display_name), outcome in zip(formats, outcomes):
+            if isinstance(outcome, Exception):
+                results[format_name] = ConversionError(f"{display_name} conversion failed: {outcome}")
+            else:
+                results[format_name] = outcome
+
         # Save to output directory if specified
         if output_dir:
             output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
-            
-            for format_name, result in results.items():
-                if isinstance(result, ConversionResult):
-                    output_file = output_path / result.filename
-                    result.save_to_file(str(output_file))
-        
+
+            # File writes are blocking; fan them out to threads
+            await asyncio.gather(*(
+                asyncio.to_thread(result.save_to_file, str(output_path / result.filename))
+                for result in results.values()
+                if isinstance(result, ConversionResult)
+            ))
+
         return results
     
     async def scrape_url_to_manifest(self,
@@ -318,44 +542,54 @@ class WhyMLProcessor:
         )
         
         async with scraper:
-            # Scrape the URL
-            manifest = await scraper.scrape_to_manifest(url)
-            
+            # Fetch the page once up front when analysis is requested,
+            # so scraper and analyzer share one GET instead of
+            # re-downloading identical bytes
+            html_content = None
+            charset = None
+            if analyze:
+                html_content, charset = await self._fetch_body(url)
+
+            # Scrape the URL (reusing the pre-fetched body when present)
+            manifest = await scraper.scrape_to_manifest(url, html_content=html_content)
+
             # Clean and optimize
             cleaned_manifest = scraper.clean_manifest(manifest)
-            
+
             # Process the manifest with selective validation if sections specified
             if sections:
                 # Create a new processor with selective validation for the requested sections
-                selective_processor = ManifestProcessor(
+                processor = ManifestProcessor(
                     strict_validation=self.enable_validation,
                     requested_sections=sections
                 )
-                processed_manifest = selective_processor.process_manifest(cleaned_manifest)
             else:
                 # Use default processor for full manifest processing
-                processed_manifest = self.processor.process_manifest(cleaned_manifest)
-            
-            # Add analysis if requested
-            if analyze:
+                processor = self.processor
+
+            if not analyze:
+                return processor.process_manifest(cleaned_manifest)
+
+            def _analyze() -> Dict[str, Any]:
                 from bs4 import BeautifulSoup
-                import aiohttp
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(url) as response:
-                        html_content = await response.text()
-                        soup = BeautifulSoup(html_content, 'html.parser')
-                        
-                        # Create WebpageAnalyzer with simplification parameters
-                        analyzer = WebpageAnalyzer(
-                            max_depth=max_depth,
-                            flatten_containers=flatten_containers,
-                            simplify_structure=simplify_structure,
-                            preserve_semantic_tags=preserve_semantic_tags
-                        )
-                        analysis = await analyzer.analyze_webpage(url, soup)
-                        processed_manifest['analysis'] = analysis
-            
+
+                soup = BeautifulSoup(html_content, _HTML_PARSER, from_encoding=charset)
+                analyzer = WebpageAnalyzer(
+                    max_depth=max_depth,
+                    flatten_containers=flatten_containers,
+                    simplify_structure=simplify_structure,
+                    preserve_semantic_tags=preserve_semantic_tags
+                )
+                return analyzer.analyze_webpage(soup, url)
+
+            # Analysis and manifest processing are independent; overlap
+            # the CPU-bound work in threads instead of running serially
+            processed_manifest, analysis = await asyncio.gather(
+                asyncio.to_thread(processor.process_manifest, cleaned_manifest),
+                asyncio.to_thread(_analyze),
+            )
+            processed_manifest['analysis'] = analysis
+
             return processed_manifest
     
     async def batch_convert(self,
@@ -386,10 +620,18 @@ class WhyMLProcessor:
             raise ConversionError(f"Unsupported output format: {output_format}")
         
         converter_func = converter_map[output_format]
-        
-        # Process all sources concurrently
-        tasks = [converter_func(source, **kwargs) for source in sources]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Process all sources concurrently, bounded by a semaphore so a
+        # URL-heavy batch cannot fan out hundreds of loads at once; the
+        # manifest cache in _resolve_manifest dedupes repeated sources
+        semaphore = asyncio.Semaphore(kwargs.pop('max_concurrency', 16))
+
+        async def _convert_one(source: Union[str, Path]) -> ConversionResult:
+            async with semaphore:
+                return await converter_func(source, **kwargs)
+
+        results = await asyncio.gather(*(_convert_one(source) for source in sources),
+                                       return_exceptions=True)
         
         # Save results if output directory specified
         if output_dir:
@@ -401,8 +643,9 @@ class WhyMLProcessor:
                     output_file = output_path / f"{i:03d}_{result.filename}"
                     result.save_to_file(str(output_file))
                 elif isinstance(result, Exception):
-                    # Log error but continue processing
-                    print(f"Error processing {sources[i]}: {result}")
+                    # Log error but continue processing; %s args keep
+                    # formatting lazy when the level is disabled
+                    logger.warning("Error processing %s: %s", sources[i], result)
         
         return [r for r in results if isinstance(r, ConversionResult)]
     
@@ -419,10 +662,7 @@ class WhyMLProcessor:
         Returns:
             ConversionResult with SPA content
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         # Generate HTML with SPA routing
         html_result = self.html_converter.convert(manifest, spa_mode=True, **kwargs)
@@ -450,10 +690,7 @@ class WhyMLProcessor:
         Returns:
             ConversionResult with PWA content
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         # Generate SPA first
         spa_result = await self.convert_to_spa(source, **kwargs)
@@ -483,10 +720,7 @@ class WhyMLProcessor:
         Returns:
             Path to generated PWA directory
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         output_dir = Path(output) if output else Path(f"pwa-{manifest.get('metadata', {}).get('title', 'app').lower().replace(' ', '-')}")
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -505,7 +739,7 @@ class WhyMLProcessor:
         # Generate web manifest
         from .generators import generate_web_manifest
         web_manifest = generate_web_manifest(manifest, config or {})
-        (output_dir / "manifest.json").write_text(json.dumps(web_manifest, indent=2))
+        (output_dir / "manifest.json").write_text(dumps(web_manifest, indent=2))
         
         # Generate offline page
         from .generators import generate_offline_page
@@ -529,10 +763,7 @@ class WhyMLProcessor:
         Returns:
             Path to generated SPA directory
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         output_dir = Path(output) if output else Path(f"spa-{manifest.get('metadata', {}).get('title', 'app').lower().replace(' ', '-')}")
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -565,10 +796,7 @@ class WhyMLProcessor:
         Returns:
             Path to generated APK project directory
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         output_dir = Path(output) if output else Path(f"apk-{manifest.get('metadata', {}).get('title', 'app').lower().replace(' ', '-')}")
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -579,12 +807,12 @@ class WhyMLProcessor:
         # Generate Capacitor configuration
         from .generators import generate_capacitor_config
         capacitor_config = generate_capacitor_config(manifest, config or {})
-        (output_dir / "capacitor.config.json").write_text(json.dumps(capacitor_config, indent=2))
+        (output_dir / "capacitor.config.json").write_text(dumps(capacitor_config, indent=2))
         
         # Generate package.json for Capacitor
         from .generators import generate_capacitor_package_json
         package_json = generate_capacitor_package_json(manifest)
-        (output_dir / "package.json").write_text(json.dumps(package_json, indent=2))
+        (output_dir / "package.json").write_text(dumps(package_json, indent=2))
         
         return str(output_dir)
     
@@ -603,10 +831,7 @@ class WhyMLProcessor:
         Returns:
             Path to generated Docker configuration
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         output_dir = Path(output) if output else Path(f"docker-{manifest.get('metadata', {}).get('title', 'app').lower().replace(' ', '-')}")
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -643,10 +868,7 @@ class WhyMLProcessor:
         Returns:
             Path to generated Tauri project directory
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         output_dir = Path(output) if output else Path(f"tauri-{manifest.get('metadata', {}).get('title', 'app').lower().replace(' ', '-')}")
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -660,7 +882,7 @@ class WhyMLProcessor:
         # Generate Tauri configuration
         from .generators import generate_tauri_config
         tauri_config = generate_tauri_config(manifest, config or {})
-        (output_dir / "src-tauri" / "tauri.conf.json").write_text(json.dumps(tauri_config, indent=2))
+        (output_dir / "src-tauri" / "tauri.conf.json").write_text(dumps(tauri_config, indent=2))
         
         # Generate Cargo.toml
         from .generators import generate_cargo_toml
@@ -690,10 +912,7 @@ class WhyMLProcessor:
         Returns:
             Path to generated Caddy configuration file
         """
-        if isinstance(source, dict):
-            manifest = source
-        else:
-            manifest = await self.load_manifest(source)
+        manifest = await self._resolve_manifest(source)
         
         caddy_config = CaddyConfig()
         
@@ -761,37 +980,66 @@ class WhyMLProcessor:
         except Exception as e:
             return False, [str(e)]
     
+    # Keys that carry content/attributes rather than naming an element;
+    # mirrors the skip set the core validator uses for its walk
+    _ATTR_KEYS = frozenset(('children', 'text', 'style', 'class', 'id'))
+
     def _analyze_structure_complexity(self, manifest: Dict[str, Any]) -> Dict[str, Any]:
-        """Analyze the complexity of the manifest structure."""
+        """Analyze the complexity of the manifest structure.
+
+        All metrics are accumulated in a single traversal so callers
+        wanting several of them pay for one walk, not one per metric.
+        """
         structure = manifest.get('structure', {})
-        
-        def count_elements(obj, depth=0):
-            if isinstance(obj, dict):
-                count = 1
-                max_depth = depth
-                for value in obj.values():
-                    if isinstance(value, (dict, list)):
-                        element_count, element_depth = count_elements(value, depth + 1)
-                        count += element_count
-                        max_depth = max(max_depth, element_depth)
-                return count, max_depth
-            elif isinstance(obj, list):
-                count = 0
-                max_depth = depth
-                for item in obj:
-                    if isinstance(item, (dict, list)):
-                        element_count, element_depth = count_elements(item, depth)
-                        count += element_count
-                        max_depth = max(max_depth, element_depth)
-                return count, max_depth
-            return 0, depth
-        
-        element_count, max_depth = count_elements(structure)
-        
+
+        # Iterative walk: no Python call frame per node and no recursion
+        # limit on pathologically deep structures. Hot names are bound
+        # locally and nodes dispatched on exact type — manifest data is
+        # plain dict/list — to keep per-node interpreter work minimal.
+        def count_elements(root):
+            _dict, _list, _type = dict, list, type
+            attr_keys = self._ATTR_KEYS
+            count = 0
+            max_depth = 0
+            style_refs = 0
+            histogram: Dict[str, int] = {}
+            stack = [(root, 0)]
+            pop = stack.pop
+            append = stack.append
+            while stack:
+                obj, depth = pop()
+                obj_type = _type(obj)
+                if obj_type is _dict:
+                    count += 1
+                    if depth > max_depth:
+                        max_depth = depth
+                    child_depth = depth + 1
+                    for key, value in obj.items():
+                        if key in attr_keys:
+                            if key == 'style' or key == 'class':
+                                style_refs += 1
+                        else:
+                            histogram[key] = histogram.get(key, 0) + 1
+                        value_type = _type(value)
+                        if value_type is _dict or value_type is _list:
+                            append((value, child_depth))
+                elif obj_type is _list:
+                    if depth > max_depth:
+                        max_depth = depth
+                    for item in obj:
+                        item_type = _type(item)
+                        if item_type is _dict or item_type is _list:
+                            append((item, depth))
+            return count, max_depth, style_refs, histogram
+
+        element_count, max_depth, style_refs, histogram = count_elements(structure)
+
         return {
             'element_count': element_count,
             'max_nesting_depth': max_depth,
-            'complexity_score': element_count * (max_depth + 1)
+            'complexity_score': element_count * (max_depth + 1),
+            'style_refs_count': style_refs,
+            'tag_histogram': histogram,
         }
     
     def _enhance_for_spa(self, html_content: str, manifest: Dict[str, Any]) -> str:
@@ -857,12 +1105,25 @@ class WhyMLProcessor:
     
     async def __aenter__(self):
         """Async context manager entry."""
+        import aiohttp
+
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=64, ttl_dns_cache=300)
+        )
+        # Hold the loader open for the processor's lifetime so batch
+        # loads share its pool and cache
+        await self.loader.__aenter__()
+        self._loader_entered = True
         return self
-    
+
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        # Clean up resources if needed
-        pass
+        if self._loader_entered:
+            self._loader_entered = False
+            await self.loader.__aexit__(exc_type, exc_val, exc_tb)
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            self._session = None
 
 
 # Convenience functions for common operations
@@ -6,18 +6,27 @@ Includes file watching, hot reload, and real-time conversion capabilities.
 """
 
 import asyncio
-import os
+import html
 import json
+import mimetypes
+import os
+import signal
+import stat
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any, Set
+from typing import Optional, Dict, Any
 import time
-import mimetypes
 from urllib.parse import urlparse, parse_qs
 
 import aiohttp
-from aiohttp import web, WSMsgType
-from aiofiles import open as aio_open
+from aiohttp import web, WSCloseCode, WSMsgType
 import yaml
+try:
+    # libyaml C extension: several times faster than the pure-Python
+    # SafeLoader when a manifest does have to be parsed
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 try:
     from watchdog.observers import Observer
     WATCHDOG_AVAILABLE = True
@@ -44,7 +53,37 @@ except ImportError:
 from .processor import WhyMLProcessor
 from .exceptions import WhyMLError
 from . import __version__
-from .api_handlers import APIHandlers
+from .api_handlers import APIHandlers, _json_response
+
+# The reload message is constant, so serialize and UTF-8-encode it once;
+# send_frame (aiohttp >= 3.11) transmits the prepared payload without
+# re-encoding per client
+_RELOAD_PAYLOAD = json.dumps({"type": "reload"}).encode('utf-8')
+
+#: File extensions the watcher reacts to; O(1) suffix lookup
+_WATCH_EXTS = frozenset({'.yaml', '.yml', '.json', '.html', '.css', '.js'})
+
+#: Chunk size for streaming large converter output
+_STREAM_CHUNK = 64 * 1024
+
+#: Content types for the asset suffixes a dev server actually serves;
+#: a dict hit skips mimetypes.guess_type and its module-level lock
+_STATIC_MIME = {
+    '.css': 'text/css',
+    '.js': 'application/javascript',
+    '.mjs': 'application/javascript',
+    '.json': 'application/json',
+    '.html': 'text/html',
+    '.svg': 'image/svg+xml',
+    '.png': 'image/png',
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp',
+    '.ico': 'image/x-icon',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+}
 
 
 class ManifestFileHandler(FileSystemEventHandler):
@@ -59,32 +98,41 @@ class ManifestFileHandler(FileSystemEventHandler):
         """Handle file modification events."""
         if event.is_directory:
             return
-            
+
         file_path = event.src_path
-        current_time = time.time()
-        
+        # Monotonic clock: wall-clock jumps (NTP) must not defeat or
+        # extend the debounce window
+        current_time = time.monotonic()
+
         # Debounce rapid file changes
-        if file_path in self.last_modified:
-            if current_time - self.last_modified[file_path] < self.debounce_time:
-                return
-        
+        last = self.last_modified.get(file_path)
+        if last is not None and current_time - last < self.debounce_time:
+            return
+
         self.last_modified[file_path] = current_time
+
+        # Purge stale entries so the map doesn't grow with every file
+        # ever touched in the watched tree
+        if len(self.last_modified) > 256:
+            cutoff = current_time - 10 * self.debounce_time
+            self.last_modified = {
+                path: ts for path, ts in self.last_modified.items()
+                if ts >= cutoff
+            }
         
         # Check if it's a file we care about
-        if file_path.endswith(('.yaml', '.yml', '.json', '.html', '.css', '.js')):
+        if os.path.splitext(file_path)[1] in _WATCH_EXTS:
             # Log the file change for RSS feed
             self.server._log_file_change(file_path, "modified")
-            
-            # Use thread-safe approach to schedule the coroutine
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_running():
-                    asyncio.run_coroutine_threadsafe(self.server._handle_file_change(file_path), loop)
-                else:
-                    # If no loop is running, store the change for later processing
-                    self.server._pending_changes.append(file_path)
-            except RuntimeError:
-                # No event loop in current thread, store for later processing
+
+            # This runs on the watchdog observer thread; the server
+            # captures its loop in start(), so schedule onto it
+            # thread-safely (get_event_loop here would raise)
+            loop = self.server._loop
+            if loop is not None and loop.is_running():
+                asyncio.run_coroutine_threadsafe(self.server._handle_file_change(file_path), loop)
+            else:
+                # Server not started yet; store the change for later processing
                 self.server._pending_changes.append(file_path)
     
     def on_created(self, event):
@@ -103,7 +151,9 @@ class WhyMLServer:
         watch: bool = True,
         auto_reload: bool = True,
         api_debug: bool = False,
-        rss_enabled: bool = False
+        rss_enabled: bool = False,
+        unix_path: Optional[str] = None,
+        trust_forwarded: bool = False
     ):
         self.manifest_file = Path(manifest_file)
         self.host = host
@@ -112,16 +162,55 @@ class WhyMLServer:
         self.auto_reload = auto_reload
         self.api_debug = api_debug
         self.rss_enabled = rss_enabled
-        
+        # Reverse-proxy deployment: bind a unix socket instead of TCP
+        # and honor X-Forwarded-* headers from the terminating proxy,
+        # which keeps TLS buffers out of this process entirely
+        self.unix_path = unix_path
+        self.trust_forwarded = trust_forwarded
+        
+        # Warm the mimetypes DB now; FileResponse's first guess_type
+        # call would otherwise read the system maps mid-request
+        mimetypes.init()
+
         self.processor = WhyMLProcessor()
         self.app = web.Application()
-        self.websockets: Set[web.WebSocketResponse] = set()
+        # One outbound queue per connected client; a per-connection task
+        # drains it so broadcasts never wait on a slow socket
+        self.websockets: Dict[web.WebSocketResponse, asyncio.Queue] = {}
         self._pending_changes = []  # Store file changes when no event loop is available
         self._file_changes_log = []  # Log of file changes for RSS feed
+
+        # Converted-HTML cache for the index page, stored UTF-8 encoded
+        # so hits reuse the same bytes without re-encoding; invalidated
+        # on file change and staleness-checked against the manifest
+        # mtime. The lock is created lazily inside the running loop.
+        self._html_cache: Optional[bytes] = None
+        self._html_cache_mtime: float = 0.0
+        self._html_cache_lock: Optional[asyncio.Lock] = None
+
+        # Manifest dict parsed during the last POST update, keyed on the
+        # file's mtime_ns; lets the next conversion skip the re-parse
+        self._parsed_cache: Optional[tuple] = None
+
+        # True while a coalesced reload broadcast is pending
+        self._reload_scheduled = False
+
+        # Conversion results keyed on (format, manifest mtime_ns); a
+        # small LRU so repeated /convert hits between edits are lookups
+        self._convert_cache: OrderedDict = OrderedDict()
         
         self._observer: Optional[Observer] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None  # Set in start()
+        self._stop_event: Optional[asyncio.Event] = None  # Set in start()
         self.api_handlers = APIHandlers(self)  # Initialize API handlers
         self._setup_routes()
+
+        # Host, port, version and manifest path are fixed for the
+        # server's lifetime, so these page fragments are built once
+        # instead of re-formatted on every request
+        self._live_reload_script = self._build_live_reload_script()
+        self._live_reload_body_tag = f'{self._live_reload_script}\n</body>'
+        self._error_page_head, self._error_page_tail = self._build_error_page_shell()
     
     def _setup_routes(self):
         """Configure server routes."""
@@ -161,15 +250,32 @@ class WhyMLServer:
                     content_type='text/html'
                 )
             
-            # Convert manifest to HTML
-            result = await self.processor.convert_to_html(str(self.manifest_file))
-            
-            # Inject live reload script if enabled
-            html_content = result.content
-            if self.auto_reload:
-                html_content = self._inject_live_reload_script(html_content)
-            
-            return web.Response(text=html_content, content_type='text/html')
+            # Conversion only changes when the manifest does, so serve
+            # the cached result while the mtime matches
+            mtime = self.manifest_file.stat().st_mtime
+            if self._html_cache is not None and mtime == self._html_cache_mtime:
+                return web.Response(body=self._html_cache,
+                                    content_type='text/html', charset='utf-8')
+
+            if self._html_cache_lock is None:
+                self._html_cache_lock = asyncio.Lock()
+
+            # Single-flight: concurrent misses wait for one conversion
+            async with self._html_cache_lock:
+                mtime = self.manifest_file.stat().st_mtime
+                if self._html_cache is None or mtime != self._html_cache_mtime:
+                    result = await self.processor.convert_to_html(self._manifest_source())
+
+                    # Inject live reload script if enabled
+                    html_content = result.content
+                    if self.auto_reload:
+                        html_content = self._inject_live_reload_script(html_content)
+
+                    self._html_cache = html_content.encode('utf-8')
+                    self._html_cache_mtime = mtime
+
+            return web.Response(body=self._html_cache,
+                                content_type='text/html', charset='utf-8')
             
         except WhyMLError as e:
             return web.Response(
@@ -182,13 +288,30 @@ class WhyMLServer:
                 content_type='text/html'
             )
     
+    def _manifest_source(self):
+        """Return the manifest source to hand the processor.
+
+        The dict parsed during the last POST update is reused while the
+        file's mtime_ns still matches; otherwise the path is returned
+        and the processor parses it itself.
+        """
+        if self._parsed_cache is not None:
+            try:
+                if self.manifest_file.stat().st_mtime_ns == self._parsed_cache[0]:
+                    return self._parsed_cache[1]
+            except OSError:
+                pass
+        return str(self.manifest_file)
+
     async def _handle_manifest(self, request: web.Request) -> web.Response:
         """Serve or update the raw manifest."""
         if request.method == 'GET':
             try:
-                async with aio_open(self.manifest_file, 'r') as f:
-                    content = await f.read()
-                
+                # One thread dispatch for the whole read; per-syscall
+                # offloading (aiofiles) costs more than it saves on
+                # small manifests
+                content = await asyncio.to_thread(self.manifest_file.read_text)
+
                 if self.manifest_file.suffix.lower() in ['.yaml', '.yml']:
                     return web.Response(text=content, content_type='application/x-yaml')
                 else:
@@ -205,33 +328,53 @@ class WhyMLServer:
         try:
             content = await request.text()
             
-            # Validate the content
+            # Validate the content; the parse result is kept so the next
+            # conversion doesn't have to parse the same text again
             if self.manifest_file.suffix.lower() in ['.yaml', '.yml']:
-                yaml.safe_load(content)  # Validate YAML
+                parsed = yaml.load(content, Loader=_YamlLoader)
             else:
-                json.loads(content)  # Validate JSON
-            
-            # Write to file
-            async with aio_open(self.manifest_file, 'w') as f:
-                await f.write(content)
-            
+                parsed = json.loads(content)
+
+            # Write to file (single thread dispatch, see _handle_manifest)
+            await asyncio.to_thread(self.manifest_file.write_text, content)
+
+            if isinstance(parsed, dict):
+                self._parsed_cache = (self.manifest_file.stat().st_mtime_ns, parsed)
+
             # Notify connected clients
             await self._broadcast_reload()
             
-            return web.json_response({"status": "success", "message": "Manifest updated"})
+            return _json_response({"status": "success", "message": "Manifest updated"})
             
         except (yaml.YAMLError, json.JSONDecodeError) as e:
-            return web.json_response(
+            return _json_response(
                 {"status": "error", "message": f"Invalid format: {e}"},
                 status=400
             )
         except Exception as e:
-            return web.json_response(
+            return _json_response(
                 {"status": "error", "message": f"Update failed: {e}"},
                 status=500
             )
     
-    async def _handle_convert(self, request: web.Request) -> web.Response:
+    async def _stream_text(self, request: web.Request, text: str,
+                           content_type: str) -> web.StreamResponse:
+        """Stream a large text body in chunks.
+
+        web.Response(text=...) encodes and buffers the whole body before
+        the first byte goes out; chunked writes keep peak memory at one
+        chunk and let transmission start immediately.
+        """
+        resp = web.StreamResponse()
+        resp.content_type = content_type
+        resp.charset = 'utf-8'
+        await resp.prepare(request)
+        for i in range(0, len(text), _STREAM_CHUNK):
+            await resp.write(text[i:i + _STREAM_CHUNK].encode('utf-8'))
+        await resp.write_eof()
+        return resp
+
+    async def _handle_convert(self, request: web.Request) -> web.StreamResponse:
         """Handle format conversion requests."""
         format_type = request.match_info['format']
         
@@ -245,13 +388,29 @@ class WhyMLServer:
             
             converter = converters.get(format_type)
             if not converter:
-                return web.json_response(
+                return _json_response(
                     {"error": f"Unsupported format: {format_type}"},
                     status=400
                 )
             
-            result = await converter(str(self.manifest_file))
-            
+            # Results only change with the manifest, so cache them per
+            # (format, mtime_ns) with a small LRU
+            try:
+                mtime_ns = self.manifest_file.stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+
+            key = (format_type, mtime_ns)
+            result = self._convert_cache.get(key) if mtime_ns is not None else None
+            if result is not None:
+                self._convert_cache.move_to_end(key)
+            else:
+                result = await converter(self._manifest_source())
+                if mtime_ns is not None:
+                    self._convert_cache[key] = result
+                    while len(self._convert_cache) > 16:
+                        self._convert_cache.popitem(last=False)
+
             # Determine content type
             content_types = {
                 'html': 'text/html',
@@ -261,101 +420,150 @@ class WhyMLServer:
             }
             
             content_type = content_types.get(format_type, 'text/plain')
-            return web.Response(text=result.content, content_type=content_type)
+            return await self._stream_text(request, result.content, content_type)
             
         except WhyMLError as e:
-            return web.json_response({"error": str(e)}, status=400)
+            return _json_response({"error": str(e)}, status=400)
         except Exception as e:
-            return web.json_response({"error": f"Conversion failed: {e}"}, status=500)
+            return _json_response({"error": f"Conversion failed: {e}"}, status=500)
     
     async def _handle_convert_post(self, request: web.Request) -> web.Response:
         """Handle POST conversion with custom manifest content."""
         format_type = request.match_info['format']
         
         try:
-            # Get manifest content from POST body
+            # Get manifest content from POST body and parse it in memory;
+            # the processor accepts dict sources, so no tempfile round trip
             manifest_content = await request.text()
-            
-            # Create temporary file
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                f.write(manifest_content)
-                temp_file = f.name
-            
+
             try:
-                converters = {
-                    'html': self.processor.convert_to_html,
-                    'react': self.processor.convert_to_react,
-                    'vue': self.processor.convert_to_vue,
-                    'php': self.processor.convert_to_php,
-                }
-                
-                converter = converters.get(format_type)
-                if not converter:
-                    return web.json_response(
-                        {"error": f"Unsupported format: {format_type}"},
-                        status=400
-                    )
-                
-                result = await converter(temp_file)
-                
-                return web.json_response({
-                    "status": "success",
-                    "content": result.content,
-                    "metadata": result.metadata
-                })
-                
-            finally:
-                os.unlink(temp_file)
-                
+                manifest = yaml.load(manifest_content, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                return _json_response(
+                    {"error": f"Invalid manifest: {e}"},
+                    status=400
+                )
+
+            if not isinstance(manifest, dict):
+                return _json_response(
+                    {"error": "Manifest must be a mapping"},
+                    status=400
+                )
+
+            converters = {
+                'html': self.processor.convert_to_html,
+                'react': self.processor.convert_to_react,
+                'vue': self.processor.convert_to_vue,
+                'php': self.processor.convert_to_php,
+            }
+
+            converter = converters.get(format_type)
+            if not converter:
+                return _json_response(
+                    {"error": f"Unsupported format: {format_type}"},
+                    status=400
+                )
+
+            result = await converter(manifest)
+
+            return _json_response({
+                "status": "success",
+                "content": result.content,
+                "metadata": result.metadata
+            })
+
         except Exception as e:
-            return web.json_response({"error": f"Conversion failed: {e}"}, status=500)
+            return _json_response({"error": f"Conversion failed: {e}"}, status=500)
     
     async def _handle_websocket(self, request: web.Request) -> web.WebSocketResponse:
-        """Handle WebSocket connections for live reload."""
-        ws = web.WebSocketResponse()
+        """Handle WebSocket connections for live reload.
+
+        Keepalive uses protocol-level PING frames (heartbeat) handled in
+        aiohttp's protocol layer; dead peers are detected by a missed
+        PONG without any per-ping Python callback or client-side timer.
+        """
+        ws = web.WebSocketResponse(heartbeat=30.0)
         await ws.prepare(request)
-        
-        self.websockets.add(ws)
-        
+
+        # Bound the kernel-side send buffer too; a stalled peer then
+        # backpressures the sender task instead of inflating RSS
+        transport = request.transport
+        if transport is not None:
+            transport.set_write_buffer_limits(high=64 * 1024)
+
+        # All outbound traffic goes through this queue so the socket has
+        # a single writer; a client that stops draining fills it and is
+        # closed by the broadcaster instead of stalling everyone else
+        queue: asyncio.Queue = asyncio.Queue(maxsize=16)
+        self.websockets[ws] = queue
+
+        send_frame = getattr(ws, 'send_frame', None)
+
+        async def _send_loop():
+            try:
+                while True:
+                    payload = await queue.get()
+                    if send_frame is not None:
+                        await send_frame(payload, WSMsgType.TEXT)
+                    else:
+                        await ws.send_str(payload.decode('utf-8'))
+            except (ConnectionResetError, RuntimeError):
+                # Peer vanished mid-send; drop the client eagerly so
+                # broadcasts stop queueing for it (the receive loop's
+                # finally is the normal cleanup path)
+                self.websockets.pop(ws, None)
+
+        sender = asyncio.create_task(_send_loop())
+
         try:
             async for msg in ws:
-                if msg.type == WSMsgType.TEXT:
-                    # Handle client messages (ping, etc.)
-                    data = json.loads(msg.data)
-                    if data.get('type') == 'ping':
-                        await ws.send_str(json.dumps({"type": "pong"}))
-                elif msg.type == WSMsgType.ERROR:
+                if msg.type == WSMsgType.ERROR:
                     print(f'WebSocket error: {ws.exception()}')
-                    
+
         except Exception as e:
             print(f"WebSocket error: {e}")
         finally:
-            self.websockets.discard(ws)
-        
+            sender.cancel()
+            self.websockets.pop(ws, None)
+
         return ws
     
-    async def _handle_static(self, request: web.Request) -> web.Response:
-        """Handle static file serving."""
+    async def _handle_static(self, request: web.Request) -> web.StreamResponse:
+        """Handle static file serving.
+
+        FileResponse streams straight from the file (sendfile when the
+        platform supports it) instead of reading the asset into memory,
+        and handles Content-Type, Last-Modified and Range requests.
+        """
         file_path = request.match_info['path']
-        full_path = Path('assets') / file_path
-        
-        if not full_path.exists() or not full_path.is_file():
+        assets_root = Path('assets').resolve()
+        full_path = (assets_root / file_path).resolve()
+
+        # Reject paths that escape the assets directory
+        try:
+            full_path.relative_to(assets_root)
+        except ValueError:
             return web.Response(status=404)
-        
-        # Determine content type
-        content_type, _ = mimetypes.guess_type(str(full_path))
-        if not content_type:
-            content_type = 'application/octet-stream'
-        
-        async with aio_open(full_path, 'rb') as f:
-            content = await f.read()
-        
-        return web.Response(body=content, content_type=content_type)
+
+        # One stat covers both existence and the regular-file check
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            return web.Response(status=404)
+        if not stat.S_ISREG(st.st_mode):
+            return web.Response(status=404)
+
+        # An explicit Content-Type makes FileResponse skip guess_type;
+        # unknown suffixes fall back to its own detection
+        content_type = _STATIC_MIME.get(full_path.suffix.lower())
+        if content_type is not None:
+            return web.FileResponse(full_path,
+                                    headers={'Content-Type': content_type})
+        return web.FileResponse(full_path)
     
     async def _handle_health(self, request: web.Request) -> web.Response:
         """Health check endpoint."""
-        return web.json_response({
+        return _json_response({
             "status": "healthy",
             "version": __version__,
             "manifest": str(self.manifest_file),
@@ -364,7 +572,7 @@ class WhyMLServer:
     
     async def _handle_info(self, request: web.Request) -> web.Response:
         """Server information endpoint."""
-        return web.json_response({
+        return _json_response({
             "whyml_version": __version__,
             "manifest_file": str(self.manifest_file),
             "host": self.host,
@@ -378,26 +586,28 @@ class WhyMLServer:
         """Validate manifest endpoint."""
         try:
             manifest_content = await request.text()
-            
-            # Create temporary file for validation
-            import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                f.write(manifest_content)
-                temp_file = f.name
-            
+
+            # Parse in memory; validate_manifest accepts dict sources
             try:
-                is_valid, errors = await self.processor.validate_manifest(temp_file)
-                
-                return web.json_response({
-                    "valid": is_valid,
-                    "errors": errors if not is_valid else []
+                manifest = yaml.load(manifest_content, Loader=_YamlLoader)
+            except yaml.YAMLError as e:
+                return _json_response({"valid": False, "errors": [str(e)]})
+
+            if not isinstance(manifest, dict):
+                return _json_response({
+                    "valid": False,
+                    "errors": ["Manifest must be a mapping"]
                 })
-                
-            finally:
-                os.unlink(temp_file)
-                
+
+            is_valid, errors = await self.processor.validate_manifest(manifest)
+
+            return _json_response({
+                "valid": is_valid,
+                "errors": errors if not is_valid else []
+            })
+
         except Exception as e:
-            return web.json_response({
+            return _json_response({
                 "valid": False,
                 "errors": [f"Validation error: {e}"]
             }, status=400)
@@ -409,7 +619,14 @@ class WhyMLServer:
     
     def _inject_live_reload_script(self, html_content: str) -> str:
         """Inject live reload WebSocket script into HTML."""
-        script = f"""
+        # Insert script before closing body tag or at the end
+        if '</body>' in html_content:
+            return html_content.replace('</body>', self._live_reload_body_tag)
+        return html_content + self._live_reload_script
+
+    def _build_live_reload_script(self) -> str:
+        """Render the live reload script once for this host and port."""
+        return f"""
         <script>
         (function() {{
             const ws = new WebSocket('ws://{self.host}:{self.port}/ws');
@@ -426,26 +643,19 @@ class WhyMLServer:
                     window.location.reload();
                 }}, 1000);
             }};
-            
-            // Send periodic pings to keep connection alive
-            setInterval(() => {{
-                if (ws.readyState === WebSocket.OPEN) {{
-                    ws.send(JSON.stringify({{type: 'ping'}}));
-                }}
-            }}, 30000);
+
+            // Keepalive is handled by server-side WebSocket PING frames
         }})();
         </script>
         """
-        
-        # Insert script before closing body tag or at the end
-        if '</body>' in html_content:
-            return html_content.replace('</body>', f'{script}\n</body>')
-        else:
-            return html_content + script
-    
+
     def _generate_error_page(self, error_message: str) -> str:
         """Generate a styled error page."""
-        return f"""
+        return f'{self._error_page_head}{html.escape(error_message)}{self._error_page_tail}'
+
+    def _build_error_page_shell(self) -> tuple:
+        """Render the error page once, split around the message slot."""
+        page = f"""
         <!DOCTYPE html>
         <html lang="en">
         <head>
@@ -496,7 +706,7 @@ class WhyMLServer:
         <body>
             <div class="error-container">
                 <h1>🚨 WhyML Error</h1>
-                <div class="error-message">{error_message}</div>
+                <div class="error-message">\x00</div>
                 <div class="server-info">
                     WhyML Development Server v{__version__}<br>
                     Serving: {self.manifest_file}<br>
@@ -506,30 +716,64 @@ class WhyMLServer:
         </body>
         </html>
         """
-    
+        head, tail = page.split('\x00')
+        return head, tail
+
+    #: Window within which burst file changes collapse into one reload
+    _RELOAD_COALESCE_DELAY = 0.25
+
     async def _handle_file_change(self, file_path: str):
-        """Handle file system changes."""
+        """Handle file system changes.
+
+        Caches are invalidated immediately, but the broadcast is
+        deferred briefly so a multi-file save produces one reload
+        instead of one per event.
+        """
         print(f"File changed: {file_path}")
+        self._html_cache = None
+        self._convert_cache.clear()
+        self.processor.invalidate_manifest_cache()
+
+        if self._reload_scheduled:
+            return
+        self._reload_scheduled = True
+        asyncio.get_running_loop().call_later(
+            self._RELOAD_COALESCE_DELAY,
+            lambda: asyncio.ensure_future(self._flush_reload())
+        )
+
+    async def _flush_reload(self):
+        """Fire the coalesced reload broadcast."""
+        self._reload_scheduled = False
         await self._broadcast_reload()
     
     async def _broadcast_reload(self):
-        """Broadcast reload message to all connected WebSocket clients."""
+        """Broadcast reload message to all connected WebSocket clients.
+
+        Enqueues one pre-encoded message per client instead of awaiting
+        each send in turn, so broadcast latency no longer grows with the
+        slowest connection. Closed sockets are removed by their own
+        handler and sender tasks, so no per-broadcast scan is needed.
+        """
         if not self.websockets:
             return
-        
-        message = json.dumps({"type": "reload"})
-        
-        # Remove closed connections and send to active ones
-        active_sockets = set()
-        for ws in self.websockets:
-            if not ws.closed:
-                try:
-                    await ws.send_str(message)
-                    active_sockets.add(ws)
-                except Exception:
-                    pass  # Connection closed
-        
-        self.websockets = active_sockets
+
+        stale = None
+        for ws, queue in self.websockets.items():
+            try:
+                queue.put_nowait(_RELOAD_PAYLOAD)
+            except asyncio.QueueFull:
+                # Client stopped draining its queue; drop it
+                if stale is None:
+                    stale = []
+                stale.append(ws)
+
+        if stale:
+            for ws in stale:
+                self.websockets.pop(ws, None)
+                # 1013 Try Again Later: tell the peer this was load
+                # shedding, not an application error
+                asyncio.ensure_future(ws.close(code=WSCloseCode.TRY_AGAIN_LATER))
     
     def _setup_file_watching(self):
         """Set up file system watching."""
@@ -555,36 +799,66 @@ class WhyMLServer:
     async def start(self):
         """Start the development server."""
         self._start_time = time.time()
+        # Captured so the watchdog thread can schedule onto this loop
+        self._loop = asyncio.get_running_loop()
+        self._stop_event = asyncio.Event()
         
         # Setup file watching
         self._setup_file_watching()
-        
+
+        if self.trust_forwarded:
+            try:
+                from aiohttp_remotes import XForwardedRelaxed
+                await XForwardedRelaxed().setup(self.app)
+            except ImportError:
+                print("⚠️  aiohttp-remotes not installed; X-Forwarded-* headers ignored")
+
         # Create and start the web server
         runner = web.AppRunner(self.app)
         await runner.setup()
-        
-        site = web.TCPSite(runner, self.host, self.port)
+
+        if self.unix_path:
+            site = web.UnixSite(runner, self.unix_path)
+        else:
+            site = web.TCPSite(runner, self.host, self.port)
         await site.start()
-        
-        print(f"🚀 WhyML Server started at http://{self.host}:{self.port}")
+
+        if self.unix_path:
+            print(f"🚀 WhyML Server listening on unix socket {self.unix_path}")
+        else:
+            print(f"🚀 WhyML Server started at http://{self.host}:{self.port}")
         print(f"📄 Manifest: {self.manifest_file}")
         if self.watch_enabled:
             print("👀 File watching enabled")
         if self.auto_reload:
             print("🔄 Auto-reload enabled")
         
+        # Wake only on shutdown instead of polling every second; the
+        # loop can sleep idle between requests
+        handled_signals = []
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                self._loop.add_signal_handler(sig, self._stop_event.set)
+                handled_signals.append(sig)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass  # Unsupported platform or non-main thread
+
         try:
-            # Keep the server running
-            while True:
-                await asyncio.sleep(1)
-        except KeyboardInterrupt:
+            await self._stop_event.wait()
             print("\n🛑 Server stopping...")
         finally:
+            for sig in handled_signals:
+                self._loop.remove_signal_handler(sig)
             if self._observer:
                 self._observer.stop()
                 self._observer.join()
             await runner.cleanup()
 
+    def stop(self):
+        """Signal a running server to shut down."""
+        if self._stop_event is not None:
+            self._stop_event.set()
+
     async def _handle_rss_feed(self, request: web.Request) -> web.Response:
         """Handle RSS feed for file changes."""
         try:
@@ -675,6 +949,14 @@ async def serve_manifest(
 if __name__ == '__main__':
     # Allow running server directly
     import sys
-    
+
+    # Opt into uvloop's faster event loop when available, mirroring the
+    # CLI entry point; must happen before asyncio.run creates the loop
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     manifest_file = sys.argv[1] if len(sys.argv) > 1 else 'manifest.yaml'
     asyncio.run(serve_manifest(manifest_file))
@@ -0,0 +1,29 @@
+"""
+WhyML Utilities Module - Shared helpers for the top-level package
+
+Provides fast JSON serialization for manifest output, backed by orjson
+when available and falling back to the standard library.
+
+Copyright 2025 Tom Sapletta
+Licensed under the Apache License, Version 2.0
+"""
+
+from typing import Any, Optional
+
+try:
+    import orjson
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize obj to a JSON string using orjson."""
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, option=option).decode()
+
+except ImportError:
+    import json
+
+    def dumps(obj: Any, indent: Optional[int] = None) -> str:
+        """Serialize obj to a JSON string using the stdlib encoder."""
+        return json.dumps(obj, indent=indent)
+
+
+__all__ = ['dumps']